@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+import sys
+import argparse
+from tracker import open_tracker
+from config import load_config
+from content_store import ContentStoreBusy
+
+def main():
+    parser = argparse.ArgumentParser(description="Prune superseded content versions from data/content")
+    parser.add_argument("--config", help="Path to config.json (default: templates/config.json)")
+    parser.add_argument("--data-dir", help="Tracker/content directory to compact (default: the skill's data/)")
+    parser.add_argument("--keep", type=int, default=1, help="Versions to keep per item (default: 1)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be removed without deleting anything")
+    args = parser.parse_args()
+
+    if args.keep < 1:
+        print("[ERROR] --keep must be at least 1")
+        sys.exit(1)
+    try:
+        config = load_config(args.config)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    tracker = open_tracker(args.data_dir, backend=config.get("settings", {}).get("tracker_backend", "json"))
+    try:
+        stats = tracker.compact_content(keep=args.keep, dry_run=args.dry_run)
+    except ContentStoreBusy as e:
+        print(f"[ERROR] {e}; run compaction when no sweep is running.")
+        tracker.close()
+        sys.exit(1)
+    tracker.close()
+
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"{verb} {stats['versions_pruned']} superseded versions and {stats['objects_removed']} unreferenced files "
+          f"({stats['bytes_freed'] / 1024 / 1024:.1f} MB).")
+    if stats["legacy_removed"]:
+        print(f"Legacy week folders: {stats['legacy_migrated']} files migrated, {stats['legacy_removed']} removed.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+LEGACY_WEEK_DIR = re.compile(r"^\d{4}-W\d{2}$")
+
+
+class ContentStoreBusy(Exception):
+    """Another process is writing to the content store."""
+
+
+def safe_id(unique_id):
+    return unique_id.replace(":", "_").replace("/", "_")
+
+
+class ContentStore:
+    """
+    Content-addressed storage for fetched documents under data/content.
+    Each distinct text is stored once, at objects/<2 hex>/<sha256>.md, and
+    refs.json maps item ids to their versions, oldest first:
+    {"hash": ..., "modified": ..., "saved": ...}. Saving unchanged content only
+    touches the item's ref, so nothing is rewritten. compact() drops superseded
+    versions and unreferenced objects, and migrates the old per-week folders.
+
+    A process that writes holds a shared lock on .lock from its first put() until
+    close(); compact() needs it exclusively, so it can't delete objects a running
+    sweep has written but not yet flushed to refs.json.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.refs_path = self.root / "refs.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._shards = set()  # shard dirs known to exist
+        self._legacy = None  # legacy week dirs, scanned once
+        self._lock_file = None
+        self.refs = self._load()
+
+    def _load(self):
+        if self.refs_path.exists():
+            try:
+                with open(self.refs_path, "r") as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                return {}
+        return {}
+
+    def _acquire(self, exclusive=False):
+        """Takes the cross-process lock (shared for writers). Raises ContentStoreBusy when exclusive is taken."""
+        if fcntl is None:
+            return
+        if self._lock_file is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(self.root / ".lock", "a")
+        if exclusive:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise ContentStoreBusy(f"{self.root} is in use by another run")
+        else:
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+
+    def close(self):
+        """Flushes refs and releases the cross-process lock."""
+        self.flush()
+        with self._lock:
+            if self._lock_file is not None:
+                self._lock_file.close()  # releases the flock
+                self._lock_file = None
+
+    def object_path(self, digest):
+        return self.objects_dir / digest[:2] / f"{digest}.md"
+
+    def _write_object(self, digest, data):
+        path = self.object_path(digest)
+        if path.exists():
+            return path
+        if path.parent not in self._shards:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._shards.add(path.parent)
+        tmp_file = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+        return path
+
+    def put(self, unique_id, content, modified=None):
+        """Stores content as the item's current version. Returns (path, changed)."""
+        with self._lock:
+            if self._lock_file is None:
+                # May wait for a compaction to finish; its refs.json is then the one to build on
+                self._acquire()
+                self.refs = self._load()
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._write_object(digest, data)
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            versions = self.refs.setdefault(unique_id, [])
+            changed = not versions or versions[-1]["hash"] != digest
+            if changed:
+                versions.append({"hash": digest, "modified": modified, "saved": now})
+            elif modified and versions[-1].get("modified") != modified:
+                versions[-1]["modified"] = modified
+            else:
+                return path, False
+            self._dirty = True
+        return path, changed
+
+    def current_path(self, unique_id):
+        """Path of the item's latest version, or its newest legacy week file, or None."""
+        with self._lock:
+            versions = self.refs.get(unique_id)
+            digest = versions[-1]["hash"] if versions else None
+        if digest:
+            return self.object_path(digest)
+        for folder in self._legacy_dirs():
+            path = folder / f"{safe_id(unique_id)}.md"
+            if path.exists():
+                return path
+        return None
+
+    def _legacy_dirs(self):
+        """Legacy week folders, newest first; the content root is only listed once."""
+        if self._legacy is None:
+            found = []
+            if self.root.exists():
+                found = [p for p in self.root.iterdir() if p.is_dir() and LEGACY_WEEK_DIR.match(p.name)]
+            self._legacy = sorted(found, reverse=True)
+        return self._legacy
+
+    def flush(self):
+        """Writes refs.json if any ref changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = json.dumps(self.refs, indent=2)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.refs_path.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.refs_path)
+
+    def compact(self, keep=1, known_ids=None, dry_run=False):
+        """
+        Keeps the newest `keep` versions per item and deletes objects no version
+        points to. Legacy week files of known_ids become versions (oldest week
+        first) when the item has no refs yet, and are then removed; files of
+        unknown items are left alone. Returns counts of what was (or, with
+        dry_run, would be) removed. Raises ContentStoreBusy while a run is writing.
+        """
+        stats = {"legacy_migrated": 0, "legacy_removed": 0, "versions_pruned": 0, "objects_removed": 0, "bytes_freed": 0}
+        by_safe_id = {safe_id(uid): uid for uid in known_ids or ()}
+        with self._lock:
+            self._acquire(exclusive=True)
+        # Prune from what's on disk (including this process's own writes), not from refs loaded earlier
+        self.flush()
+        with self._lock:
+            self.refs = self._load()
+            self._legacy = None
+            had_refs = set(self.refs)
+
+        for folder in reversed(self._legacy_dirs()):
+            for path in sorted(folder.glob("*.md")):
+                unique_id = by_safe_id.get(path.stem)
+                if unique_id is None:
+                    continue
+                if unique_id not in had_refs:
+                    stats["legacy_migrated"] += 1
+                    if not dry_run:
+                        self.put(unique_id, path.read_text(encoding="utf-8"))
+                stats["legacy_removed"] += 1
+                stats["bytes_freed"] += path.stat().st_size
+                if not dry_run:
+                    path.unlink()
+            if not dry_run and not any(folder.iterdir()):
+                folder.rmdir()
+        self._legacy = None
+
+        with self._lock:
+            referenced = set()
+            for unique_id, versions in self.refs.items():
+                superseded = versions[:-keep] if keep > 0 else []
+                stats["versions_pruned"] += len(superseded)
+                kept = versions[len(superseded):]
+                referenced.update(v["hash"] for v in kept)
+                if superseded and not dry_run:
+                    self.refs[unique_id] = kept
+                    self._dirty = True
+
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*.md"):
+                if path.stem in referenced:
+                    continue
+                stats["objects_removed"] += 1
+                stats["bytes_freed"] += path.stat().st_size
+                if not dry_run:
+                    path.unlink()
+        if not dry_run:
+            self.flush()
+        return stats
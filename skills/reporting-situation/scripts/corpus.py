@@ -0,0 +1,116 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+CHUNK_BYTES = 64 * 1024
+BYTES_PER_TOKEN = 4  # rough estimate, same as the slicing skill
+DEFAULT_MAX_TOKENS = 500_000
+DEFAULT_MAX_ITEM_TOKENS = 25_000
+# Highest-weighted tag wins; unknown prefixes get 0.
+DEFAULT_TAG_WEIGHTS = {"Person": 3, "Team": 2, "Topic": 1, "Meeting Notes": 1}
+
+
+def est_tokens(num_bytes):
+    return (num_bytes + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def tag_weight(tags, weights):
+    return max((weights.get(t.split(":", 1)[0], 0) for t in tags), default=0)
+
+
+def _timestamp(value):
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def order_entries(entries, weights=None):
+    """Highest tag weight first, most recently modified first within a weight."""
+    weights = weights or DEFAULT_TAG_WEIGHTS
+    return sorted(entries, key=lambda e: (-tag_weight(e["tags"], weights), -_timestamp(e.get("modified"))))
+
+
+def _utf8_cut(data, limit):
+    """Largest prefix of data no longer than limit that doesn't split a UTF-8 character."""
+    if len(data) <= limit:
+        return len(data)
+    cut = limit
+    while cut > 0 and (data[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return cut
+
+
+def write_corpus(entries, out_path, header, max_tokens=DEFAULT_MAX_TOKENS, max_item_tokens=DEFAULT_MAX_ITEM_TOKENS, weights=None):
+    """
+    Streams entries into out_path and writes a sidecar <out>.index.json.
+
+    entries: dicts with id, title, tags, modified, content_path (may be missing),
+    discussion (text). Content files are copied in chunks, capped at
+    max_item_tokens per item; items that would exceed max_tokens overall are
+    left out. Index entries hold byte offsets [start, end) of each document,
+    separator included. Returns (index, stats).
+    """
+    max_bytes = max_tokens * BYTES_PER_TOKEN if max_tokens else None
+    max_item_bytes = max_item_tokens * BYTES_PER_TOKEN if max_item_tokens else None
+    out_path = Path(out_path)
+    index = []
+    stats = {"written": 0, "truncated": 0, "over_budget": 0}
+
+    with open(out_path, "wb") as out:
+        out.write(header.encode("utf-8"))
+        for entry in order_entries(entries, weights):
+            separator = f"\n\n--- DOCUMENT: {entry['title']} ({entry['id']}) ---\n\n".encode("utf-8")
+            discussion = (entry.get("discussion") or "").encode("utf-8")
+            content_path = entry.get("content_path")
+            content_size = content_path.stat().st_size if content_path and content_path.exists() else 0
+            if not content_size and not discussion:
+                continue
+
+            item_budget = content_size
+            if max_item_bytes is not None:
+                item_budget = min(item_budget, max(max_item_bytes - len(discussion), 0))
+            needed = len(separator) + min(item_budget, content_size) + len(discussion)
+            if max_bytes is not None and out.tell() + needed > max_bytes:
+                stats["over_budget"] += 1
+                continue
+
+            start = out.tell()
+            out.write(separator)
+            copied = 0
+            if content_size:
+                with open(content_path, "rb") as f:
+                    while copied < item_budget:
+                        chunk = f.read(min(CHUNK_BYTES, item_budget - copied) + 3)
+                        if not chunk:
+                            break
+                        cut = _utf8_cut(chunk, item_budget - copied)
+                        out.write(chunk[:cut])
+                        copied += cut
+                        if cut < len(chunk):
+                            f.seek(cut - len(chunk), 1)
+                        if cut == 0:
+                            break
+            truncated = copied < content_size
+            if truncated:
+                out.write(f"\n\n[... truncated {content_size - copied} bytes ...]\n".encode("utf-8"))
+                stats["truncated"] += 1
+            out.write(discussion)
+            end = out.tell()
+            stats["written"] += 1
+            index.append({
+                "id": entry["id"],
+                "title": entry["title"],
+                "start": start,
+                "end": end,
+                "tags": sorted(entry["tags"]),
+                "est_tokens": est_tokens(end - start),
+                "truncated": truncated,
+            })
+
+    index_path = out_path.with_suffix(".index.json")
+    index_path.write_text(json.dumps({"corpus": out_path.name, "bytes": out_path.stat().st_size, "documents": index}, indent=2), encoding="utf-8")
+    return index, stats
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Google, Notion and Jira MCP servers, for load tests and
+offline runs of orchestrator.py.
+
+Two ways to plug it in:
+  serve   A stdio MCP server for mcp_pool.servers, e.g.
+          "@google": {"command": "python3", "args": ["fake_mcp_server.py", "serve", "--latency-ms", "200"]}
+  mcpc    Stands in for the mcpc CLI (`mcpc --json @session tools-call tool k:=v`,
+          `mcpc @session restart`). Put a `mcpc` wrapper that runs
+          `fake_mcp_server.py mcpc "$@"` first on PATH; options come from
+          FAKE_MCP_ARGS (same flags as serve).
+
+Responses are synthetic unless --fixtures has a <tool>.json for the tool: a
+recorded `mcpc --json ... tools-call` output (or a bare payload) returned as is.
+Synthetic results are derived from a hash of (seed, tool, arguments), so the
+same call gets the same answer whatever the concurrency.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import shlex
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROTOCOL_VERSION = "2025-06-18"
+MIME_TYPES = (
+    "application/vnd.google-apps.document",
+    "application/vnd.google-apps.spreadsheet",
+    "application/vnd.google-apps.presentation",
+)
+
+
+def add_backend_args(parser):
+    parser.add_argument("--fixtures", help="Directory of recorded <tool>.json responses")
+    parser.add_argument("--results", type=int, default=10, help="Synthetic results per search (default: 10)")
+    parser.add_argument("--id-space", type=int, default=500, help="Distinct synthetic ids per provider; smaller means more overlap between searches (default: 500)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Mean latency per call (default: 0)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform +/- jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of calls that fail (default: 0)")
+    parser.add_argument("--content-bytes", type=int, default=2000, help="Size of synthetic document text (default: 2000)")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+BACKEND_OPTIONS = ("fixtures", "results", "id_space", "latency_ms", "jitter_ms", "error_rate", "content_bytes", "seed")
+
+
+def backend_argv(args):
+    """Turns parsed backend options back into command-line flags (for serve / FAKE_MCP_ARGS)."""
+    argv = []
+    for name in BACKEND_OPTIONS:
+        value = getattr(args, name)
+        if value is not None:
+            argv += [f"--{name.replace('_', '-')}", str(value)]
+    return argv
+
+
+class FakeBackend:
+    """Answers tool calls with fixtures or synthetic data; see the module docstring."""
+
+    def __init__(self, fixtures=None, results=10, id_space=500, latency_ms=0, jitter_ms=0,
+                 error_rate=0, content_bytes=2000, seed=0):
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.results = results
+        self.id_space = max(1, id_space)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.content_bytes = content_bytes
+        self.seed = seed
+        self.now = datetime.now(timezone.utc)
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(**{name: getattr(args, name) for name in BACKEND_OPTIONS})
+
+    def _rng(self, tool, arguments):
+        key = json.dumps([self.seed, tool, arguments], sort_keys=True)
+        return random.Random(hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def _recent(self, rng):
+        return (self.now - timedelta(hours=rng.uniform(1, 96))).isoformat().replace("+00:00", "Z")
+
+    def call(self, tool, arguments):
+        """Returns (ok, tools/call result). Sleeps for the configured latency first."""
+        rng = self._rng(tool, arguments)
+        delay = self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if rng.random() < self.error_rate:
+            return False, {"isError": True, "content": [{"type": "text", "text": f"injected error for {tool}"}]}
+
+        if self.fixtures and (self.fixtures / f"{tool}.json").exists():
+            with open(self.fixtures / f"{tool}.json") as f:
+                recorded = json.load(f)
+            if isinstance(recorded, dict) and ("content" in recorded or "structuredContent" in recorded):
+                return True, recorded
+            payload = recorded
+        else:
+            handler = getattr(self, "_" + tool.replace(".", "_").replace("-", "_"), None)
+            if handler is None:
+                return False, {"isError": True, "content": [{"type": "text", "text": f"unknown tool {tool}"}]}
+            payload = handler(arguments, rng)
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        return True, {"content": [{"type": "text", "text": text}]}
+
+    # Google
+
+    def _drive_search(self, arguments, rng):
+        count = min(self.results, arguments.get("pageSize", self.results))
+        files = []
+        for _ in range(count):
+            n = rng.randrange(self.id_space)
+            files.append({
+                "id": f"file{n}",
+                "name": f"Doc {n} about {arguments.get('query', '')[-40:]}",
+                "mimeType": MIME_TYPES[n % len(MIME_TYPES)],
+                "webViewLink": f"https://docs.example.com/file{n}",
+                "modifiedTime": self._recent(rng),
+            })
+        return {"files": files}
+
+    def _text(self, arguments, rng):
+        return ("Lorem ipsum dolor sit amet. " * (self.content_bytes // 28 + 1))[:self.content_bytes]
+
+    _docs_getText = _slides_getText = _sheets_getText = _text
+
+    def _comments(self, arguments, rng):
+        return {"comments": [
+            {"author": {"displayName": f"User {i}", "emailAddress": f"user{i}@example.com"},
+             "content": "Looks good", "createdTime": self._recent(rng), "resolved": False}
+            for i in range(rng.randrange(4))
+        ]}
+
+    _docs_listComments = _slides_listComments = _sheets_listComments = _comments
+
+    # Notion
+
+    def _notion_search(self, arguments, rng):
+        results = []
+        for _ in range(self.results):
+            n = rng.randrange(self.id_space)
+            results.append({
+                "id": f"page-{n}",
+                "object": "page",
+                "title": f"Page {n}",
+                "url": f"https://notion.so/page{n}",
+                "timestamp": self._recent(rng),
+                "highlight": arguments.get("query", ""),
+            })
+        return {"results": results}
+
+    def _notion_fetch(self, arguments, rng):
+        return {"text": f"<content>{self._text(arguments, rng)}</content>"}
+
+    def _notion_get_comments(self, arguments, rng):
+        return {"results": [
+            {"created_by": {"name": f"User {i}"}, "rich_text": [{"plain_text": "Agreed"}], "created_time": self._recent(rng)}
+            for i in range(rng.randrange(3))
+        ]}
+
+    def _notion_get_users(self, arguments, rng):
+        query = arguments.get("query", "")
+        return {"results": [{"id": f"user-{query}", "email": query, "name": query}]}
+
+    # Jira
+
+    def _getAccessibleAtlassianResources(self, arguments, rng):
+        return [{"id": "fake-cloud", "url": "https://fake.atlassian.net"}]
+
+    def _lookupJiraAccountId(self, arguments, rng):
+        return [{"accountId": f"acc-{arguments.get('searchString', '')}"}]
+
+    def _issue(self, key, rng, with_docs=True):
+        fields = {"summary": f"Issue {key}", "updated": self._recent(rng)}
+        if with_docs:
+            fields["description"] = self._text({}, rng)
+            fields["comment"] = {"comments": [
+                {"author": {"displayName": f"User {i}", "accountId": f"acc-{i}"}, "body": "On it", "created": self._recent(rng)}
+                for i in range(rng.randrange(3))
+            ]}
+        return {"key": key, "fields": fields}
+
+    def _searchJiraIssuesUsingJql(self, arguments, rng):
+        offset = int(arguments.get("nextPageToken") or 0)
+        page = min(int(arguments.get("maxResults", 25)), max(self.results - offset, 0))
+        with_docs = "description" in (arguments.get("fields") or [])
+        issues = [self._issue(f"FAKE-{rng.randrange(self.id_space)}", rng, with_docs) for _ in range(page)]
+        done = offset + page >= self.results
+        response = {"issues": issues, "isLast": done}
+        if not done:
+            response["nextPageToken"] = str(offset + page)
+        return response
+
+    def _getJiraIssue(self, arguments, rng):
+        return self._issue(arguments.get("issueIdOrKey", "FAKE-0"), rng)
+
+
+def serve(backend):
+    """Stdio MCP server: one thread per tools/call, so latencies overlap like a real server."""
+    write_lock = threading.Lock()
+
+    def send(message):
+        with write_lock:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+    def handle_call(req_id, params):
+        _, result = backend.call(params.get("name", ""), params.get("arguments") or {})
+        send({"jsonrpc": "2.0", "id": req_id, "result": result})
+
+    for line in sys.stdin:
+        try:
+            msg = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        method, req_id = msg.get("method"), msg.get("id")
+        if req_id is None:
+            continue  # notifications
+        if method == "initialize":
+            send({"jsonrpc": "2.0", "id": req_id, "result": {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake-mcp", "version": "0.1.0"},
+            }})
+        elif method == "tools/call":
+            threading.Thread(target=handle_call, args=(req_id, msg.get("params") or {}), daemon=True).start()
+        elif method == "ping":
+            send({"jsonrpc": "2.0", "id": req_id, "result": {}})
+        else:
+            send({"jsonrpc": "2.0", "id": req_id, "error": {"code": -32601, "message": "Method not found"}})
+
+
+def run_mcpc(argv, backend):
+    """Handles one mcpc CLI invocation; returns the exit code."""
+    argv = [a for a in argv if a != "--json"]
+    if len(argv) >= 2 and argv[1] in ("restart", "ping"):
+        return 0
+    if len(argv) < 3 or argv[1] != "tools-call":
+        print(f"fake mcpc: unsupported command {' '.join(argv)}", file=sys.stderr)
+        return 2
+    arguments = {}
+    for pair in argv[3:]:
+        key, _, value = pair.partition(":=")
+        try:
+            arguments[key] = json.loads(value)
+        except json.JSONDecodeError:
+            arguments[key] = value
+    ok, result = backend.call(argv[2], arguments)
+    if not ok:
+        print(result["content"][0]["text"], file=sys.stderr)
+        return 1
+    print(json.dumps(result))
+    return 0
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "mcpc":
+        parser = argparse.ArgumentParser(prog="fake mcpc")
+        add_backend_args(parser)
+        options = parser.parse_args(shlex.split(os.environ.get("FAKE_MCP_ARGS", "")))
+        sys.exit(run_mcpc(sys.argv[2:], FakeBackend.from_args(options)))
+
+    parser = argparse.ArgumentParser(description="Fake MCP server for load tests (see module docstring)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add_backend_args(sub.add_parser("serve", help="Speak MCP over stdio"))
+    sub.add_parser("mcpc", help="Act as the mcpc CLI (options via FAKE_MCP_ARGS)")
+    args = parser.parse_args()
+    serve(FakeBackend.from_args(args))
+
+
+if __name__ == "__main__":
+    main()
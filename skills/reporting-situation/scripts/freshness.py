@@ -0,0 +1,109 @@
+import threading
+from datetime import datetime, timezone
+
+# Per-provider change-detection policy.
+#   max_age_hours: refetch content after this long even if the remote modified time is unchanged
+#   fallback_hours: refetch interval when the search metadata has no modified time
+#   comments_follow_modified: the remote modified time also moves when comments are added
+#     (Jira's `updated` does; Drive's modifiedTime and Notion's last_edited_time do not)
+#   comment_hours: refetch interval for comments that don't follow the modified time
+DEFAULT_POLICY = {
+    "max_age_hours": 168,
+    "fallback_hours": 24,
+    "comments_follow_modified": False,
+    "comment_hours": 24,
+}
+
+PROVIDER_POLICIES = {
+    "google": {},
+    "notion": {},
+    "jira": {"comments_follow_modified": True, "comment_hours": 72},
+}
+
+
+class ChangeDetector:
+    """
+    Decides whether an item's content and comments need refetching, based on the
+    modified time in its search metadata and the tracker's last fetch times.
+    Policies can be overridden per provider via config["freshness"][provider].
+    Counts fetched/skipped decisions per provider for the end-of-run report.
+    """
+
+    def __init__(self, tracker, overrides=None):
+        self.tracker = tracker
+        self.overrides = overrides or {}
+        self._lock = threading.Lock()
+        self.stats = {}  # provider -> {"content": [fetched, skipped], "comments": [fetched, skipped]}
+
+    def policy(self, provider_name):
+        policy = dict(DEFAULT_POLICY)
+        policy.update(PROVIDER_POLICIES.get(provider_name, {}))
+        policy.update(self.overrides.get(provider_name, {}))
+        return policy
+
+    def _count(self, provider_name, kind, fetch):
+        with self._lock:
+            counts = self.stats.setdefault(provider_name, {"content": [0, 0], "comments": [0, 0]})
+            counts[kind][0 if fetch else 1] += 1
+        return fetch
+
+    def remote_modified(self, unique_id, provider):
+        return provider.get_modified_time(self.tracker.get_metadata(unique_id))
+
+    def should_fetch_content(self, unique_id, provider):
+        policy = self.policy(provider.name)
+        remote = self.remote_modified(unique_id, provider)
+        hours = policy["max_age_hours"] if remote else policy["fallback_hours"]
+        fetch = self.tracker.is_stale(unique_id, remote, hours=hours)
+        return self._count(provider.name, "content", fetch)
+
+    def should_fetch_comments(self, unique_id, provider):
+        policy = self.policy(provider.name)
+        if policy["comments_follow_modified"]:
+            remote = self.remote_modified(unique_id, provider)
+            hours = policy["comment_hours"] if remote else policy["fallback_hours"]
+        else:
+            remote, hours = None, policy["comment_hours"]
+        fetch = self.tracker.is_stale(unique_id, remote, hours=hours, fetch_field="last_comment_fetch")
+        return self._count(provider.name, "comments", fetch)
+
+    def report(self):
+        """One line per provider: skipped/total for content and comments."""
+        lines = []
+        for provider_name, counts in sorted(self.stats.items()):
+            parts = []
+            for kind in ("content", "comments"):
+                fetched, skipped = counts[kind]
+                total = fetched + skipped
+                rate = (skipped / total * 100) if total else 0
+                parts.append(f"{kind} {skipped}/{total} skipped ({rate:.0f}%)")
+            lines.append(f"{provider_name}: " + ", ".join(parts))
+        return lines
+
+
+def _parse_time(value):
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def change_since(item, provider, since, is_new=False, metadata=None):
+    """
+    Why an item belongs in an incremental run's delta, or None if it doesn't:
+    "new" (first seen this run), "updated" (remote modified, per `metadata`,
+    after the item's own last content fetch), or "pending" (content never
+    fetched). Everything counts as new on a first run (no `since`). Per-item
+    fetch times rather than `since` catch edits made during the previous run
+    and items its deadline cut off.
+    """
+    if is_new or since is None:
+        return "new"
+    last_fetch = _parse_time(item.get("last_content_fetch"))
+    if not last_fetch:
+        return "pending"
+    remote = _parse_time(provider.get_modified_time(metadata))
+    if remote and remote > last_fetch:
+        return "updated"
+    return None
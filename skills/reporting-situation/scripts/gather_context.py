@@ -4,87 +4,150 @@ from pathlib import Path
 import argparse
 import json
 
+from threading import Lock
+
 from config import load_config
+from tracker import open_tracker
 from providers.base import run_mcpc
+from providers.identity import IdentityCache
+from providers.jira import site_scope
+from scheduler import PipelineScheduler, STAGE_SEARCH
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--config", help="Path to config.json")
-    parser.add_argument("--interests", help="Deprecated: Path to interests.json")
-    args = parser.parse_args()
+def merge_results(responses):
+    """Merges notion-search responses into one {"results": [...]}, first occurrence of each id wins."""
+    merged = {}
+    for resp in responses:
+        items = resp.get("results", []) if isinstance(resp, dict) else resp
+        for item in items or []:
+            if isinstance(item, dict):
+                merged.setdefault(item.get("id") or json.dumps(item, sort_keys=True), item)
+    return {"results": list(merged.values())}
 
-    config = {}
-    if args.interests:
-        print("[WARN] --interests is deprecated. Use templates/config.json instead.", file=sys.stderr)
-        interests_path = Path(args.interests)
-        if interests_path.exists():
-            with open(interests_path) as f:
-                config = json.load(f)
-        else:
-            print(f"Config file not found: {interests_path}", file=sys.stderr)
-    else:
-        try:
-            config = load_config(args.config)
-        except FileNotFoundError as e:
-            print(f"[ERROR] {e}", file=sys.stderr)
-            config = {}
-    
+def gather(config, max_workers=10, provider_limits=None, budget_seconds=60, identity=None):
+    """
+    Runs the Calendar, Gmail, Notion and Jira calls concurrently and returns
+    whatever finished within budget_seconds. Notion gets one query per keyword
+    (notion-search is semantic, so keywords don't combine), merged by page id;
+    Jira gets all projects in one JQL query. The Jira cloud id comes from
+    config, then `identity` (an IdentityCache shared with orchestrator.py).
+    """
     report_data = {}
+    notion_responses = {}
+    lock = Lock()
+    scheduler = PipelineScheduler(max_workers, provider_limits, deadline_seconds=budget_seconds, grace_seconds=0)
+
+    def fetch(key, session, tool, tool_args):
+        resp = run_mcpc(session, tool, tool_args)
+        if resp:
+            with lock:
+                report_data[key] = resp
+
+    def submit(provider, func, *func_args):
+        scheduler.submit(0, STAGE_SEARCH, provider, "context", func, *func_args)
 
     # 1. Google Calendar
     if config.get("google_calendar", True):
         print("Fetching Calendar events...", file=sys.stderr)
-        # Using @google-workspace as a likely session name if @google isn't found, 
-        # but sticking to user request of "google". I'll try @google.
-        events = run_mcpc("@google", "calendar.listEvents", {"calendarId": "primary"})
-        if events:
-            report_data["calendar"] = events
+        submit("google", fetch, "calendar", "@google", "calendar.listEvents", {"calendarId": "primary"})
 
     # 2. Gmail
     q = config.get("google_gmail_query", "is:unread")
     if q:
         print(f"Searching Gmail: {q}...", file=sys.stderr)
-        emails = run_mcpc("@google", "gmail.search", {"query": q, "maxResults": 5})
-        if emails:
-            report_data["gmail"] = emails
+        submit("google", fetch, "gmail", "@google", "gmail.search", {"query": q, "maxResults": 5})
 
-    # 3. Notion
+    # 3. Notion: every keyword (topics share some, so dedupe first)
     keywords = config.get("keywords", [])
     if not keywords and config.get("topics"):
         keywords = [kw for t in config.get("topics", []) for kw in t.get("keywords", [])]
+    seen = set()
+    keywords = [kw for kw in keywords if not (kw.lower() in seen or seen.add(kw.lower()))]
     if keywords:
-        print(f"Searching Notion for {keywords[0] if keywords else '...'}...", file=sys.stderr)
-        # We only search for the first keyword to avoid spamming in this MVP
-        if len(keywords) > 0:
-            kw = keywords[0]
-            notion_results = run_mcpc("@notion", "notion-search", {"query": kw})
-            if notion_results:
-                report_data["notion"] = notion_results
+        print(f"Searching Notion for {len(keywords)} keywords...", file=sys.stderr)
+
+        def search_notion(kw):
+            resp = run_mcpc("@notion", "notion-search", {"query": kw})
+            if resp:
+                with lock:
+                    notion_responses[kw] = resp
+
+        for kw in keywords:
+            submit("notion", search_notion, kw)
 
     # 4. Jira
     projects = config.get("jira_projects", [])
     if not projects and config.get("teams"):
         projects = [t.get("jira_project") for t in config.get("teams", []) if t.get("jira_project")]
     if projects:
-        jira_cloud_id = (
-            config.get("providers", {})
-            .get("jira", {})
-            .get("cloud_id")
-        )
-        if not jira_cloud_id:
-            resources = run_mcpc("@jira", "getAccessibleAtlassianResources", {})
-            if isinstance(resources, list) and resources:
-                jira_cloud_id = resources[0].get("id")
-        if not jira_cloud_id:
-            print("[ERROR] Jira cloudId missing; skipping Jira search.", file=sys.stderr)
-        else:
+        def search_jira():
+            jira_config = config.get("providers", {}).get("jira", {})
+            jira_cloud_id = jira_config.get("cloud_id")
+            jira_scope = site_scope(jira_cloud_id, jira_config.get("base_url"))
+            if not jira_cloud_id and identity is not None:
+                found, site = identity.get("jira", f"{jira_scope}:cloud")
+                if found and site:
+                    jira_cloud_id = site["id"]
+            if not jira_cloud_id:
+                resources = run_mcpc("@jira", "getAccessibleAtlassianResources", {})
+                if isinstance(resources, list) and resources:
+                    jira_cloud_id = resources[0].get("id")
+                    if identity is not None:
+                        identity.set("jira", f"{jira_scope}:cloud", {"id": jira_cloud_id, "url": (resources[0].get("url") or "").rstrip("/")})
+            if not jira_cloud_id:
+                print("[ERROR] Jira cloudId missing; skipping Jira search.", file=sys.stderr)
+                return
             # Construct JQL
             jql = f"project in ({','.join(projects)}) AND status not in (Closed, Done) ORDER BY updated DESC"
             print(f"Searching Jira: {jql}...", file=sys.stderr)
-            jira_args = {"jql": jql, "cloudId": jira_cloud_id}
-            jira_results = run_mcpc("@jira", "searchJiraIssuesUsingJql", jira_args)
-            if jira_results:
-                report_data["jira"] = jira_results
+            fetch("jira", "@jira", "searchJiraIssuesUsingJql", {"jql": jql, "cloudId": jira_cloud_id})
+
+        submit("jira", search_jira)
+
+    finished = scheduler.run()
+    dropped = sum(counts["dropped"] for counts in scheduler.stats.values())
+    if dropped or not finished:
+        print(f"[WARN] Time budget of {budget_seconds}s reached; {dropped} calls skipped, output is partial.", file=sys.stderr)
+
+    with lock:
+        if notion_responses:
+            report_data["notion"] = merge_results(notion_responses[kw] for kw in keywords if kw in notion_responses)
+        return {key: report_data[key] for key in ("calendar", "gmail", "notion", "jira") if key in report_data}
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", help="Path to config.json")
+    parser.add_argument("--interests", help="Deprecated: Path to interests.json")
+    parser.add_argument("--data-dir", help="Tracker directory holding the identity cache (default: the skill's data/)")
+    parser.add_argument("--budget", type=float, help="Seconds to wait for all calls before printing what arrived (default: settings.gather_budget_seconds, else 60)")
+    args = parser.parse_args()
+
+    config = {}
+    if args.interests:
+        print("[WARN] --interests is deprecated. Use templates/config.json instead.", file=sys.stderr)
+        interests_path = Path(args.interests)
+        if interests_path.exists():
+            with open(interests_path) as f:
+                config = json.load(f)
+        else:
+            print(f"Config file not found: {interests_path}", file=sys.stderr)
+    else:
+        try:
+            config = load_config(args.config)
+        except FileNotFoundError as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            config = {}
+    
+    settings = config.get("settings", {})
+    budget = args.budget if args.budget is not None else settings.get("gather_budget_seconds", 60)
+    tracker = open_tracker(args.data_dir, backend=settings.get("tracker_backend", "json"))
+    report_data = gather(
+        config,
+        max_workers=settings.get("max_workers", 10),
+        provider_limits=settings.get("provider_concurrency"),
+        budget_seconds=budget,
+        identity=IdentityCache.from_settings(tracker, settings),
+    )
+    tracker.close()
 
     # Output aggregated data
     print(json.dumps(report_data, indent=2))
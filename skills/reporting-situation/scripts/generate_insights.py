@@ -78,6 +78,10 @@ def main():
     ]
     if prefer_headings:
         cmd.append("--prefer-headings")
+    # The orchestrator's sidecar index gives exact document boundaries
+    index_path = corpus_path.with_suffix(".index.json")
+    if index_path.exists():
+        cmd.extend(["--doc-index", str(index_path)])
 
     print(f">>> Launching Slice Runner (Run ID: {run_id})...")
     print(" ".join(cmd))
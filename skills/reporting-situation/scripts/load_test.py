@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import os
+import re
+import sys
+import json
+import shlex
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from config import load_config
+from fake_mcp_server import add_backend_args, backend_argv
+
+SCRIPTS_DIR = Path(__file__).parent
+SESSIONS = ("@google", "@notion", "@jira")
+
+def write_run_config(base_config, workers, transport, server_argv, path):
+    config = json.loads(json.dumps(base_config))
+    settings = config.setdefault("settings", {})
+    settings["max_workers"] = workers
+    settings.pop("deadline_minutes", None)
+    servers = {}
+    if transport == "pool":
+        servers = {s: {"command": sys.executable, "args": [str(SCRIPTS_DIR / "fake_mcp_server.py"), "serve", *server_argv]} for s in SESSIONS}
+    config["mcp_pool"] = {"sessions_per_server": max(2, workers), "timeout_seconds": 120, "servers": servers}
+    path.write_text(json.dumps(config, indent=2))
+
+def write_mcpc_shim(bin_dir):
+    """`mcpc` on PATH that runs the fake server's CLI mode (also answers the restart checks)."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    shim = bin_dir / "mcpc"
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{SCRIPTS_DIR / "fake_mcp_server.py"}" mcpc "$@"\n')
+    shim.chmod(0o755)
+
+def count(pattern, output):
+    match = re.search(pattern, output)
+    return int(match.group(1)) if match else 0
+
+def run_sweep(base_config, workers, args, server_argv):
+    with tempfile.TemporaryDirectory(prefix="sitrep-load-") as tmp:
+        tmp = Path(tmp)
+        config_path = tmp / "config.json"
+        write_run_config(base_config, workers, args.transport, server_argv, config_path)
+        write_mcpc_shim(tmp / "bin")
+        env = dict(os.environ)
+        env["PATH"] = f"{tmp / 'bin'}{os.pathsep}{env.get('PATH', '')}"
+        env["FAKE_MCP_ARGS"] = shlex.join(server_argv)
+        cmd = [
+            sys.executable, str(SCRIPTS_DIR / "orchestrator.py"),
+            "--config", str(config_path), "--data-dir", str(tmp / "data"),
+            "--days", str(args.days), "--max-cache-age", "0",
+        ]
+        start = time.monotonic()
+        res = subprocess.run(cmd, cwd=tmp, env=env, capture_output=True, text=True)
+        elapsed = time.monotonic() - start
+    if res.returncode != 0:
+        print(f"[ERROR] Sweep with {workers} workers failed:\n{res.stderr.strip()[-2000:]}")
+        return None
+    output = res.stdout
+    return {
+        "workers": workers,
+        "items": count(r"Found (\d+) items", output),
+        "searches": count(r"search: (\d+) done", output),
+        "processed": count(r"process: (\d+) done", output),
+        "errors": len(re.findall(r"\[(?:WARN|ERROR)\]", output + res.stderr)),
+        "seconds": elapsed,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep throughput vs max_workers against the fake MCP server")
+    parser.add_argument("--config", help="Base config.json (default: templates/config.json); collaborators/topics/teams set the workload")
+    parser.add_argument("--workers", default="1,2,4,8,16", help="Comma-separated max_workers values (default: 1,2,4,8,16)")
+    parser.add_argument("--transport", choices=("pool", "mcpc"), default="pool", help="Pooled stdio sessions, or one fake mcpc process per call")
+    parser.add_argument("--days", type=int, default=7)
+    add_backend_args(parser)
+    args = parser.parse_args()
+
+    try:
+        base_config = load_config(args.config)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    server_argv = backend_argv(args)
+    print(f"Fake MCP: {' '.join(server_argv)} ({args.transport})")
+    print(f"{'workers':>7} {'items':>6} {'searches':>8} {'processed':>9} {'errors':>6} {'seconds':>8} {'items/s':>8}")
+    for workers in [int(w) for w in args.workers.split(",") if w.strip()]:
+        stats = run_sweep(base_config, workers, args, server_argv)
+        if stats is None:
+            continue
+        rate = stats["processed"] / stats["seconds"] if stats["seconds"] else 0
+        print(f"{workers:>7} {stats['items']:>6} {stats['searches']:>8} {stats['processed']:>9} "
+              f"{stats['errors']:>6} {stats['seconds']:>8.1f} {rate:>8.1f}", flush=True)
+
+if __name__ == "__main__":
+    main()
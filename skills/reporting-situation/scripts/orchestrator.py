@@ -2,29 +2,86 @@
 import sys
 import argparse
 import subprocess
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
-from tracker import Tracker
+from tracker import open_tracker
+from sweep import SweepResults
+from search_cache import SearchCache
+from freshness import ChangeDetector, change_since
+from corpus import write_corpus, DEFAULT_MAX_TOKENS, DEFAULT_MAX_ITEM_TOKENS
+from scheduler import PipelineScheduler, PRIORITY_COLLABORATOR, PRIORITY_TEAM, PRIORITY_TOPIC, STAGE_SEARCH, STAGE_PROCESS
 from config import load_config
 from providers.registry import build_provider_registry
+from providers.base import set_mcp_pool, set_raw_store, set_identity_cache
+from providers.identity import IdentityCache
+from providers.hit import RawStore
+from providers.guard import configure_sessions, health_report
+from providers.mcp_pool import McpPool, McpPoolError
 
-def restart_session(session_name):
-    print(f"Restarting {session_name}...", end=" ", flush=True)
+def run_mcpc_command(session_name, command, timeout):
+    """Runs `mcpc <session> <command>`. Returns (ok, error message)."""
     try:
-        # mcpc @session restart
-        res = subprocess.run(["mcpc", session_name, "restart"], capture_output=True, text=True)
-        if res.returncode == 0:
-            print("OK")
-            return True
-        else:
-            print("FAIL")
-            print(f"[ERROR] Could not restart {session_name}: {res.stderr.strip()}")
-            return False
+        res = subprocess.run(["mcpc", session_name, command], capture_output=True, text=True, timeout=timeout)
     except FileNotFoundError:
-        print("FAIL (mcpc not found)")
-        return False
+        return False, "mcpc not found"
+    except subprocess.TimeoutExpired:
+        return False, f"{command} timed out after {timeout}s"
+    if res.returncode != 0:
+        return False, res.stderr.strip() or f"{command} exited with {res.returncode}"
+    return True, ""
+
+def probe_session(session_name, pool, timeout):
+    """Pings a session; pooled sessions are started (warmed up) by the ping."""
+    if pool is not None and pool.handles(session_name):
+        try:
+            pool.ping(session_name, timeout=timeout)
+            return True, ""
+        except McpPoolError as e:
+            return False, str(e)
+    return run_mcpc_command(session_name, "ping", timeout)
+
+def restart_session(session_name, pool, timeout):
+    if pool is not None and pool.handles(session_name):
+        pool.reset(session_name)
+        return True, ""
+    return run_mcpc_command(session_name, "restart", timeout)
+
+def warm_up_session(session_name, pool, timeout):
+    """Probe, and only if that fails restart and probe again. Returns (status, detail)."""
+    ok, error = probe_session(session_name, pool, timeout)
+    if ok:
+        return "ok", ""
+    restarted, restart_error = restart_session(session_name, pool, timeout)
+    if not restarted:
+        return "degraded", f"{error}; restart failed: {restart_error}"
+    ok, error = probe_session(session_name, pool, timeout)
+    return ("restarted", "") if ok else ("degraded", error)
+
+def check_sessions(session_names, pool=None, timeout=15):
+    """
+    Warms up all sessions concurrently. Returns {session: (status, detail)} with
+    status "ok", "restarted" or "degraded"; sessions with no answer in time
+    (probe + restart + probe) are degraded.
+    """
+    results = {}
+    lock = Lock()
+
+    def worker(name):
+        status = warm_up_session(name, pool, timeout)
+        with lock:
+            results[name] = status
+
+    threads = [threading.Thread(target=worker, args=(name,), name=f"warmup-{name}", daemon=True) for name in session_names]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 3 * timeout
+    for t in threads:
+        t.join(timeout=max(deadline - time.monotonic(), 0))
+    with lock:
+        return {name: results.get(name, ("degraded", f"no answer within {3 * timeout}s")) for name in session_names}
 
 def generate_simple_summary(text):
     if not text:
@@ -60,30 +117,32 @@ def generate_discussion_summary(comments, target_emails=None):
             
     return summary
 
-def process_item(unique_id, provider, tracker, item_tags, target_emails):
+def process_item(unique_id, provider, tracker, item_tags, target_emails, detector=None):
     print(f"Processing {unique_id}...", flush=True) 
     try:
         # Cleanup legacy attendance tags from cached summaries
-        item = tracker.get_item(unique_id)
+        item = tracker.get_summary(unique_id)
+        metadata = tracker.get_metadata(unique_id)
         current_summary = item.get("summary", "")
         if current_summary and "[Attendance:" in current_summary:
             import re
             new_summary = re.sub(r'\[Attendance:.*?\]\s*', '', current_summary)
             tracker.update_summary(unique_id, new_summary)
 
-        # Only fetch content if we don't have a summary or it's stale
-        # We ALWAYS fetch comments to check for target user activity
+        # Only fetch content/comments that changed remotely (or aged past the
+        # provider's freshness policy); without a detector, use the 24h age check.
         
         content = None
         # Check if we should refresh content
-        if tracker.should_refresh_content(unique_id):
-                content = provider.get_content(unique_id)
+        if detector is not None:
+            refresh = detector.should_fetch_content(unique_id, provider)
+        else:
+            refresh = tracker.should_refresh_content(unique_id)
+        if refresh:
+                content = provider.get_content(unique_id, metadata=metadata)
                 if content:
                     # Extract timestamp for folder organization
-                    mod_time = None
-                    if "raw_metadata" in item:
-                        meta = item["raw_metadata"]
-                        mod_time = provider.get_modified_time(meta)
+                    mod_time = provider.get_modified_time(metadata) if metadata else None
                     
                     tracker.save_content(unique_id, content, mod_time)
                     
@@ -91,22 +150,67 @@ def process_item(unique_id, provider, tracker, item_tags, target_emails):
                     tracker.update_summary(unique_id, summary)
                     tracker.touch_content_fetch(unique_id)
         
-        if hasattr(provider, "get_comments"):
-            # Always fetch comments to catch new activity from our targets
-            comments = provider.get_comments(unique_id)
+        if hasattr(provider, "get_comments") and (detector is None or detector.should_fetch_comments(unique_id, provider)):
+            comments = provider.get_comments(unique_id, metadata=metadata)
             if comments:
                 disc_summary = generate_discussion_summary(comments, target_emails)
                 tracker.update_discussion_summary(unique_id, disc_summary)
+            # Record a successful check even with no comments, so it isn't repeated every run;
+            # None means the fetch failed, so try again next run
+            if comments is not None:
                 tracker.touch_comment_fetch(unique_id)
     except Exception as e:
         print(f"  [ERROR] Failed to process {unique_id}: {e}")
 
-def run_search_task(search_func, args, tag, lock, handle_results_callback):
-    """Executes a search and safely handles results."""
+def build_changes_section(delta, tracker, last_run):
+    """Markdown list of the items an incremental run processed, grouped by reason."""
+    lines = [f"## What changed since last report ({last_run or 'first run'})\n"]
+    if not delta:
+        lines.append("No new or updated items.\n")
+    for reason, label in (("new", "New"), ("updated", "Updated"), ("pending", "Previously unfetched")):
+        ids = [uid for uid, r in delta.items() if r == reason]
+        if not ids:
+            continue
+        lines.append(f"\n### {label} ({len(ids)})\n")
+        for uid in ids:
+            item = tracker.get_summary(uid) or {}
+            lines.append(f"- {item.get('title', 'Untitled')} ({uid})\n")
+    return "".join(lines) + "\n"
+
+def tag_priority(tag):
+    if tag.startswith("Person:"):
+        return PRIORITY_COLLABORATOR
+    if tag.startswith("Team:"):
+        return PRIORITY_TEAM
+    return PRIORITY_TOPIC
+
+def run_search_task(search_func, args, tag, lock, handle_results_callback, cache=None):
+    """
+    Executes a search (through the search cache if given) and safely handles results.
+    For batched searches `tag` is a dict: the search returns {key: results} and
+    each key's results are recorded under tag[key].
+    """
     try:
         # print(f"DEBUG: Running search for {tag}...", flush=True)
-        results = search_func(*args)
-        if results:
+        if cache is not None:
+            results = cache.call(search_func, args)
+        else:
+            results = search_func(*args)
+        if results and isinstance(tag, dict):
+            # Several keys can share a tag (keywords of one topic): record each hit once per tag.
+            # Keys match case-insensitively, as cached results keep the casing they were stored with.
+            tag_by_key = {key.lower(): t for key, t in tag.items()}
+            by_tag = {}
+            for key, key_results in results.items():
+                if key.lower() in tag_by_key:
+                    merged = by_tag.setdefault(tag_by_key[key.lower()], {})
+                    for res in key_results:
+                        merged.setdefault(res.id, res)
+            with lock:
+                for t, merged in by_tag.items():
+                    if merged:
+                        handle_results_callback(list(merged.values()), t)
+        elif results:
             with lock:
                 handle_results_callback(results, tag)
     except Exception as e:
@@ -116,15 +220,13 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", help="Path to config.json")
     parser.add_argument("--days", type=int, default=7, help="Days to look back")
+    parser.add_argument("--data-dir", help="Tracker/content/cache directory (default: the skill's data/)")
+    parser.add_argument("--deadline", type=float, help="Stop scheduling new searches/fetches after this many minutes and report what was gathered (default: settings.deadline_minutes, else none)")
+    parser.add_argument("--incremental", action="store_true", help="Only process items that are new or changed since the last run; the corpus gets a 'what changed' section")
+    parser.add_argument("--keep-raw", action="store_true", help="Also save the raw API objects behind this run's search results to data/raw_search_results.json")
+    parser.add_argument("--max-cache-age", type=float, default=0, help="Reuse cached search results up to this many hours old (default 0: off). Cached modified times can be that stale, so changes made since then are missed")
     args = parser.parse_args()
 
-    # 0. Fail-fast Session Check
-    sessions = ["@google", "@notion", "@jira"]
-    for s in sessions:
-        if not restart_session(s):
-            print("Aborting due to provider failure.")
-            sys.exit(1)
-
     try:
         config = load_config(args.config)
     except FileNotFoundError as e:
@@ -137,165 +239,225 @@ def main():
         if c.get("email"):
             target_emails.add(c["email"])
             
-    tracker = Tracker()
+    settings = config.get("settings", {})
+    tracker = open_tracker(args.data_dir, backend=settings.get("tracker_backend", "json"))
+    # Workers mutate the tracker concurrently; flush batches periodically so an
+    # interrupted run keeps its progress.
+    tracker.start_background_writer(interval=settings.get("tracker_flush_seconds", 10))
+    search_cache = SearchCache(tracker.data_dir, max_age_hours=args.max_cache_age)
     
     providers = build_provider_registry(config)
+    configure_sessions(config.get("session_limits"))
+    # Cloud ids and user lookups persist across runs in the tracker's mappings
+    identity = IdentityCache.from_settings(tracker, settings)
+    set_identity_cache(identity)
+    print(f"Identity cache: {len(identity.entries)} entries loaded")
+    mcp_pool = McpPool.from_config(config)
+    if mcp_pool:
+        print(f"Using pooled MCP sessions for: {', '.join(sorted(mcp_pool.servers))}")
+        set_mcp_pool(mcp_pool)
+    # Probe all sessions at once; restart only unhealthy ones, and run without
+    # the providers that still don't answer.
+    session_status = check_sessions(
+        sorted({p.session for p in providers.values()}),
+        mcp_pool,
+        timeout=settings.get("health_check_timeout_seconds", 15),
+    )
+    for session_name, (status, detail) in session_status.items():
+        print(f"Session {session_name}: {status}" + (f" ({detail})" if detail else ""))
+    degraded = {key for key, p in providers.items() if session_status[p.session][0] == "degraded"}
+    if degraded == set(providers):
+        print("[ERROR] No MCP session is available. Aborting.")
+        if mcp_pool:
+            mcp_pool.close()
+        tracker.close()
+        sys.exit(1)
+    if degraded:
+        print(f"[WARN] Degraded providers skipped this run: {', '.join(sorted(degraded))}")
+
+    # Raw API objects stay out of the search hits; keep them aside only when asked
+    raw_store = RawStore() if args.keep_raw else None
+    set_raw_store(raw_store)
     
-    item_tags = {}
-    items_to_process = [] 
+    # Previous run time, for the changes section header (save() overwrites last_run)
+    last_run = tracker.data.get("last_run")
+    delta = {}  # unique_id -> "new" | "updated" | "pending"
+    if args.incremental:
+        print(f"Incremental mode: processing items new or changed since {last_run or 'the beginning'}")
 
-    # 'items_to_process' is populated by 'handle_results' during the search sweep.
+    # Populated by 'handle_results' during the search sweep.
+    sweep = SweepResults()
+    detector = ChangeDetector(tracker, config.get("freshness"))
+    max_workers = settings.get("max_workers", 10)
+    deadline_minutes = args.deadline if args.deadline is not None else settings.get("deadline_minutes")
+    scheduler = PipelineScheduler(
+        max_workers=max_workers,
+        provider_limits=settings.get("provider_concurrency"),
+        deadline_seconds=deadline_minutes * 60 if deadline_minutes else None,
+    )
 
     def handle_results(results, tag):
         count = 0
         for res in results:
-            is_new, item = tracker.update_item(res["id"], res["type"], res["title"], res["url"], res["metadata"])
-            
-            if res["id"] not in item_tags:
-                item_tags[res["id"]] = set()
-            item_tags[res["id"]].add(tag)
-            
-            provider_key = res.get("provider")
-            if not provider_key and res.get("id"):
-                provider_key = res["id"].split(":", 1)[0]
-            if provider_key in providers:
-                # Dedupe in list
-                item_tuple = (res["id"], providers[provider_key])
-                # Check if tuple is already in items_to_process
-                if item_tuple not in items_to_process:
-                     items_to_process.append(item_tuple)
-                
-                count += 1
+            provider_key = res.provider or res.id.split(":", 1)[0]
+            if provider_key not in providers:
+                continue
+            metadata = res.metadata()
+            is_new, item = tracker.update_item(res.id, res.type, res.title, res.url, metadata)
+            tracker.tag_item(res.id, tag)
+            if sweep.add(res.id, providers[provider_key], tag):
+                if args.incremental:
+                    reason = change_since(item, providers[provider_key], last_run, is_new, metadata)
+                    if reason is None:
+                        continue
+                    delta[res.id] = reason
+                # Stream new items straight into content processing
+                scheduler.submit(
+                    tag_priority(tag), STAGE_PROCESS, provider_key, "process",
+                    process_item, res.id, providers[provider_key], tracker, sweep.item_tags, target_emails, detector
+                )
+            count += 1
         return count
 
-    print("\n>>> Starting Situation Report Sweep (Parallel)...")
+    print("\n>>> Starting Situation Report Sweep (Pipelined)...")
     
     search_tasks = []
 
     # 1. Collaborators
+    jira_handle_tags = {}
     for collab in config.get("collaborators", []):
         tag = f"Person: {collab.get('name')}"
         email = collab.get("email")
         handle = collab.get("handle")
         
         if email:
-            search_tasks.append((providers["google"].search_collab_activity, (email, args.days), tag))
-            search_tasks.append((providers["notion"].search_collab_activity, (email, args.days), tag))
+            search_tasks.append(("google", providers["google"].search_collab_activity, (email, args.days), tag))
+            search_tasks.append(("notion", providers["notion"].search_collab_activity, (email, args.days), tag))
         if handle:
-            search_tasks.append((providers["jira"].search_collab_activity, (handle, args.days), tag))
+            jira_handle_tags[handle] = tag
+
+    # Jira: all collaborators in batched, paged queries, fanned back out per person
+    if jira_handle_tags:
+        search_tasks.append(("jira", providers["jira"].search_collabs_activity, (list(jira_handle_tags), args.days), jira_handle_tags))
 
     # 2. Topics
     for topic in config.get("topics", []):
         tag = f"Topic: {topic.get('name')}"
         keywords = topic.get("keywords", [])
         
-        # Google and Notion: Loop per keyword
+        # Google: merged keyword queries, attributed back per keyword
+        if keywords:
+            keyword_tags = {kw: tag for kw in keywords}
+            search_tasks.append(("google", providers["google"].search_topics_activity, (keywords, args.days), keyword_tags))
+
+        # Notion: search is semantic, so keywords don't combine; one query each, merged by id in the sweep
+        seen = set()
         for kw in keywords:
-            search_tasks.append((providers["google"].search_topic_activity, (kw, args.days), tag))
-            search_tasks.append((providers["notion"].search_topic_activity, (kw, args.days), tag))
+            if kw.lower() not in seen:
+                seen.add(kw.lower())
+                search_tasks.append(("notion", providers["notion"].search_topic_activity, (kw, args.days), tag))
             
         # Jira: Batch search
         if keywords:
-            search_tasks.append((providers["jira"].search_topic_activity, (keywords, args.days), tag))
+            search_tasks.append(("jira", providers["jira"].search_topic_activity, (keywords, args.days), tag))
 
     # 3. Teams
     for team in config.get("teams", []):
         tag = f"Team: {team.get('name')}"
-        search_tasks.append((providers["google"].search_team_activity, (team["name"], args.days), tag))
-        search_tasks.append((providers["notion"].search_team_activity, (team["name"], args.days), tag))
+        search_tasks.append(("google", providers["google"].search_team_activity, (team["name"], args.days), tag))
+        search_tasks.append(("notion", providers["notion"].search_team_activity, (team["name"], args.days), tag))
         if team.get("jira_project"):
-            search_tasks.append((providers["jira"].search_team_activity, (team["jira_project"], args.days), tag))
+            search_tasks.append(("jira", providers["jira"].search_team_activity, (team["jira_project"], args.days), tag))
 
     # 4. Meeting Notes
-    search_tasks.append((providers["google"].search_meeting_notes, (args.days,), "Meeting Notes"))
+    search_tasks.append(("google", providers["google"].search_meeting_notes, (args.days,), "Meeting Notes"))
 
-    # Execute Search Sweep in Parallel
-    print(f"Queued {len(search_tasks)} search tasks. Executing...")
+    search_tasks = [task for task in search_tasks if task[0] not in degraded]
+
+    # Searches and item processing share one prioritised pool (collaborators first)
+    print(f"Queued {len(search_tasks)} search tasks (max_workers={max_workers}"
+          + (f", deadline {deadline_minutes} min" if deadline_minutes else "") + "). Executing...")
     
     sweep_lock = Lock()
-    max_workers = config.get("settings", {}).get("max_workers", 10)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = []
-        for func, f_args, tag in search_tasks:
-            futures.append(executor.submit(run_search_task, func, f_args, tag, sweep_lock, handle_results))
-        
-        completed_count = 0
-        total_tasks = len(futures)
-        for _ in as_completed(futures):
-            completed_count += 1
-            print(f"\rSearch Progress: {completed_count}/{total_tasks}...", end="", flush=True)
+    for provider_key, func, f_args, tag in search_tasks:
+        priority = tag_priority(next(iter(tag.values())) if isinstance(tag, dict) else tag)
+        scheduler.submit(
+            priority, STAGE_SEARCH, provider_key, "search",
+            run_search_task, func, f_args, tag, sweep_lock, handle_results, search_cache
+        )
+    finished = scheduler.run()
     
-    print(f"\n>>> Sweep Complete. Found {len(items_to_process)} items to process/summarize.")
-    
-    # Process items in parallel
-    print(f"Starting content processing (max_workers={max_workers})...")
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = []
-        for unique_id, provider in items_to_process:
-            futures.append(executor.submit(
-                process_item, 
-                unique_id, 
-                provider, 
-                tracker, 
-                item_tags, 
-                target_emails
-            ))
-        
-        for future in as_completed(futures):
-            pass
+    print(f"\n>>> Sweep Complete. Found {len(sweep)} items.")
+    if args.incremental:
+        print(f"Incremental: processed {len(delta)} new/changed items, skipped {len(sweep) - len(delta)} unchanged.")
+    print("Scheduler: " + "; ".join(scheduler.report()))
+    if any(counts["dropped"] for counts in scheduler.stats.values()):
+        print(f"[WARN] Deadline of {deadline_minutes} min reached; the report below is partial.")
+    if not finished:
+        print("[WARN] Some jobs were still running after the deadline grace period.")
+    search_cache.save()
+    if raw_store is not None:
+        raw_store.save(tracker.data_dir / "raw_search_results.json")
+        set_raw_store(None)
+    if search_cache.enabled:
+        print(f"Search cache (max age {args.max_cache_age}h): " + "; ".join(search_cache.report()))
+    print("Change detection: " + "; ".join(detector.report()))
+    print("Provider health:")
+    for line in health_report():
+        print(f"  {line}")
+    print(f"Identity cache: {identity.report()}")
 
     tracker.save()
+    if mcp_pool:
+        set_mcp_pool(None)
+        # Jobs still running past the grace period may be mid-call; leave the pool to process exit
+        if finished:
+            mcp_pool.close()
     
-    # 3. Assemble Corpus
-    corpus_data = [] # List of (title, content_text, discussion_text)
+    # 3. Assemble Corpus (streamed from the content files, within the token budget)
+    corpus_entries = []
     print("Building corpus...")
     
-    for unique_id, provider in items_to_process:
-        item = tracker.get_item(unique_id)
+    for unique_id, provider in sweep:
+        item = tracker.get_summary(unique_id)
         if not item:
             continue
         
         # 1. Content
-        mod_time = None
-        if "raw_metadata" in item:
-            meta = item["raw_metadata"]
-            mod_time = provider.get_modified_time(meta)
+        meta = tracker.get_metadata(unique_id)
+        mod_time = provider.get_modified_time(meta) if meta else None
         
-        content_path = tracker.get_content_path(unique_id, mod_time)
-        content_text = ""
-        if content_path and content_path.exists():
-            try:
-                content_text = content_path.read_text(encoding="utf-8")
-            except Exception as e:
-                print(f"[WARN] Could not read content for {unique_id}: {e}")
-
         # 2. Discussion
         discussion_text = ""
         if item.get("discussion_summary"):
              discussion_text = f"\n\n### Discussion Summary\n{item['discussion_summary']}\n"
 
-        if content_text or discussion_text:
-            corpus_data.append({
-                "title": item.get("title", "Untitled"),
-                "id": unique_id,
-                "content": content_text,
-                "discussion": discussion_text
-            })
+        corpus_entries.append({
+            "id": unique_id,
+            "title": item.get("title", "Untitled"),
+            "tags": sweep.item_tags.get(unique_id, set()),
+            "modified": mod_time or item.get("last_seen"),
+            "content_path": tracker.get_content_path(unique_id),
+            "discussion": discussion_text
+        })
 
     # Write Corpus
-    if corpus_data:
+    if corpus_entries:
         corpus_out = Path("situation_corpus.md")
-        print(f"Writing {len(corpus_data)} items to {corpus_out}...")
-        with open(corpus_out, "w", encoding="utf-8") as outfile:
-            outfile.write(f"# Situation Report Corpus - {datetime.now().isoformat()}\n")
-            outfile.write(f"Scope: {args.days} days history.\n\n")
-            
-            for entry in corpus_data:
-                outfile.write(f"\n\n--- DOCUMENT: {entry['title']} ({entry['id']}) ---\n\n")
-                outfile.write(entry['content'])
-                outfile.write(entry['discussion'])
-                
-        print(f"Corpus ready: {corpus_out.absolute()}")
+        header = f"# Situation Report Corpus - {datetime.now().isoformat()}\nScope: {args.days} days history.\n\n"
+        if args.incremental:
+            header += build_changes_section(delta, tracker, last_run)
+        index, corpus_stats = write_corpus(
+            corpus_entries,
+            corpus_out,
+            header,
+            max_tokens=settings.get("corpus_max_tokens", DEFAULT_MAX_TOKENS),
+            max_item_tokens=settings.get("corpus_max_item_tokens", DEFAULT_MAX_ITEM_TOKENS),
+            weights=settings.get("corpus_tag_weights"),
+        )
+        print(f"Wrote {corpus_stats['written']} items to {corpus_out} "
+              f"({corpus_stats['truncated']} truncated, {corpus_stats['over_budget']} left out over budget)")
+        print(f"Corpus ready: {corpus_out.absolute()} (index: {corpus_out.with_suffix('.index.json')})")
     
     print("\n" + "="*60)
     print("SITUATION REPORT".center(60))
@@ -308,7 +470,7 @@ def main():
     all_tags = topics + people + ["Meeting Notes"]
     
     for tag in all_tags:
-        relevant_ids = [uid for uid, tags in item_tags.items() if tag in tags]
+        relevant_ids = sweep.ids_for_tag(tag)
         if not relevant_ids:
             continue
             
@@ -316,7 +478,7 @@ def main():
         
         tag_items = []
         for uid in relevant_ids:
-            it = tracker.get_item(uid)
+            it = tracker.get_summary(uid)
             if it:
                 tag_items.append(it)
         
@@ -332,5 +494,11 @@ def main():
             print(f"  Link: {item['url']}")
             print()
 
+    if finished:
+        tracker.close()
+    else:
+        # Stragglers may still write: keep the tracker open, flush what's there, and let exit stop them
+        tracker.flush()
+
 if __name__ == "__main__":
     main()
@@ -4,6 +4,11 @@ import sys
 import re
 import tempfile
 import os
+import time
+
+from .guard import get_guard
+from .hit import SearchHit
+from .mcp_pool import McpPoolError, McpPoolTimeout
 
 
 class ProviderBase:
@@ -18,14 +23,163 @@ class ProviderBase:
             return unique_id.split(":", 1)[1]
         return unique_id
 
+    def make_hit(self, raw_id, item_type, title, url, raw, author_ids=()):
+        """Builds a SearchHit; the raw object only goes to the raw store, if one is set."""
+        unique_id = self.build_id(raw_id)
+        if _raw_store is not None:
+            _raw_store.put(unique_id, raw)
+        return SearchHit(unique_id, self.name, item_type, title, url, self._raw_modified_time(raw), author_ids)
+
+    def cached_identity(self, name):
+        """(found, value) from the persistent identity cache; (False, None) when none is set."""
+        if _identity_cache is None:
+            return False, None
+        return _identity_cache.get(self.name, name)
+
+    def store_identity(self, name, value):
+        if _identity_cache is not None:
+            _identity_cache.set(self.name, name, value)
+
     def get_modified_time(self, metadata):
+        """Modified time from a SearchHit.metadata() record, or a raw API object stored by older runs."""
+        if not metadata:
+            return None
+        if "modified_time" in metadata:
+            return metadata["modified_time"]
+        return self._raw_modified_time(metadata)
+
+    def _raw_modified_time(self, raw):
         return None
 
     @property
     def provider_name(self):
         return self.name
 
+    def fan_out_by_keyword(self, results, keywords, text_of):
+        """
+        Attributes merged-query results back to keywords: a result belongs to
+        every keyword found in text_of(result), or to all of `keywords` when none
+        is (the server matched on text we can't see). Returns {keyword: [results]}.
+        """
+        by_keyword = {kw: [] for kw in keywords}
+        for res in results:
+            text = (text_of(res) or "").lower()
+            matched = [kw for kw in keywords if kw.lower() in text]
+            for kw in matched or keywords:
+                by_keyword[kw].append(res)
+        return by_keyword
+
+_mcp_pool = None
+_raw_store = None
+_identity_cache = None
+
+
+def set_mcp_pool(pool):
+    """Routes run_mcpc through a pooled MCP client (None restores the subprocess path)."""
+    global _mcp_pool
+    _mcp_pool = pool
+
+
+def get_mcp_pool():
+    return _mcp_pool
+
+
+def set_identity_cache(cache):
+    """Persists cloud ids and user lookups in `cache` (an IdentityCache); None keeps them per process."""
+    global _identity_cache
+    _identity_cache = cache
+
+
+def set_raw_store(store):
+    """Keeps raw search payloads in `store` (a RawStore); None drops them."""
+    global _raw_store
+    _raw_store = store
+
+
+def unwrap_tool_result(data):
+    """Extracts the useful payload from an MCP tools/call result."""
+    # 1. Check for 'structuredContent' (some tools)
+    if isinstance(data, dict) and "structuredContent" in data:
+        return data["structuredContent"]
+
+    # 2. Check for 'structuredData' (some versions)
+    if isinstance(data, dict) and "structuredData" in data:
+        return data["structuredData"]
+
+    # 3. Check for 'content' blocks (standard MCP)
+    if isinstance(data, dict) and "content" in data and isinstance(data["content"], list):
+        if len(data["content"]) == 1 and data["content"][0].get("type") == "text":
+            text_content = data["content"][0]["text"]
+            try:
+                inner = json.loads(text_content)
+                return inner
+            except json.JSONDecodeError:
+                return text_content
+        return data["content"]
+
+    return data
+
+
+class McpCallError(Exception):
+    """A tool call failed at the transport level (non-zero exit, bad output, timeout)."""
+
+    def __init__(self, message, timed_out=False):
+        super().__init__(message)
+        self.timed_out = timed_out
+
+
 def run_mcpc(session, tool, args):
+    """
+    Calls an MCP tool and returns its unwrapped result, or None on error.
+    Calls go through the session's guard: token-bucket rate limit, timeout, and
+    a circuit breaker that fails fast (returns None) while the session is down.
+    """
+    guard = get_guard(session)
+    if not guard.allow():
+        return None
+    guard.wait_for_token()
+    start = time.monotonic()
+    ok = timed_out = False
+    try:
+        result = _call_tool(session, tool, args, guard.timeout)
+        ok = True
+        return result
+    except McpCallError as e:
+        timed_out = e.timed_out
+        print(f"[WARN] {session} {tool} error: {e}", file=sys.stderr)
+        return None
+    finally:
+        # Always settle the call with the breaker, or a half-open circuit never closes
+        if guard.record(time.monotonic() - start, ok=ok, timed_out=timed_out):
+            print(f"[WARN] {session}: circuit open after repeated failures; failing fast for {guard.breaker.reset_seconds}s", file=sys.stderr)
+
+
+def _call_tool(session, tool, args, timeout):
+    pool = _mcp_pool
+    if pool is not None and pool.handles(session):
+        try:
+            data = pool.call_tool(session, tool, args, timeout=timeout)
+        except McpPoolTimeout as e:
+            raise McpCallError(str(e), timed_out=True) from e
+        except McpPoolError as e:
+            print(f"[WARN] {session} {tool} pooled call failed ({e}); falling back to mcpc", file=sys.stderr)
+        except Exception as e:
+            raise McpCallError(f"exception: {e}") from e
+        else:
+            try:
+                unwrapped = unwrap_tool_result(data)
+            except Exception as e:
+                raise McpCallError(f"bad tool result: {e}") from e
+            if isinstance(data, dict) and data.get("isError"):
+                # Tool-level error: the server is healthy, so it doesn't count against the breaker
+                print(f"[WARN] {session} {tool} error: {unwrapped}", file=sys.stderr)
+                return None
+            return unwrapped
+    return run_mcpc_subprocess(session, tool, args, timeout)
+
+
+def run_mcpc_subprocess(session, tool, args, timeout=None):
+    """Runs one tool call through the mcpc CLI. Raises McpCallError on failure."""
     cmd = ["mcpc", "--json", session, "tools-call", tool]
     for k, v in args.items():
         if isinstance(v, (dict, list, bool, int, float)):
@@ -42,11 +196,10 @@ def run_mcpc(session, tool, args):
         # Redirect stdout to file, allow stderr to flow or capture if needed
         # We capture stderr to print it on error
         with open(tmp_path, 'w') as f_out:
-            result = subprocess.run(cmd, stdout=f_out, stderr=subprocess.PIPE, text=True, encoding='utf-8')
+            result = subprocess.run(cmd, stdout=f_out, stderr=subprocess.PIPE, text=True, encoding='utf-8', timeout=timeout)
             
         if result.returncode != 0:
-            print(f"[WARN] {session} {tool} error: {result.stderr.strip()}", file=sys.stderr)
-            return None
+            raise McpCallError(result.stderr.strip() or f"mcpc exited with {result.returncode}")
             
         # Read back from file
         with open(tmp_path, 'r', encoding='utf-8') as f_in:
@@ -61,37 +214,16 @@ def run_mcpc(session, tool, args):
             return None
 
         try:
-            data = json.loads(output)
-            
-            # 1. Check for 'structuredContent' (some tools)
-            if isinstance(data, dict) and "structuredContent" in data:
-                return data["structuredContent"]
-
-            # 2. Check for 'structuredData' (some versions)
-            if isinstance(data, dict) and "structuredData" in data:
-                return data["structuredData"]
-            
-            # 3. Check for 'content' blocks (standard MCP)
-            if isinstance(data, dict) and "content" in data and isinstance(data["content"], list):
-                if len(data["content"]) == 1 and data["content"][0].get("type") == "text":
-                    text_content = data["content"][0]["text"]
-                    try:
-                        inner = json.loads(text_content)
-                        return inner
-                    except json.JSONDecodeError:
-                        return text_content
-                return data["content"]
-            
-            return data
-            
+            return unwrap_tool_result(json.loads(output))
         except json.JSONDecodeError:
-            print(f"[ERROR] Failed to parse JSON from {session} {tool}", file=sys.stderr)
-            # print(f"RAW START: {output[:200]}...", file=sys.stderr)
-            return None
+            raise McpCallError("failed to parse JSON output")
             
+    except McpCallError:
+        raise
+    except subprocess.TimeoutExpired:
+        raise McpCallError(f"timed out after {timeout}s", timed_out=True)
     except Exception as e:
-        print(f"[ERROR] Exception {session} {tool}: {e}", file=sys.stderr)
-        return None
+        raise McpCallError(f"exception: {e}")
     finally:
         # Cleanup
         if os.path.exists(tmp_path):
@@ -1,11 +1,34 @@
 from .base import run_mcpc, ProviderBase
 from datetime import datetime, timedelta, timezone
+import threading
+
+MIME_KINDS = {
+    "application/vnd.google-apps.document": "docs",
+    "application/vnd.google-apps.presentation": "slides",
+    "application/vnd.google-apps.spreadsheet": "sheets",
+}
+# Probe order when the mime type is missing or not in MIME_KINDS (most likely first)
+PROBE_ORDER = ("docs", "slides", "sheets")
+# Drive rejects overly long q strings; merged keyword queries stay under this.
+MAX_QUERY_LENGTH = 1500
+PAGE_SIZE = 10  # per keyword; merged queries ask for PAGE_SIZE * keywords
+MAX_PAGE_SIZE = 100
+# Keywords per merged query, so each still gets PAGE_SIZE results' worth of page.
+MAX_BATCH_KEYWORDS = MAX_PAGE_SIZE // PAGE_SIZE
+COMMENT_TOOLS = {
+    "docs": ("docs.listComments", "documentId"),
+    "slides": ("slides.listComments", "presentationId"),
+    "sheets": ("sheets.listComments", "spreadsheetId"),
+}
 
 class GoogleProvider(ProviderBase):
     def __init__(self):
         self.session = "@google"
         self.name = "google"
         self.id_prefix = "google"
+        # mime type -> kind that worked (None: nothing did), learned by probing
+        self._learned_kinds = {}
+        self._kinds_lock = threading.Lock()
 
     def _get_date_filter(self, days):
         dt = datetime.now(timezone.utc) - timedelta(days=days)
@@ -29,6 +52,35 @@ class GoogleProvider(ProviderBase):
         query = f"(modifiedTime > '{date_str}' or createdTime > '{date_str}') and fullText contains '{safe_kw}'"
         return self._search_drive(query)
 
+    def _topic_query(self, keywords, date_str):
+        # Escape single quotes in keywords
+        safe_kws = [kw.replace("'", "\\'") for kw in keywords]
+        clauses = " or ".join(f"fullText contains '{kw}'" for kw in safe_kws)
+        return f"(modifiedTime > '{date_str}' or createdTime > '{date_str}') and ({clauses})"
+
+    def search_topics_activity(self, keywords, days=7):
+        """
+        Searches many keywords with OR'ed fullText clauses, at most MAX_BATCH_KEYWORDS
+        per query and under MAX_QUERY_LENGTH. Returns {keyword: [results]}, attributed
+        by file name.
+        """
+        date_str = self._get_date_filter(days)
+        batches, batch = [], []
+        for kw in keywords:
+            if batch and (len(batch) >= MAX_BATCH_KEYWORDS or len(self._topic_query(batch + [kw], date_str)) > MAX_QUERY_LENGTH):
+                batches.append(batch)
+                batch = []
+            batch.append(kw)
+        if batch:
+            batches.append(batch)
+
+        by_keyword = {kw: [] for kw in keywords}
+        for batch in batches:
+            results = self._search_drive(self._topic_query(batch, date_str), page_size=PAGE_SIZE * len(batch))
+            for kw, kw_results in self.fan_out_by_keyword(results, batch, lambda r: r.title).items():
+                by_keyword[kw].extend(kw_results)
+        return by_keyword
+
     def search_team_activity(self, team_name, days=7):
         date_str = self._get_date_filter(days)
         safe_team = team_name.replace("'", "\\'")
@@ -40,12 +92,12 @@ class GoogleProvider(ProviderBase):
         query = f"(modifiedTime > '{date_str}' or createdTime > '{date_str}') and name contains 'Notes by Gemini'"
         return self._search_drive(query)
 
-    def _search_drive(self, query):
+    def _search_drive(self, query, page_size=PAGE_SIZE):
         results = []
         # Explicitly order by modifiedTime desc to get freshest content
         resp = run_mcpc(self.session, "drive.search", {
             "query": query, 
-            "pageSize": 10,
+            "pageSize": page_size,
             "orderBy": "modifiedTime desc"
         })
         
@@ -62,73 +114,86 @@ class GoogleProvider(ProviderBase):
                 if not url:
                     url = f"https://drive.google.com/open?id={f.get('id')}"
                 
-                results.append({
-                    "id": self.build_id(f.get("id")),
-                    "provider": self.name,
-                    "type": mime,
-                    "title": f.get("name"),
-                    "url": url,
-                    "metadata": f
-                })
+                owners = [o.get("emailAddress") for o in f.get("owners", []) if o.get("emailAddress")]
+                results.append(self.make_hit(f.get("id"), mime, f.get("name"), url, f, author_ids=owners))
         return results
 
-    def get_content(self, file_id, mime_type=None):
+    def _kinds_for(self, mime_type):
+        """Returns the file kinds to try for a mime type, in order ([] = no text tool)."""
+        if mime_type in MIME_KINDS:
+            return [MIME_KINDS[mime_type]]
+        with self._kinds_lock:
+            if mime_type in self._learned_kinds:
+                kind = self._learned_kinds[mime_type]
+                return [kind] if kind else []
+        if mime_type and "google-apps" not in mime_type:
+            return []  # PDFs and other uploads
+        return list(PROBE_ORDER)
+
+    def _learn_kind(self, mime_type, kind):
+        # Only mime types we had to probe are worth remembering
+        if mime_type and mime_type not in MIME_KINDS:
+            with self._kinds_lock:
+                self._learned_kinds.setdefault(mime_type, kind)
+
+    def get_content(self, file_id, mime_type=None, metadata=None):
         real_id = self.parse_id(file_id)
+        if mime_type is None and metadata:
+            mime_type = metadata.get("mimeType") or metadata.get("type")
         
-        # Dispatch based on MIME type if known
-        if mime_type:
-            if "document" in mime_type:
-                return self._get_doc_text(real_id)
-            elif "presentation" in mime_type:
-                return self._get_slides_text(real_id)
-            elif "spreadsheet" in mime_type:
-                return self._get_sheets_text(real_id)
-        
-        # Fallback: Try them in sequence (most likely first)
-        text = self._get_doc_text(real_id)
-        if text:
-            return text
-        
-        text = self._get_slides_text(real_id)
-        if text:
-            return text
-        
-        text = self._get_sheets_text(real_id)
-        if text:
-            return text
-
+        # Dispatch based on MIME type; unknown types are probed once per run
+        kinds = self._kinds_for(mime_type)
+        answered = 0
+        for kind in kinds:
+            resp, text = getattr(self, f"_get_{kind}_text")(real_id)
+            if text:
+                self._learn_kind(mime_type, kind)
+                return text
+            answered += resp is not None
+        # Only a definite "unsupported" from every tool rules the type out; a failed
+        # call (timeout, open circuit) leaves it to be probed again
+        if len(kinds) > 1 and answered == len(kinds):
+            self._learn_kind(mime_type, None)
         return None
 
-    def _get_doc_text(self, real_id):
+    def _get_docs_text(self, real_id):
+        """(raw response, text or None); the response is None when the call failed."""
         resp = run_mcpc(self.session, "docs.getText", {"documentId": real_id, "format": "markdown"})
         if resp and isinstance(resp, str) and "error" not in resp:
-            return resp
-        return None
+            return resp, resp
+        return resp, None
 
     def _get_slides_text(self, real_id):
         resp = run_mcpc(self.session, "slides.getText", {"presentationId": real_id})
         if resp and "error" not in str(resp):
-            return str(resp)
-        return None
+            return resp, str(resp)
+        return resp, None
 
     def _get_sheets_text(self, real_id):
         resp = run_mcpc(self.session, "sheets.getText", {"spreadsheetId": real_id})
         if resp and "error" not in str(resp):
-            return str(resp)
-        return None
+            return resp, str(resp)
+        return resp, None
 
-    def get_comments(self, file_id):
+    def get_comments(self, file_id, metadata=None):
+        """Comment dicts, [] when there are none, or None when no tool answered."""
         real_id = self.parse_id(file_id)
+        mime_type = (metadata or {}).get("mimeType") or (metadata or {}).get("type")
         
-        # Try all 3 comment tools
-        resp = run_mcpc(self.session, "docs.listComments", {"documentId": real_id})
-        if not resp or "error" in str(resp):
-             resp = run_mcpc(self.session, "slides.listComments", {"presentationId": real_id})
-        if not resp or "error" in str(resp):
-             resp = run_mcpc(self.session, "sheets.listComments", {"spreadsheetId": real_id})
-
-        if not resp or "error" in str(resp):
-             return []
+        # Same dispatch as get_content: one listComments tool per known type
+        kinds = self._kinds_for(mime_type)
+        if not kinds:
+            return []  # no comment tool for this type
+        resp = None
+        for kind in kinds:
+            tool, id_param = COMMENT_TOOLS[kind]
+            resp = run_mcpc(self.session, tool, {id_param: real_id})
+            if resp is not None and "error" not in str(resp):
+                self._learn_kind(mime_type, kind)
+                break
+
+        if resp is None or "error" in str(resp):
+             return None
         
         comments = []
         raw_comments = resp if isinstance(resp, list) else resp.get("comments", [])
@@ -142,7 +207,5 @@ class GoogleProvider(ProviderBase):
              })
         return comments
 
-    def get_modified_time(self, metadata):
-        if not metadata:
-            return None
-        return metadata.get("modifiedTime") or metadata.get("createdTime")
+    def _raw_modified_time(self, raw):
+        return raw.get("modifiedTime") or raw.get("createdTime")
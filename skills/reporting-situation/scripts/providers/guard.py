@@ -0,0 +1,162 @@
+import threading
+import time
+
+DEFAULT_LIMITS = {
+    "rate_per_minute": None,  # None: no rate limit
+    "burst": 5,
+    "timeout_seconds": 120,
+    "failure_threshold": 5,  # consecutive failures before the circuit opens
+    "reset_seconds": 60,  # open circuit lets one trial call through after this long
+}
+
+
+class TokenBucket:
+    """Allows `rate_per_minute` calls on average, with bursts of up to `burst`."""
+
+    def __init__(self, rate_per_minute, burst=5):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive failures; open rejects
+    calls until `reset_seconds` pass, then half-open lets one trial call through
+    (success closes the circuit, failure reopens it).
+    """
+
+    def __init__(self, failure_threshold=5, reset_seconds=60):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = "half-open"
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        """Returns True if this failure opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            if self.state == "half-open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                return True
+            return False
+
+
+class SessionGuard:
+    """Rate limit, timeout, circuit breaker and call counters for one MCP session."""
+
+    def __init__(self, session, limits=None):
+        self.session = session
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        rate = self.limits["rate_per_minute"]
+        self.bucket = TokenBucket(rate, self.limits["burst"]) if rate else None
+        self.breaker = CircuitBreaker(self.limits["failure_threshold"], self.limits["reset_seconds"])
+        self.timeout = self.limits["timeout_seconds"]
+        self._lock = threading.Lock()
+        self.counts = {"calls": 0, "failed": 0, "timeouts": 0, "rejected": 0}
+        self.total_seconds = 0.0
+
+    def allow(self):
+        if self.breaker.allow():
+            return True
+        with self._lock:
+            self.counts["rejected"] += 1
+        return False
+
+    def wait_for_token(self):
+        if self.bucket:
+            self.bucket.acquire()
+
+    def record(self, elapsed, ok, timed_out=False):
+        """Counts a finished call. Returns True if it opened the circuit."""
+        with self._lock:
+            self.counts["calls"] += 1
+            self.total_seconds += elapsed
+            if not ok:
+                self.counts["failed"] += 1
+            if timed_out:
+                self.counts["timeouts"] += 1
+        if ok:
+            self.breaker.record_success()
+            return False
+        return self.breaker.record_failure()
+
+    @property
+    def healthy(self):
+        return self.breaker.state == "closed"
+
+    def summary(self):
+        c = self.counts
+        avg = self.total_seconds / c["calls"] if c["calls"] else 0
+        line = (
+            f"{self.session}: {c['calls']} calls, {c['failed']} failed ({c['timeouts']} timeouts), "
+            f"{c['rejected']} rejected, avg {avg:.1f}s, circuit {self.breaker.state}"
+        )
+        if self.breaker.times_opened:
+            line += f" (opened {self.breaker.times_opened}x)"
+        return line
+
+
+_guards = {}
+_session_limits = {}
+_guards_lock = threading.Lock()
+
+
+def configure_sessions(session_limits):
+    """
+    Sets limits from config["session_limits"]: {"default": {...}, "@notion": {...}}.
+    Resets existing guards and their counters.
+    """
+    global _session_limits
+    with _guards_lock:
+        _session_limits = dict(session_limits or {})
+        _guards.clear()
+
+
+def get_guard(session):
+    with _guards_lock:
+        guard = _guards.get(session)
+        if guard is None:
+            limits = {**_session_limits.get("default", {}), **_session_limits.get(session, {})}
+            guard = _guards[session] = SessionGuard(session, limits)
+        return guard
+
+
+def health_report():
+    """One line per session used this run."""
+    with _guards_lock:
+        guards = sorted(_guards.values(), key=lambda g: g.session)
+    return [g.summary() for g in guards]
@@ -0,0 +1,64 @@
+import json
+import threading
+
+
+class SearchHit:
+    """
+    One search result, the same shape for every provider. The raw API object
+    is not kept on the hit (see RawStore); metadata() is the compact record the
+    tracker stores instead.
+    """
+
+    __slots__ = ("id", "provider", "type", "title", "url", "modified_time", "author_ids")
+
+    def __init__(self, id, provider, type, title, url=None, modified_time=None, author_ids=()):
+        self.id = id
+        self.provider = provider
+        self.type = type
+        self.title = title
+        self.url = url
+        self.modified_time = modified_time
+        self.author_ids = tuple(author_ids or ())
+
+    def metadata(self):
+        return {"type": self.type, "modified_time": self.modified_time, "author_ids": list(self.author_ids)}
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["author_ids"] = list(self.author_ids)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def __eq__(self, other):
+        return isinstance(other, SearchHit) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"SearchHit({self.id!r}, {self.title!r})"
+
+
+class RawStore:
+    """Optional side store for raw search payloads, keyed by unique id (latest wins)."""
+
+    def __init__(self):
+        self._raw = {}
+        self._lock = threading.Lock()
+
+    def put(self, unique_id, raw):
+        with self._lock:
+            self._raw[unique_id] = raw
+
+    def get(self, unique_id):
+        with self._lock:
+            return self._raw.get(unique_id)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def save(self, path):
+        with self._lock:
+            payload = json.dumps(self._raw)
+        with open(path, "w") as f:
+            f.write(payload)
@@ -0,0 +1,61 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+CATEGORY = "identity"
+DEFAULT_TTL_HOURS = 168
+DEFAULT_NEGATIVE_TTL_HOURS = 24
+
+
+class IdentityCache:
+    """
+    Cloud ids and user lookups that rarely change, kept across runs in the
+    tracker's mappings (category "identity", names like "jira:<site>:user:@handle").
+    All entries are loaded once at construction; lookups are then in memory and
+    new entries are written through. Unresolvable names are cached too (value
+    None), for a shorter negative_ttl_hours, so they aren't looked up every run.
+    """
+
+    def __init__(self, tracker, ttl_hours=DEFAULT_TTL_HOURS, negative_ttl_hours=DEFAULT_NEGATIVE_TTL_HOURS):
+        self.tracker = tracker
+        self.ttl_hours = ttl_hours
+        self.negative_ttl_hours = negative_ttl_hours
+        self._lock = threading.Lock()
+        self.entries = tracker.get_mappings(CATEGORY)
+        self.stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def from_settings(cls, tracker, settings):
+        """The cache with config["settings"] TTLs; orchestrator.py and gather_context.py share it."""
+        return cls(
+            tracker,
+            ttl_hours=settings.get("identity_ttl_hours", DEFAULT_TTL_HOURS),
+            negative_ttl_hours=settings.get("identity_negative_ttl_hours", DEFAULT_NEGATIVE_TTL_HOURS),
+        )
+
+    def get(self, provider, name):
+        """Returns (found, value); found is False when missing or expired."""
+        key = f"{provider}:{name}"
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self.entries.get(key)
+            try:
+                fresh = entry is not None and datetime.fromisoformat(entry["expires"]) > now
+            except (KeyError, TypeError, ValueError):
+                fresh = False
+            self.stats["hits" if fresh else "misses"] += 1
+            return (True, entry.get("value")) if fresh else (False, None)
+
+    def set(self, provider, name, value):
+        hours = self.ttl_hours if value is not None else self.negative_ttl_hours
+        entry = {
+            "value": value,
+            "expires": (datetime.now(timezone.utc) + timedelta(hours=hours)).isoformat(),
+        }
+        key = f"{provider}:{name}"
+        with self._lock:
+            self.entries[key] = entry
+        self.tracker.set_mapping(CATEGORY, key, entry)
+
+    def report(self):
+        s = self.stats
+        return f"{len(self.entries)} cached, {s['hits']}/{s['hits'] + s['misses']} lookups served from cache"
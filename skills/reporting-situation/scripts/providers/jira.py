@@ -1,29 +1,63 @@
+import re
+import threading
+from concurrent.futures import Future
+
 from .base import run_mcpc, ProviderBase
 
+# Fields get_content/get_comments read; a search hit that has them needs no getJiraIssue call.
+ISSUE_DOC_FIELDS = ("description", "comment")
+# Fields requested from searches: enough to attribute batched collaborator hits locally.
+SEARCH_FIELDS = ["summary", "updated", "assignee", "reporter", "creator", "description", "comment"]
+PAGE_SIZE = 25
+MAX_RESULTS = 100  # per query (per person for collaborator batches), across pages
+MAX_JQL_LENGTH = 4000
+
+def site_scope(cloud_id=None, base_url=None):
+    """Identity cache scope for a configured Jira site, so switching sites doesn't reuse its ids."""
+    return (base_url or "").rstrip("/") or cloud_id or "default"
+
 class JiraProvider(ProviderBase):
     def __init__(self, cloud_id=None, base_url=None):
         self.session = "@jira"
         self.search_tool = "searchJiraIssuesUsingJql"
         self.cloud_id = cloud_id
         self.base_url = (base_url or "").rstrip("/")
+        self.site = site_scope(cloud_id, base_url)
         self._user_cache = {} 
+        # Per-run issue documents shared by get_content/get_comments; concurrent
+        # requests for the same key wait on one in-flight getJiraIssue call.
+        self._issues = {}
+        self._issues_in_flight = {}
+        self._issues_lock = threading.Lock()
+        self.issue_fetches = 0
         self.name = "jira"
         self.id_prefix = "jira"
 
     def _ensure_cloud_id(self):
         if self.cloud_id:
             return True
+        found, site = self.cached_identity(f"{self.site}:cloud")
+        if found and site:
+            self.cloud_id = site["id"]
+            if not self.base_url:
+                self.base_url = site.get("url") or ""
+            return True
         resources = run_mcpc(self.session, "getAccessibleAtlassianResources", {})
         if resources and isinstance(resources, list) and len(resources) > 0:
             self.cloud_id = resources[0].get("id")
             if not self.base_url:
                 self.base_url = (resources[0].get("url") or "").rstrip("/")
+            self.store_identity(f"{self.site}:cloud", {"id": self.cloud_id, "url": (resources[0].get("url") or "").rstrip("/")})
             return True
         return False
 
     def _resolve_user(self, search_string):
         if search_string in self._user_cache:
             return self._user_cache[search_string]
+        found, account_id = self.cached_identity(f"{self.site}:user:{search_string}")
+        if found:
+            self._user_cache[search_string] = account_id
+            return account_id
         
         if not self._ensure_cloud_id():
             return None
@@ -33,32 +67,95 @@ class JiraProvider(ProviderBase):
             "cloudId": self.cloud_id, 
             "searchString": query
         })
+        if not isinstance(users, list):
+            return None  # lookup failed; try again next time
         
-        if users and isinstance(users, list) and len(users) > 0:
-            account_id = users[0].get("accountId")
-            self._user_cache[search_string] = account_id
-            return account_id
-        
-        return None
+        # An empty answer means no such user: cache that too
+        account_id = users[0].get("accountId") if users else None
+        self._user_cache[search_string] = account_id
+        self.store_identity(f"{self.site}:user:{search_string}", account_id)
+        return account_id
 
     def search_collab_activity(self, handle, days=7):
-        account_id = self._resolve_user(handle)
-        if not account_id:
-            return []
-            
-        # Escape handle for text search security
-        safe_handle = handle.replace('"', '\\"')
-            
-        jql = (
-            f'updated >= -{days}d AND ('
-            f'assignee = "{account_id}" OR '
-            f'reporter = "{account_id}" OR '
-            f'issuekey IN updatedBy("{account_id}", "-{days}d") OR '
-            f'lastCommentBy = "{account_id}" OR '
-            f'text ~ "{safe_handle}"'
-            f') ORDER BY updated DESC'
-        )
-        return self._search(jql)
+        return self.search_collabs_activity([handle], days).get(handle, [])
+
+    def _collab_jql(self, people, days):
+        ids = ", ".join(f'"{account_id}"' for account_id in people.values())
+        clauses = [f"assignee in ({ids})", f"reporter in ({ids})"]
+        for handle, account_id in people.items():
+            # Escape handle for text search security
+            safe_handle = handle.replace('"', '\\"')
+            clauses.append(f'issuekey IN updatedBy("{account_id}", "-{days}d")')
+            clauses.append(f'lastCommentBy = "{account_id}"')
+            clauses.append(f'text ~ "{safe_handle}"')
+        return f'updated >= -{days}d AND ({" OR ".join(clauses)}) ORDER BY updated DESC'
+
+    def _plan_collab_batches(self, people, days):
+        """Splits handle -> account_id into groups whose JQL stays under MAX_JQL_LENGTH."""
+        batches, batch = [], {}
+        for handle, account_id in people.items():
+            candidate = {**batch, handle: account_id}
+            if batch and len(self._collab_jql(candidate, days)) > MAX_JQL_LENGTH:
+                batches.append(batch)
+                candidate = {handle: account_id}
+            batch = candidate
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _attribute(self, issue, people):
+        """Handles in `people` an issue visibly belongs to, judged from its fields."""
+        fields = issue.get("fields", {})
+        account_ids = set()
+        for role in ("assignee", "reporter", "creator"):
+            user = fields.get(role)
+            if isinstance(user, dict) and user.get("accountId"):
+                account_ids.add(user["accountId"])
+        for c in (fields.get("comment") or {}).get("comments", []):
+            account_ids.add(c.get("author", {}).get("accountId"))
+        text = f"{fields.get('summary', '')} {fields.get('description', '')}"
+        return [
+            h for h, account_id in people.items()
+            if account_id in account_ids or re.search(rf"(?<!\w)@?{re.escape(h.lstrip('@'))}(?!\w)", text, re.IGNORECASE)
+        ]
+
+    def _attribute_by_activity(self, keys, people, days):
+        """
+        updatedBy()/lastCommentBy hits can't be attributed from fields, so ask
+        Jira per person which of `keys` they touched. Returns {key: [handles]}.
+        """
+        owners = {}
+        quoted = ", ".join(f'"{k}"' for k in keys)
+        for handle, account_id in people.items():
+            jql = (f'issuekey in ({quoted}) AND (issuekey IN updatedBy("{account_id}", "-{days}d") '
+                   f'OR lastCommentBy = "{account_id}")')
+            for issue in self._search_issues(jql, max_results=len(keys)):
+                owners.setdefault(issue.get("key"), []).append(handle)
+        return owners
+
+    def search_collabs_activity(self, handles, days=7):
+        """
+        Searches many collaborators with as few JQL queries as possible.
+        Returns {handle: [results]}; each hit is fanned out to the people it involves.
+        Hits nobody can be matched to are dropped.
+        """
+        people = {}
+        for handle in handles:
+            account_id = self._resolve_user(handle)
+            if account_id:
+                people[handle] = account_id
+        by_handle = {handle: [] for handle in handles}
+        for batch in self._plan_collab_batches(people, days):
+            issues = self._search_issues(self._collab_jql(batch, days), max_results=MAX_RESULTS * len(batch))
+            matched = {issue.get("key"): self._attribute(issue, batch) for issue in issues}
+            unmatched = [key for key, owners in matched.items() if key and not owners]
+            for start in range(0, len(unmatched), PAGE_SIZE):
+                matched.update(self._attribute_by_activity(unmatched[start:start + PAGE_SIZE], batch, days))
+            for issue in issues:
+                hit = self._to_result(issue)
+                for handle in matched.get(issue.get("key"), ()):
+                    by_handle[handle].append(hit)
+        return by_handle
 
     def search_topic_activity(self, keywords, days=7):
         if isinstance(keywords, str):
@@ -81,75 +178,116 @@ class JiraProvider(ProviderBase):
         jql = f"updated >= -{days}d AND project = '{project_key}' ORDER BY updated DESC"
         return self._search(jql)
 
-    def _search(self, jql):
+    def _search(self, jql, max_results=MAX_RESULTS):
+        return [self._to_result(i) for i in self._search_issues(jql, max_results)]
+
+    def _search_issues(self, jql, max_results=MAX_RESULTS):
+        """Raw issue objects for a JQL query, following nextPageToken."""
         if not self._ensure_cloud_id():
             return []
             
         results = []
-        # Use maxResults=10 to avoid buffer overflow on large JSON responses
-        resp = run_mcpc(self.session, self.search_tool, {
-            "cloudId": self.cloud_id,
-            "jql": jql,
-            "maxResults": 10
-        })
-        
-        issues = []
-        if isinstance(resp, dict):
-            issues = resp.get("issues", [])
-        elif isinstance(resp, list):
-            issues = resp
-        
-        for i in issues:
-            key = i.get('key')
-            summary = i.get('fields', {}).get('summary', 'No Summary')
-            item = {
-                "id": self.build_id(key),
-                "provider": self.name,
-                "type": "issue",
-                "title": f"{key}: {summary}",
-                "metadata": i
+        next_token = None
+        while len(results) < max_results:
+            # Page through results; each page is converted before the next is fetched
+            args = {
+                "cloudId": self.cloud_id,
+                "jql": jql,
+                "fields": SEARCH_FIELDS,
+                "maxResults": min(PAGE_SIZE, max_results - len(results))
             }
-            if self.base_url:
-                item["url"] = f"{self.base_url}/browse/{key}"
-            results.append(item)
-        return results
+            if next_token:
+                args["nextPageToken"] = next_token
+            resp = run_mcpc(self.session, self.search_tool, args)
+            
+            issues = []
+            next_token = None
+            if isinstance(resp, dict):
+                issues = resp.get("issues", [])
+                if not resp.get("isLast", False):
+                    next_token = resp.get("nextPageToken")
+            elif isinstance(resp, list):
+                issues = resp
+            
+            results.extend(issues)
+            if not issues or not next_token:
+                break
+        return results[:max_results]
+
+    def _to_result(self, i):
+        key = i.get('key')
+        fields = i.get("fields", {})
+        summary = fields.get('summary', 'No Summary')
+        url = f"{self.base_url}/browse/{key}" if self.base_url else None
+        author_ids = [
+            fields[role]["accountId"] for role in ("assignee", "reporter", "creator")
+            if isinstance(fields.get(role), dict) and fields[role].get("accountId")
+        ]
+        if key and all(f in fields for f in ISSUE_DOC_FIELDS):
+            with self._issues_lock:
+                self._issues.setdefault(key, i)
+        return self.make_hit(key, "issue", f"{key}: {summary}", url, i, author_ids=author_ids)
 
-    def get_content(self, issue_id):
+    def _get_issue(self, real_id):
+        """Returns the getJiraIssue document for a key, fetched at most once per run."""
+        with self._issues_lock:
+            if real_id in self._issues:
+                return self._issues[real_id]
+            fut = self._issues_in_flight.get(real_id)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._issues_in_flight[real_id] = fut
+                self.issue_fetches += 1
+        if not owner:
+            return fut.result()
+
+        try:
+            resp = run_mcpc(self.session, "getJiraIssue", {
+                "cloudId": self.cloud_id,
+                "issueIdOrKey": real_id
+            })
+            doc = resp if resp and "fields" in resp else None
+        except Exception as e:
+            with self._issues_lock:
+                del self._issues_in_flight[real_id]
+            fut.set_exception(e)
+            raise
+        with self._issues_lock:
+            if doc is not None:
+                # Failed fetches aren't cached, so a later caller retries
+                self._issues[real_id] = doc
+            del self._issues_in_flight[real_id]
+        fut.set_result(doc)
+        return doc
+
+    def get_content(self, issue_id, metadata=None):
         if not self._ensure_cloud_id():
             return None
-        real_id = self.parse_id(issue_id)
-        resp = run_mcpc(self.session, "getJiraIssue", {
-            "cloudId": self.cloud_id,
-            "issueIdOrKey": real_id
-        })
-        if resp and "fields" in resp:
+        resp = self._get_issue(self.parse_id(issue_id))
+        if resp:
             desc = resp["fields"].get("description", "")
             return str(desc)
         return None
 
-    def get_comments(self, issue_id):
+    def get_comments(self, issue_id, metadata=None):
+        """Comment dicts, [] when there are none, or None if the issue couldn't be fetched."""
         if not self._ensure_cloud_id():
-            return []
-        real_id = self.parse_id(issue_id)
-        resp = run_mcpc(self.session, "getJiraIssue", {
-            "cloudId": self.cloud_id,
-            "issueIdOrKey": real_id
-        })
+            return None
+        resp = self._get_issue(self.parse_id(issue_id))
+        if not resp:
+            return None
         comments = []
-        if resp and "fields" in resp:
-             c_block = resp["fields"].get("comment", {})
-             raw_comments = c_block.get("comments", [])
-             for c in raw_comments:
-                 comments.append({
-                     "author": c.get("author", {}).get("displayName", "Unknown"),
-                     "content": c.get("body"),
-                     "created": c.get("created"),
-                     "resolved": False 
-                 })
+        c_block = resp["fields"].get("comment", {})
+        raw_comments = c_block.get("comments", [])
+        for c in raw_comments:
+            comments.append({
+                "author": c.get("author", {}).get("displayName", "Unknown"),
+                "content": c.get("body"),
+                "created": c.get("created"),
+                "resolved": False
+            })
         return comments
 
-    def get_modified_time(self, metadata):
-        if not metadata:
-            return None
-        fields = metadata.get("fields", {})
-        return fields.get("updated")
+    def _raw_modified_time(self, raw):
+        return raw.get("fields", {}).get("updated")
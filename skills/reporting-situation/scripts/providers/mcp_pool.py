@@ -0,0 +1,257 @@
+import itertools
+import json
+import os
+import subprocess
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+class McpPoolError(Exception):
+    """A pooled MCP call failed (server down, protocol error, or timeout)."""
+
+
+class McpPoolTimeout(McpPoolError):
+    """A pooled MCP call got no response in time."""
+
+
+class StdioMcpSession:
+    """
+    One long-lived MCP server process speaking JSON-RPC over stdio.
+    Requests are multiplexed: many threads may call concurrently, and a reader
+    thread routes each response back to its caller by request id.
+    """
+
+    def __init__(self, name, command, args=None, env=None, timeout=300):
+        self.name = name
+        self.command = command
+        self.args = list(args or [])
+        self.env = env or {}
+        self.timeout = timeout
+        self.in_flight = 0
+        self._proc = None
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._eof = False  # reader saw EOF; nothing registered after that gets an answer
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ready = threading.Event()  # set once start() finished (or failed)
+
+    @property
+    def alive(self):
+        proc = self._proc
+        return not self._eof and proc is not None and proc.poll() is None
+
+    @property
+    def starting(self):
+        return not self._ready.is_set()
+
+    def start(self):
+        env = os.environ.copy()
+        env.update(self.env)
+        try:
+            self._proc = subprocess.Popen(
+                [self.command, *self.args],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                env=env,
+            )
+        except OSError as e:
+            self._ready.set()
+            raise McpPoolError(f"could not start {self.name}: {e}") from e
+        threading.Thread(target=self._read_loop, name=f"mcp-{self.name}", daemon=True).start()
+        try:
+            self._request("initialize", {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "reporting-situation", "version": "0.1.0"},
+            })
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        finally:
+            self._ready.set()
+
+    def _send(self, message):
+        line = json.dumps(message) + "\n"
+        # close() may clear _proc while other threads are sending
+        proc = self._proc
+        if proc is None:
+            raise McpPoolError(f"{self.name} is closed")
+        with self._write_lock:
+            try:
+                proc.stdin.write(line)
+                proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                raise McpPoolError(f"{self.name} stdin closed: {e}") from e
+
+    def _read_loop(self):
+        proc = self._proc
+        for line in proc.stdout:
+            try:
+                msg = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # servers occasionally log to stdout
+            if not isinstance(msg, dict):
+                continue
+            if "method" in msg:
+                self._handle_server_message(msg)
+                continue
+            with self._lock:
+                fut = self._pending.pop(msg.get("id"), None)
+            if fut is not None:
+                fut.set_result(msg)
+        # EOF: fail everything still waiting
+        with self._lock:
+            self._eof = True
+            pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            fut.set_exception(McpPoolError(f"{self.name} exited"))
+
+    def _handle_server_message(self, msg):
+        if "id" not in msg:
+            return  # notification (logging, progress, ...)
+        if msg["method"] == "ping":
+            self._send({"jsonrpc": "2.0", "id": msg["id"], "result": {}})
+        else:
+            self._send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": -32601, "message": "Method not found"}})
+
+    def request(self, method, params, timeout=None):
+        # Calls routed to a session that is still initializing wait for it.
+        self._ready.wait(timeout=timeout or self.timeout)
+        return self._request(method, params, timeout)
+
+    def _request(self, method, params, timeout=None):
+        if not self.alive:
+            raise McpPoolError(f"{self.name} is not running")
+        req_id = next(self._ids)
+        fut = Future()
+        with self._lock:
+            # Checked under the lock the reader drains with, so a request can't slip in after EOF
+            if self._eof:
+                raise McpPoolError(f"{self.name} exited")
+            self._pending[req_id] = fut
+        try:
+            self._send({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params})
+        except McpPoolError:
+            with self._lock:
+                self._pending.pop(req_id, None)
+            raise
+        try:
+            msg = fut.result(timeout=timeout or self.timeout)
+        except FutureTimeout:
+            with self._lock:
+                self._pending.pop(req_id, None)
+            raise McpPoolTimeout(f"{self.name} {method} timed out")
+        if "error" in msg:
+            raise McpPoolError(f"{self.name} {method}: {msg['error'].get('message', msg['error'])}")
+        return msg.get("result")
+
+    def call_tool(self, tool, args, timeout=None):
+        return self.request("tools/call", {"name": tool, "arguments": args}, timeout=timeout)
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+class McpPool:
+    """
+    Up to `sessions_per_server` long-lived stdio sessions per configured server.
+    Sessions start lazily; each call goes to the least busy live session, and a
+    new one is opened only when all existing ones are busy. Servers without a
+    `command` entry are not handled here (run_mcpc falls back to the mcpc CLI).
+    """
+
+    def __init__(self, servers, sessions_per_server=2, timeout=300):
+        self.servers = {name: cfg for name, cfg in (servers or {}).items() if cfg.get("command")}
+        self.sessions_per_server = max(1, sessions_per_server)
+        self.timeout = timeout
+        self._sessions = {name: [] for name in self.servers}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Builds a pool from config["mcp_pool"]; returns None when no servers are configured."""
+        pool_config = (config or {}).get("mcp_pool") or {}
+        if not pool_config.get("enabled", True):
+            return None
+        pool = cls(
+            pool_config.get("servers", {}),
+            sessions_per_server=pool_config.get("sessions_per_server", 2),
+            timeout=pool_config.get("timeout_seconds", 300),
+        )
+        return pool if pool.servers else None
+
+    def handles(self, session_name):
+        return session_name in self.servers
+
+    def _acquire(self, session_name):
+        with self._lock:
+            sessions = self._sessions[session_name]
+            sessions[:] = [s for s in sessions if s.alive or s.starting]
+            idle = [s for s in sessions if s.in_flight == 0]
+            if idle or len(sessions) >= self.sessions_per_server:
+                session = min(idle or sessions, key=lambda s: s.in_flight)
+                session.in_flight += 1
+                return session
+            cfg = self.servers[session_name]
+            session = StdioMcpSession(session_name, cfg["command"], cfg.get("args"), cfg.get("env"), self.timeout)
+            session.in_flight += 1
+            sessions.append(session)
+        try:
+            session.start()
+        except McpPoolError:
+            self._release(session)
+            with self._lock:
+                if session in self._sessions[session_name]:
+                    self._sessions[session_name].remove(session)
+            session.close()
+            raise
+        return session
+
+    def _release(self, session):
+        with self._lock:
+            session.in_flight -= 1
+
+    def call_tool(self, session_name, tool, args, timeout=None):
+        """Returns the raw MCP tools/call result; raises McpPoolError."""
+        session = self._acquire(session_name)
+        try:
+            return session.call_tool(tool, args, timeout=timeout)
+        finally:
+            self._release(session)
+
+    def ping(self, session_name, timeout=None):
+        """Pings a server, starting a session first if none is running; raises McpPoolError."""
+        session = self._acquire(session_name)
+        try:
+            session.request("ping", {}, timeout=timeout)
+        finally:
+            self._release(session)
+
+    def reset(self, session_name):
+        """Closes a server's sessions; the next call starts fresh ones."""
+        with self._lock:
+            sessions, self._sessions[session_name] = self._sessions[session_name], []
+        for session in sessions:
+            session.close()
+
+    def close(self):
+        with self._lock:
+            sessions = [s for group in self._sessions.values() for s in group]
+            self._sessions = {name: [] for name in self.servers}
+        for session in sessions:
+            session.close()
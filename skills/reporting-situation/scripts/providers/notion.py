@@ -13,6 +13,10 @@ class NotionProvider(ProviderBase):
     def _resolve_user(self, email_or_name):
         if email_or_name in self._user_cache:
             return self._user_cache[email_or_name]
+        found, u_id = self.cached_identity(f"user:{email_or_name}")
+        if found:
+            self._user_cache[email_or_name] = u_id
+            return u_id
 
         resp = run_mcpc(self.session, "notion-get-users", {
             "query": email_or_name
@@ -23,23 +27,26 @@ class NotionProvider(ProviderBase):
             results = resp.get("results", [])
         elif isinstance(resp, list):
             results = resp
+        else:
+            return None  # lookup failed; try again next time
         
+        u_id = None
         for u in results:
             u_email = u.get("email")
-            u_id = u.get("id")
             if u_email and u_email.lower() == email_or_name.lower():
-                self._user_cache[email_or_name] = u_id
-                return u_id
+                u_id = u.get("id")
+                break
             if u.get("name") and u.get("name").lower() == email_or_name.lower():
-                self._user_cache[email_or_name] = u_id
-                return u_id
+                u_id = u.get("id")
+                break
+        else:
+            if results:
+                u_id = results[0].get("id")
 
-        if results:
-            u_id = results[0].get("id")
-            self._user_cache[email_or_name] = u_id
-            return u_id
-        
-        return None
+        # No match at all is cached as None, so it isn't looked up every run
+        self._user_cache[email_or_name] = u_id
+        self.store_identity(f"user:{email_or_name}", u_id)
+        return u_id
 
     def search_collab_activity(self, name_or_email, days=7):
         user_id = self._resolve_user(name_or_email)
@@ -59,6 +66,7 @@ class NotionProvider(ProviderBase):
         return self._search(team_name, days=days)
 
     def _search(self, query, filters=None, days=7):
+        """SearchHits for a notion-search query, newer than `days`."""
         results = []
         args = {"query": query}
         if filters:
@@ -115,17 +123,12 @@ class NotionProvider(ProviderBase):
             if not url:
                 url = f"https://notion.so/{obj_id.replace('-', '')}"
 
-            results.append({
-                "id": self.build_id(obj_id),
-                "provider": self.name,
-                "type": item.get("object", "page"),
-                "title": title,
-                "url": url,
-                "metadata": item
-            })
+            author_ids = [u["id"] for u in (item.get("created_by"), item.get("last_edited_by")) if isinstance(u, dict) and u.get("id")]
+            hit = self.make_hit(obj_id, item.get("object", "page"), title, url, item, author_ids=author_ids)
+            results.append(hit)
         return results
 
-    def get_content(self, page_id):
+    def get_content(self, page_id, metadata=None):
         real_id = self.parse_id(page_id)
         resp = run_mcpc(self.session, "notion-fetch", {"id": real_id})
         
@@ -143,15 +146,17 @@ class NotionProvider(ProviderBase):
         
         return None
 
-    def get_comments(self, page_id):
+    def get_comments(self, page_id, metadata=None):
+        """Comment dicts, [] when there are none, or None if the call failed."""
         real_id = self.parse_id(page_id)
         resp = run_mcpc(self.session, "notion-get-comments", {"page_id": real_id})
         
-        results = []
         if isinstance(resp, dict):
             results = resp.get("results", [])
         elif isinstance(resp, list):
             results = resp
+        else:
+            return None
             
         comments = []
         for c in results:
@@ -168,7 +173,5 @@ class NotionProvider(ProviderBase):
             })
         return comments
 
-    def get_modified_time(self, metadata):
-        if not metadata:
-            return None
-        return metadata.get("last_edited_time") or metadata.get("timestamp")
+    def _raw_modified_time(self, raw):
+        return raw.get("last_edited_time") or raw.get("timestamp")
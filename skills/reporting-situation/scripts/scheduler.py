@@ -0,0 +1,130 @@
+import heapq
+import itertools
+import sys
+import threading
+import time
+
+# Lower runs first. Searches run ahead of processing within a tier, so
+# collaborator items are processed before broad topic searches start.
+PRIORITY_COLLABORATOR = 0
+PRIORITY_TEAM = 1
+PRIORITY_TOPIC = 2
+STAGE_SEARCH = 0
+STAGE_PROCESS = 1
+
+
+class PipelineScheduler:
+    """
+    One worker pool for the whole sweep: searches and item processing share a
+    priority queue, so items discovered by a search are processed while other
+    searches are still running.
+
+    - provider_limits: {provider: max concurrent jobs}; a worker skips queued
+      jobs for a provider at its limit and takes the next runnable one.
+    - deadline_seconds: after the deadline, queued jobs are dropped and run()
+      waits at most grace_seconds for the jobs already running.
+    Jobs may submit more jobs; run() returns once nothing is queued or running.
+    """
+
+    def __init__(self, max_workers=10, provider_limits=None, deadline_seconds=None, grace_seconds=30):
+        self.max_workers = max_workers
+        self.provider_limits = provider_limits or {}
+        self.deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        self.grace_seconds = grace_seconds
+        self._cond = threading.Condition()
+        self._queues = {}  # provider -> heap of (priority, stage, seq, provider, kind, func, args)
+        self._queued = 0
+        self._seq = itertools.count()
+        self._running = {}  # provider -> running jobs
+        self._active = 0  # queued + running
+        self.stats = {}  # kind -> {"done": n, "dropped": n}
+
+    @property
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def submit(self, priority, stage, provider, kind, func, *args):
+        with self._cond:
+            if self.expired:
+                self._count(kind, "dropped")
+                return
+            heapq.heappush(self._queues.setdefault(provider, []), (priority, stage, next(self._seq), provider, kind, func, args))
+            self._queued += 1
+            self._active += 1
+            self._cond.notify()
+
+    def _count(self, kind, outcome):
+        counts = self.stats.setdefault(kind, {"done": 0, "dropped": 0})
+        counts[outcome] += 1
+
+    def _pop_runnable(self):
+        """Best queued job among providers under their limit: compares heap heads only."""
+        best = None
+        for provider, queue in self._queues.items():
+            limit = self.provider_limits.get(provider)
+            if queue and (limit is None or self._running.get(provider, 0) < limit):
+                if best is None or queue[0] < self._queues[best][0]:
+                    best = provider
+        if best is None:
+            return None
+        self._queued -= 1
+        return heapq.heappop(self._queues[best])
+
+    def _drop_queued(self):
+        for queue in self._queues.values():
+            for job in queue:
+                self._count(job[4], "dropped")
+        self._active -= self._queued
+        self._queued = 0
+        self._queues = {}
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self.expired and self._queued:
+                        self._drop_queued()
+                        self._cond.notify_all()
+                    job = self._pop_runnable()
+                    if job is not None:
+                        break
+                    if self._active == 0:
+                        return
+                    timeout = None if self.deadline is None else max(self.deadline - time.monotonic(), 0.1)
+                    self._cond.wait(timeout=timeout)
+                _, _, _, provider, kind, func, args = job
+                self._running[provider] = self._running.get(provider, 0) + 1
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"[ERROR] {kind} job failed: {e}", file=sys.stderr)
+            finally:
+                with self._cond:
+                    self._running[provider] -= 1
+                    self._active -= 1
+                    self._count(kind, "done")
+                    self._cond.notify_all()
+
+    def run(self):
+        """Runs until all jobs finish, or until the deadline (plus grace) passes."""
+        workers = [
+            threading.Thread(target=self._worker, name=f"sweep-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            if self.deadline is None:
+                w.join()
+            else:
+                w.join(timeout=max(self.deadline + self.grace_seconds - time.monotonic(), 0))
+        with self._cond:
+            still_running = sum(self._running.values())
+        return still_running == 0
+
+    def report(self):
+        """One line per job kind: done/dropped counts."""
+        return [
+            f"{kind}: {counts['done']} done, {counts['dropped']} dropped"
+            for kind, counts in sorted(self.stats.items())
+        ]
@@ -0,0 +1,131 @@
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from providers.hit import SearchHit
+
+# Bumped when the stored result shape changes; entries of other versions are misses.
+# 2: SearchHit dicts (version 1 stored raw provider results, without modified_time).
+FORMAT_VERSION = 2
+
+
+def _encode(results):
+    """SearchHits (or {key: [SearchHit]} from batched searches) to JSON-ready dicts."""
+    if isinstance(results, dict):
+        return {key: _encode(hits) for key, hits in results.items()}
+    return [hit.to_dict() for hit in results]
+
+
+def _decode(results):
+    if isinstance(results, dict):
+        return {key: _decode(hits) for key, hits in results.items()}
+    return [SearchHit.from_dict(hit) for hit in results]
+
+
+class SearchCache:
+    """
+    Caches provider search results between runs.
+    Keyed by (provider, method, normalized args, UTC day bucket) and stored next to
+    tracker.json as search_cache.json. Entries older than max_age_hours are ignored
+    and pruned on save. Empty results are not cached (errors also come back empty),
+    nor are batched results whose lists are all empty. Keys are case-insensitive, so
+    batched results keep the key casing of the run that stored them.
+    Results are SearchHits, stored as plain dicts. Off unless max_age_hours > 0:
+    cached modified times are as old as the entry, so edits in that window are missed.
+    """
+
+    def __init__(self, data_dir, max_age_hours=0):
+        self.path = Path(data_dir) / "search_cache.json"
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+        self.entries = self._load()
+        self.stats = {}  # provider -> {"hits": n, "misses": n}
+
+    def _load(self):
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                return {}
+        return {}
+
+    @property
+    def enabled(self):
+        return self.max_age_hours > 0
+
+    @staticmethod
+    def normalize(value):
+        if isinstance(value, str):
+            return " ".join(value.lower().split())
+        if isinstance(value, (list, tuple, set)):
+            return sorted((SearchCache.normalize(v) for v in value), key=json.dumps)
+        if isinstance(value, dict):
+            return {k: SearchCache.normalize(v) for k, v in sorted(value.items())}
+        return value
+
+    def make_key(self, provider, method, args, now=None):
+        now = now or datetime.now(timezone.utc)
+        return json.dumps([provider, method, self.normalize(list(args)), now.strftime("%Y-%m-%d")])
+
+    def _age_hours(self, entry, now):
+        stored = datetime.fromisoformat(entry["stored_at"])
+        return (now - stored).total_seconds() / 3600
+
+    def _usable(self, entry, now):
+        return bool(entry) and entry.get("format") == FORMAT_VERSION and self._age_hours(entry, now) <= self.max_age_hours
+
+    def get(self, provider, method, args):
+        """Returns cached results or None. Counts hits/misses per provider."""
+        if not self.enabled:
+            return None
+        now = datetime.now(timezone.utc)
+        key = self.make_key(provider, method, args, now)
+        with self._lock:
+            counts = self.stats.setdefault(provider, {"hits": 0, "misses": 0})
+            entry = self.entries.get(key)
+            if self._usable(entry, now):
+                counts["hits"] += 1
+                return _decode(entry["results"])
+            counts["misses"] += 1
+            return None
+
+    def put(self, provider, method, args, results):
+        if not self.enabled or not results:
+            return
+        if isinstance(results, dict) and all(not hits for hits in results.values()):
+            return
+        now = datetime.now(timezone.utc)
+        key = self.make_key(provider, method, args, now)
+        with self._lock:
+            self.entries[key] = {"stored_at": now.isoformat(), "format": FORMAT_VERSION, "results": _encode(results)}
+
+    def call(self, search_func, args):
+        """Runs a bound provider search method through the cache."""
+        provider = getattr(search_func.__self__, "name", "")
+        method = search_func.__name__
+        cached = self.get(provider, method, args)
+        if cached is not None:
+            return cached
+        results = search_func(*args)
+        self.put(provider, method, args, results)
+        return results
+
+    def save(self):
+        if not self.enabled:
+            return
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            self.entries = {k: v for k, v in self.entries.items() if self._usable(v, now)}
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f)
+
+    def report(self):
+        """One line per provider: hits/lookups and hit rate."""
+        lines = []
+        for provider, counts in sorted(self.stats.items()):
+            total = counts["hits"] + counts["misses"]
+            rate = (counts["hits"] / total * 100) if total else 0
+            lines.append(f"{provider}: {counts['hits']}/{total} cached ({rate:.0f}%)")
+        return lines
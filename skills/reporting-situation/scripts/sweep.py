@@ -0,0 +1,41 @@
+class SweepResults:
+    """
+    Accumulates search results from the sweep.
+
+    - items: unique_id -> provider, in discovery order (O(1) membership/dedupe)
+    - item_tags: unique_id -> set of tags
+    - tag_index: tag -> unique_ids in discovery order (inverted index for the report)
+
+    Not locked: callers serialise add() (run_search_task holds the sweep lock).
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.item_tags = {}
+        self.tag_index = {}
+
+    def add(self, unique_id, provider, tag):
+        """Records a hit for a tag. Returns True the first time unique_id is seen."""
+        is_new = unique_id not in self.items
+        if is_new:
+            self.items[unique_id] = provider
+            self.item_tags[unique_id] = set()
+        tags = self.item_tags[unique_id]
+        if tag not in tags:
+            tags.add(tag)
+            # dict as an insertion-ordered set
+            self.tag_index.setdefault(tag, {})[unique_id] = None
+        return is_new
+
+    def ids_for_tag(self, tag):
+        return list(self.tag_index.get(tag, ()))
+
+    def __contains__(self, unique_id):
+        return unique_id in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        """Yields (unique_id, provider) in discovery order."""
+        return iter(self.items.items())
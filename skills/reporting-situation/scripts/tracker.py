@@ -1,8 +1,58 @@
 import json
+import os
+import sqlite3
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
+from content_store import ContentStore
+
+LOCK_STRIPES = 32
+
+# Fields the report needs for every item; raw_metadata is heavy and loaded on demand.
+HOT_FIELDS = (
+    "type", "title", "url", "first_seen", "last_seen", "discovery_count",
+    "summary", "summary_updated", "discussion_summary", "discussion_updated",
+    "last_content_fetch", "last_comment_fetch",
+)
+
+
+class ItemSummary:
+    """
+    Read-only projection of an item without raw_metadata (see Tracker.get_summary).
+    Supports item["title"] and item.get("title") like the full item dicts.
+    """
+
+    __slots__ = ("id", "tags") + HOT_FIELDS
+
+    def __init__(self, unique_id, fields, tags=()):
+        self.id = unique_id
+        self.tags = list(tags)
+        for name in HOT_FIELDS:
+            setattr(self, name, fields.get(name))
+
+    def get(self, name, default=None):
+        value = getattr(self, name, None) if name in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
 
 class Tracker:
+    """
+    Persistent item tracker, safe to share between worker threads.
+    Item mutations take one of LOCK_STRIPES per-item locks; inserts and
+    snapshots take the structure lock. With start_background_writer(), pending
+    changes are flushed every few seconds so an interrupted run keeps its
+    progress; save() flushes as well.
+    raw_metadata is kept out of tracker.json, in tracker_metadata.json, which
+    is only read the first time stored metadata is needed (get_item or
+    get_metadata of an item not updated this run) or written (flush).
+    update_item() buffers new metadata instead, and get_summary() never reads it.
+    """
+
     def __init__(self, data_dir=None):
         if data_dir is None:
             # Default to a 'data' folder in the skill directory
@@ -12,17 +62,50 @@ class Tracker:
         
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.tracker_file = self.data_dir / "tracker.json"
+        self.metadata_file = self.data_dir / "tracker_metadata.json"
+        self._metadata = None  # unique_id -> raw_metadata, loaded lazily
+        self._metadata_pending = {}  # written before the store was loaded
+        self._metadata_dirty = False
+        self._lock = threading.RLock()  # items/mappings dict structure
+        self._flush_lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._dirty = False
+        self._writer = None
+        self._stop = threading.Event()
+        self.content = ContentStore(self.data_dir / "content")
         self.data = self._load()
 
     def _load(self):
         if self.tracker_file.exists():
             try:
                 with open(self.tracker_file, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
             except json.JSONDecodeError:
                 return self._default_structure()
+            # Older tracker.json files carry raw_metadata inline; move it out
+            inline = {uid: item.pop("raw_metadata") for uid, item in data.get("items", {}).items() if "raw_metadata" in item}
+            if inline:
+                self._load_metadata().update(inline)
+                self._metadata_dirty = self._dirty = True
+            return data
         return self._default_structure()
 
+    def _load_metadata(self):
+        with self._lock:
+            if self._metadata is None:
+                self._metadata = {}
+                if self.metadata_file.exists():
+                    try:
+                        with open(self.metadata_file, 'r') as f:
+                            self._metadata = json.load(f)
+                    except json.JSONDecodeError:
+                        pass
+                if self._metadata_pending:
+                    self._metadata.update(self._metadata_pending)
+                    self._metadata_pending = {}
+                    self._metadata_dirty = True
+            return self._metadata
+
     def _default_structure(self):
         return {
             "items": {},  # unique_id -> metadata
@@ -30,13 +113,92 @@ class Tracker:
             "last_run": None
         }
 
+    def _item_lock(self, unique_id):
+        return self._stripes[hash(unique_id) % LOCK_STRIPES]
+
+    def start_background_writer(self, interval=10):
+        """Flushes pending changes every `interval` seconds until close()."""
+        if self._writer is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.flush()
+
+        self._writer = threading.Thread(target=loop, name="tracker-writer", daemon=True)
+        self._writer.start()
+
+    def flush(self):
+        """Writes pending changes to tracker.json (atomic replace)."""
+        self.content.flush()
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                if self._metadata_pending:
+                    self._load_metadata()  # merge buffered metadata into the file's
+                self._dirty = False
+                # Holding every stripe gives a consistent snapshot of all items
+                for stripe in self._stripes:
+                    stripe.acquire()
+                try:
+                    payload = json.dumps(self.data, indent=2)
+                    metadata_payload = json.dumps(self._metadata) if self._metadata_dirty else None
+                    self._metadata_dirty = False
+                finally:
+                    for stripe in self._stripes:
+                        stripe.release()
+            if metadata_payload is not None:
+                self._replace(self.metadata_file, metadata_payload)
+            self._replace(self.tracker_file, payload)
+
+    def _replace(self, path, payload):
+        tmp_file = path.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_file, path)
+
     def save(self):
-        self.data["last_run"] = datetime.now(timezone.utc).isoformat()
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        with self._lock:
+            self.data["last_run"] = datetime.now(timezone.utc).isoformat()
+            self._dirty = True
+        self.flush()
+
+    def close(self):
+        """Stops the background writer, flushes anything still pending and releases the content lock."""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        self.content.close()
 
     def get_item(self, unique_id):
-        return self.data["items"].get(unique_id)
+        """Full item (a copy), including raw_metadata when there is any."""
+        item = self.data["items"].get(unique_id)
+        if item is None:
+            return None
+        metadata = self.get_metadata(unique_id)
+        with self._item_lock(unique_id):
+            item = dict(item)
+        if metadata is not None:
+            item["raw_metadata"] = metadata
+        return item
+
+    def get_summary(self, unique_id):
+        """Hot fields and tags only, as an ItemSummary; doesn't load metadata."""
+        item = self.data["items"].get(unique_id)
+        if item is None:
+            return None
+        with self._item_lock(unique_id):
+            return ItemSummary(unique_id, item, item.get("tags", ()))
+
+    def get_metadata(self, unique_id):
+        with self._lock:
+            if unique_id in self._metadata_pending:
+                return self._metadata_pending[unique_id]
+        return self._load_metadata().get(unique_id)
 
     def get_mapping(self, category, name):
         """
@@ -51,98 +213,125 @@ class Tracker:
         Caches a mapping.
         """
         key = f"{category}:{name}"
-        self.data["mappings"][key] = mapping_data
+        with self._lock:
+            self.data["mappings"][key] = mapping_data
+            self._dirty = True
+
+    def get_mappings(self, category):
+        """All mappings in a category, as {name: mapping_data}."""
+        prefix = f"{category}:"
+        with self._lock:
+            return {k[len(prefix):]: v for k, v in self.data["mappings"].items() if k.startswith(prefix)}
 
     def update_item(self, unique_id, item_type, title, url, metadata=None):
         """
-        Updates an item or creates it. Returns (is_new, item_dict).
+        Updates an item or creates it. Returns (is_new, ItemSummary); fetch
+        metadata separately (get_metadata) for the items that need it.
         """
         now = datetime.now(timezone.utc).isoformat()
         is_new = False
         
-        if unique_id not in self.data["items"]:
-            is_new = True
-            self.data["items"][unique_id] = {
-                "type": item_type,
-                "first_seen": now,
-                "discovery_count": 0,
-                "summary": None,
-                "summary_updated": None,
-                "discussion_summary": None,
-                "discussion_updated": None,
-                "last_content_fetch": None,
-                "last_comment_fetch": None
-            }
-        
-        item = self.data["items"][unique_id]
-        item["title"] = title
-        item["url"] = url
-        item["last_seen"] = now
-        item["discovery_count"] += 1
+        with self._lock:
+            if unique_id not in self.data["items"]:
+                is_new = True
+                self.data["items"][unique_id] = {
+                    "type": item_type,
+                    "first_seen": now,
+                    "discovery_count": 0,
+                    "summary": None,
+                    "summary_updated": None,
+                    "discussion_summary": None,
+                    "discussion_updated": None,
+                    "last_content_fetch": None,
+                    "last_comment_fetch": None
+                }
+            item = self.data["items"][unique_id]
+            if metadata:
+                # Buffered until the store is loaded, so a sweep never has to read it
+                store = self._metadata if self._metadata is not None else self._metadata_pending
+                store[unique_id] = metadata
+                self._metadata_dirty = True
         
-        if metadata:
-            item["raw_metadata"] = metadata
+        with self._item_lock(unique_id):
+            item["title"] = title
+            item["url"] = url
+            item["last_seen"] = now
+            item["discovery_count"] += 1
+            self._dirty = True
             
-        return is_new, item
+        return is_new, self.get_summary(unique_id)
+
+    def tag_item(self, unique_id, tag):
+        """Records that a sweep tag (person/topic/team) surfaced this item."""
+        item = self.data["items"].get(unique_id)
+        if item is None:
+            return
+        with self._item_lock(unique_id):
+            if tag not in item.setdefault("tags", []):
+                item["tags"].append(tag)
+                self._dirty = True
+
+    def items_by_tag(self, tag):
+        with self._lock:
+            items = list(self.data["items"].items())
+        return [uid for uid, item in items if tag in item.get("tags", ())]
+
+    def items_seen_since(self, iso_timestamp):
+        with self._lock:
+            items = list(self.data["items"].items())
+        return [uid for uid, item in items if (item.get("last_seen") or "") >= iso_timestamp]
+
+    def _set_fields(self, unique_id, **fields):
+        item = self.data["items"].get(unique_id)
+        if item is None:
+            return
+        with self._item_lock(unique_id):
+            item.update(fields)
+            self._dirty = True
 
     def update_summary(self, unique_id, summary_text):
-        if unique_id in self.data["items"]:
-            self.data["items"][unique_id]["summary"] = summary_text
-            self.data["items"][unique_id]["summary_updated"] = datetime.now(timezone.utc).isoformat()
+        self._set_fields(unique_id, summary=summary_text, summary_updated=datetime.now(timezone.utc).isoformat())
 
     def update_discussion_summary(self, unique_id, summary_text):
-        if unique_id in self.data["items"]:
-            self.data["items"][unique_id]["discussion_summary"] = summary_text
-            self.data["items"][unique_id]["discussion_updated"] = datetime.now(timezone.utc).isoformat()
-            
+        self._set_fields(unique_id, discussion_summary=summary_text, discussion_updated=datetime.now(timezone.utc).isoformat())
+
     def touch_content_fetch(self, unique_id):
-        if unique_id in self.data["items"]:
-            self.data["items"][unique_id]["last_content_fetch"] = datetime.now(timezone.utc).isoformat()
+        self._set_fields(unique_id, last_content_fetch=datetime.now(timezone.utc).isoformat())
 
     def touch_comment_fetch(self, unique_id):
-        if unique_id in self.data["items"]:
-            self.data["items"][unique_id]["last_comment_fetch"] = datetime.now(timezone.utc).isoformat()
+        self._set_fields(unique_id, last_comment_fetch=datetime.now(timezone.utc).isoformat())
 
-    def get_content_path(self, unique_id, timestamp=None):
-        """
-        Returns the path where content should be stored.
-        Organizes by Week: data/content/2026-W05/google_123.md
-        """
-        if not timestamp:
-            timestamp = datetime.now(timezone.utc)
-        elif isinstance(timestamp, str):
-            try:
-                # Handle ISO format with potential timezone info
-                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            except ValueError:
-                timestamp = datetime.now(timezone.utc)
-                
-        # Get ISO calendar year and week
-        iso_year, iso_week, _ = timestamp.isocalendar()
-        week_str = f"{iso_year}-W{iso_week:02d}"
-        
-        safe_id = unique_id.replace(":", "_").replace("/", "_")
-        folder = self.data_dir / "content" / week_str
-        folder.mkdir(parents=True, exist_ok=True)
-        
-        return folder / f"{safe_id}.md"
+    def get_content_path(self, unique_id):
+        """Path of the item's current content (see ContentStore), or None if never saved."""
+        return self.content.current_path(unique_id)
 
     def save_content(self, unique_id, content, timestamp=None):
-        path = self.get_content_path(unique_id, timestamp)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        """
+        Stores content as the item's current version; identical content is not
+        rewritten. timestamp is the remote modified time, recorded on the version.
+        """
+        path, _ = self.content.put(unique_id, content, modified=timestamp)
         return str(path)
 
-    def is_stale(self, unique_id, remote_modified_str):
+    def item_ids(self):
+        with self._lock:
+            return list(self.data["items"])
+
+    def compact_content(self, keep=1, dry_run=False):
+        """Prunes superseded content versions; see ContentStore.compact."""
+        return self.content.compact(keep=keep, known_ids=self.item_ids(), dry_run=dry_run)
+
+    def is_stale(self, unique_id, remote_modified_str, hours=24, fetch_field="last_content_fetch"):
         """
-        Returns True if we should re-fetch content.
-        Compares remote modification time (if available) with local fetch time.
+        Returns True if we should re-fetch content (or comments, via fetch_field).
+        Compares remote modification time (if available) with local fetch time,
+        then falls back to refreshing anything fetched more than `hours` ago.
         """
-        item = self.get_item(unique_id)
+        item = self.get_summary(unique_id)
         if not item:
             return True
             
-        last_fetch_str = item.get("last_content_fetch")
+        last_fetch_str = item.get(fetch_field)
         if not last_fetch_str:
             return True
             
@@ -171,14 +360,14 @@ class Tracker:
             except ValueError:
                 pass # Fallback to time-based check if parsing fails
         
-        # Default: Refresh if older than 24h
-        return self.should_refresh_content(unique_id, hours=24)
+        # Default: Refresh if older than `hours`
+        return self.should_refresh_content(unique_id, hours=hours, fetch_field=fetch_field)
 
-    def should_refresh_content(self, unique_id, hours=24):
-        item = self.get_item(unique_id)
+    def should_refresh_content(self, unique_id, hours=24, fetch_field="last_content_fetch"):
+        item = self.get_summary(unique_id)
         if not item:
             return True
-        last_fetch_str = item.get("last_content_fetch")
+        last_fetch_str = item.get(fetch_field)
         if not last_fetch_str:
             return True
         
@@ -193,3 +382,246 @@ class Tracker:
             return (diff.total_seconds() / 3600) > hours
         except ValueError:
             return True
+
+
+ITEM_COLUMNS = HOT_FIELDS + ("raw_metadata",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    type TEXT,
+    title TEXT,
+    url TEXT,
+    first_seen TEXT,
+    last_seen TEXT,
+    discovery_count INTEGER NOT NULL DEFAULT 0,
+    summary TEXT,
+    summary_updated TEXT,
+    discussion_summary TEXT,
+    discussion_updated TEXT,
+    last_content_fetch TEXT,
+    last_comment_fetch TEXT,
+    raw_metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS items_last_seen ON items(last_seen);
+CREATE TABLE IF NOT EXISTS item_tags (
+    id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (id, tag)
+);
+CREATE INDEX IF NOT EXISTS item_tags_tag ON item_tags(tag);
+CREATE TABLE IF NOT EXISTS mappings (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class SqliteTracker(Tracker):
+    """
+    Tracker API backed by data/tracker.db (SQLite, WAL).
+    Every mutation is a per-item upsert on one shared connection (serialised by
+    the tracker lock). Without a background writer each upsert commits on its
+    own; with one, upserts accumulate in a transaction that the writer commits
+    every few seconds. On first open, an existing tracker.json is imported (and
+    left in place as a backup).
+    `self.data` only carries "last_run" for compatibility; items and mappings
+    live in the database. get_summary() selects the HOT_FIELDS columns only,
+    so raw_metadata is never read or decoded for it.
+    """
+
+    def __init__(self, data_dir=None):
+        super().__init__(data_dir)
+
+    def _load(self):
+        self.db_file = self.data_dir / "tracker.db"
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if self.tracker_file.exists() and self._get_meta("imported_json") is None:
+            self.import_json(self.tracker_file)
+        return {"last_run": self._get_meta("last_run")}
+
+    def _read(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _write(self, sql, params=()):
+        with self._lock:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self.conn.execute(sql, params)
+            if self._writer is None:
+                self.conn.execute("COMMIT")
+
+    def _get_meta(self, key):
+        rows = self._read("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0]["value"] if rows else None
+
+    def _set_meta(self, key, value):
+        self._write("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def import_json(self, json_path):
+        """Imports items, mappings and last_run from a tracker.json file. Returns item count."""
+        with open(json_path, 'r') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                data = self._default_structure()
+        items = data.get("items", {})
+        with self._lock:
+            self.flush()
+            self.conn.execute("BEGIN")
+            try:
+                for unique_id, item in items.items():
+                    self._write_item(unique_id, item)
+                    for tag in item.get("tags", []):
+                        self.conn.execute("INSERT OR IGNORE INTO item_tags (id, tag) VALUES (?, ?)", (unique_id, tag))
+                for key, value in data.get("mappings", {}).items():
+                    self.conn.execute("INSERT OR REPLACE INTO mappings (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+                if data.get("last_run"):
+                    self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_run', ?)", (data["last_run"],))
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported_json', ?)", (str(json_path),))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return len(items)
+
+    def _write_item(self, unique_id, item):
+        values = [item.get(col) for col in ITEM_COLUMNS]
+        meta_idx = ITEM_COLUMNS.index("raw_metadata")
+        if values[meta_idx] is not None:
+            values[meta_idx] = json.dumps(values[meta_idx])
+        values[ITEM_COLUMNS.index("discovery_count")] = item.get("discovery_count") or 0
+        placeholders = ", ".join("?" for _ in ITEM_COLUMNS)
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO items (id, {', '.join(ITEM_COLUMNS)}) VALUES (?, {placeholders})",
+            (unique_id, *values),
+        )
+
+    def _row_to_item(self, row):
+        item = {col: row[col] for col in ITEM_COLUMNS}
+        if item["raw_metadata"] is not None:
+            item["raw_metadata"] = json.loads(item["raw_metadata"])
+        else:
+            del item["raw_metadata"]
+        return item
+
+    def flush(self):
+        """Commits the open batch, if any."""
+        self.content.flush()
+        with self._lock:
+            if self.conn.in_transaction:
+                self.conn.execute("COMMIT")
+
+    def save(self):
+        self.data["last_run"] = datetime.now(timezone.utc).isoformat()
+        self._set_meta("last_run", self.data["last_run"])
+        with self._lock:
+            self.flush()
+            self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self):
+        super().close()
+        with self._lock:
+            self.conn.close()
+
+    def get_item(self, unique_id):
+        with self._lock:
+            rows = self._read("SELECT * FROM items WHERE id = ?", (unique_id,))
+            if not rows:
+                return None
+            item = self._row_to_item(rows[0])
+            tags = self._read("SELECT tag FROM item_tags WHERE id = ?", (unique_id,))
+        if tags:
+            item["tags"] = [t["tag"] for t in tags]
+        return item
+
+    def get_summary(self, unique_id):
+        with self._lock:
+            rows = self._read(f"SELECT {', '.join(HOT_FIELDS)} FROM items WHERE id = ?", (unique_id,))
+            if not rows:
+                return None
+            tags = self._read("SELECT tag FROM item_tags WHERE id = ?", (unique_id,))
+        return ItemSummary(unique_id, dict(rows[0]), [t["tag"] for t in tags])
+
+    def get_metadata(self, unique_id):
+        rows = self._read("SELECT raw_metadata FROM items WHERE id = ?", (unique_id,))
+        if not rows or rows[0]["raw_metadata"] is None:
+            return None
+        return json.loads(rows[0]["raw_metadata"])
+
+    def get_mapping(self, category, name):
+        rows = self._read("SELECT value FROM mappings WHERE key = ?", (f"{category}:{name}",))
+        return json.loads(rows[0]["value"]) if rows else None
+
+    def set_mapping(self, category, name, mapping_data):
+        self._write(
+            "INSERT OR REPLACE INTO mappings (key, value) VALUES (?, ?)",
+            (f"{category}:{name}", json.dumps(mapping_data)),
+        )
+
+    def get_mappings(self, category):
+        prefix = f"{category}:"
+        # substr() rather than LIKE: names may contain % or _
+        rows = self._read("SELECT key, value FROM mappings WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+        return {row["key"][len(prefix):]: json.loads(row["value"]) for row in rows}
+
+    def update_item(self, unique_id, item_type, title, url, metadata=None):
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            is_new = self.get_summary(unique_id) is None
+            self._write(
+                """
+                INSERT INTO items (id, type, title, url, first_seen, last_seen, discovery_count, raw_metadata)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title,
+                    url = excluded.url,
+                    last_seen = excluded.last_seen,
+                    discovery_count = items.discovery_count + 1,
+                    raw_metadata = COALESCE(excluded.raw_metadata, items.raw_metadata)
+                """,
+                (unique_id, item_type, title, url, now, now, json.dumps(metadata) if metadata else None),
+            )
+            return is_new, self.get_summary(unique_id)
+
+    def tag_item(self, unique_id, tag):
+        self._write("INSERT OR IGNORE INTO item_tags (id, tag) VALUES (?, ?)", (unique_id, tag))
+
+    def items_by_tag(self, tag):
+        rows = self._read("SELECT id FROM item_tags WHERE tag = ?", (tag,))
+        return [row["id"] for row in rows]
+
+    def items_seen_since(self, iso_timestamp):
+        rows = self._read("SELECT id FROM items WHERE last_seen >= ?", (iso_timestamp,))
+        return [row["id"] for row in rows]
+
+    def item_ids(self):
+        return [row["id"] for row in self._read("SELECT id FROM items")]
+
+    def _set_fields(self, unique_id, **fields):
+        assignments = ", ".join(f"{col} = ?" for col in fields)
+        self._write(f"UPDATE items SET {assignments} WHERE id = ?", (*fields.values(), unique_id))
+
+    def update_summary(self, unique_id, summary_text):
+        self._set_fields(unique_id, summary=summary_text, summary_updated=datetime.now(timezone.utc).isoformat())
+
+    def update_discussion_summary(self, unique_id, summary_text):
+        self._set_fields(unique_id, discussion_summary=summary_text, discussion_updated=datetime.now(timezone.utc).isoformat())
+
+    def touch_content_fetch(self, unique_id):
+        self._set_fields(unique_id, last_content_fetch=datetime.now(timezone.utc).isoformat())
+
+    def touch_comment_fetch(self, unique_id):
+        self._set_fields(unique_id, last_comment_fetch=datetime.now(timezone.utc).isoformat())
+
+
+def open_tracker(data_dir=None, backend="json"):
+    """Returns a Tracker for the given backend ("json" or "sqlite")."""
+    if backend == "sqlite":
+        return SqliteTracker(data_dir)
+    if backend != "json":
+        raise ValueError(f"Unknown tracker backend: {backend}")
+    return Tracker(data_dir)
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+"""
+Asyncio execution core for RLM runs.
+
+One event loop multiplexes many in-flight sub-calls: each sub-call is a child
+process started with asyncio.create_subprocess_exec (via `sh -c`, so existing
+shell command templates keep working), bounded by a shared semaphore, with
+per-call timeouts enforced in-process instead of through `timeout`. All log
+lines and artifact files go through a single AsyncWriter task. An executor,
+rate limiter and result cache can be shared by several runs (batch_runner.py).
+"""
+
+import asyncio
+import hashlib
+import os
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from log_utils import append_log
+from subcall_runner import build_subcall_cmd, build_subcall_env
+
+TIMEOUT_RC = 124  # same exit code as coreutils `timeout`
+
+
+async def run_subcall_async(
+    cmd_template: str,
+    model: str,
+    question: str,
+    prompt_path: Path,
+    dry_run: bool,
+    timeout: Optional[float],
+    approval_flags: str,
+    with_network: bool,
+    extra_env: Optional[dict],
+) -> Tuple[int, str]:
+    """Async counterpart of subcall_runner.run_subcall; kills the child on timeout or cancellation."""
+    cmd = build_subcall_cmd(cmd_template, model, question, prompt_path, approval_flags, with_network)
+    if dry_run:
+        return 0, f"[dry-run] {cmd}"
+    spawn = asyncio.ensure_future(
+        asyncio.create_subprocess_exec(
+            "/bin/sh",
+            "-c",
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=build_subcall_env(extra_env),
+            start_new_session=True,
+        )
+    )
+    try:
+        proc = await asyncio.shield(spawn)
+    except asyncio.CancelledError:
+        # Finish spawning so the whole process group can be killed; a cancelled
+        # spawn would otherwise wait on pipes held open by the CLI's children.
+        await _kill(await spawn)
+        raise
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout or None)
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        return TIMEOUT_RC, f"[timeout after {timeout}s] {cmd}"
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+    out = stdout.decode("utf-8", errors="replace")
+    err = stderr.decode("utf-8", errors="replace")
+    return proc.returncode or 0, out if out else err
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill the shell and everything it spawned (the CLI holds our pipes open otherwise)."""
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+class AsyncWriter:
+    """
+    Single consumer for log lines and artifact files.
+
+    Producers enqueue writes and get back a future; await it when the file must
+    exist before continuing (e.g. a prompt file read by `cat {prompt_path}`),
+    otherwise fire and forget. Writes happen in enqueue order.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue[Optional[Tuple[Callable[..., Any], tuple, asyncio.Future]]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncWriter":
+        self._task = asyncio.create_task(self._drain())
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self._queue.put(None)
+        if self._task:
+            await self._task
+
+    def write_text(self, path: Path, text: str) -> asyncio.Future:
+        return self._submit(_write_text, Path(path), text)
+
+    def append_log(self, path: Path, entry: Dict[str, Any]) -> asyncio.Future:
+        return self._submit(append_log, Path(path), entry)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((fn, args, fut))
+        return fut
+
+    async def _drain(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            fn, args, fut = item
+            try:
+                await asyncio.to_thread(fn, *args)
+            except Exception as e:  # keep draining; surface the error to any waiter
+                print(f"[WARN] write failed for {args[0]}: {e}", file=sys.stderr)
+                if not fut.done():
+                    fut.set_exception(e)
+                    fut.exception()  # mark retrieved for fire-and-forget writes
+                continue
+            if not fut.done():
+                fut.set_result(None)
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class RateLimiter:
+    """Spaces sub-call starts evenly so a run never exceeds `per_minute` starts (0 disables)."""
+
+    def __init__(self, per_minute: float = 0) -> None:
+        self.interval = 60.0 / per_minute if per_minute and per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_start - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = max(loop.time(), self._next_start) + self.interval
+
+
+class SubcallCache:
+    """
+    Successful sub-call outputs keyed by (template, model, question, flags, prompt text).
+
+    The prompt *path* is not part of the key, so identical slices from different
+    runs/corpora share one entry. Concurrent requests for the same key share a
+    single in-flight call. With `cache_dir`, entries persist across runs.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: Dict[str, str] = {}
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(cmd_template: str, model: str, question: str, approval_flags: str, with_network: bool, prompt_path: Path) -> str:
+        h = hashlib.sha256()
+        for part in (cmd_template, model, question, approval_flags.strip(), str(with_network)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(Path(prompt_path).read_bytes())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if key in self._memory:
+            return self._memory[key]
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.txt"
+            if path.is_file():
+                self._memory[key] = path.read_text(encoding="utf-8")
+                return self._memory[key]
+        return None
+
+    def put(self, key: str, out: str) -> None:
+        self._memory[key] = out
+        if self.cache_dir:
+            (self.cache_dir / f"{key}.txt").write_text(out, encoding="utf-8")
+
+
+class SubcallExecutor:
+    """Bounded-concurrency sub-call executor shared by every slice in a run."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[SubcallCache] = None,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+
+    async def run(
+        self,
+        cmd_template: str,
+        model: str,
+        question: str,
+        prompt_path: Path,
+        dry_run: bool,
+        timeout: Optional[float],
+        approval_flags: str,
+        with_network: bool,
+        extra_env: Optional[dict],
+        retry_count: int = 0,
+        retry_wait: float = 0,
+    ) -> Tuple[int, str]:
+        if self.cache is None or dry_run:
+            return await self._run_with_retries(
+                cmd_template, model, question, prompt_path, dry_run, timeout,
+                approval_flags, with_network, extra_env, retry_count, retry_wait,
+            )
+        key = SubcallCache.key(cmd_template, model, question, approval_flags, with_network, prompt_path)
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.hits += 1
+                return 0, cached
+            pending = self.cache.in_flight.get(key)
+            if pending is None:
+                break
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The owner was cancelled (its run stopped early), not us: run the call ourselves
+                task = asyncio.current_task()
+                if pending.cancelled() and not (task and task.cancelling()):
+                    continue
+                raise
+            self.cache.hits += 1
+            return result
+        self.cache.misses += 1
+        fut = asyncio.get_running_loop().create_future()
+        self.cache.in_flight[key] = fut
+        try:
+            code, out = await self._run_with_retries(
+                cmd_template, model, question, prompt_path, dry_run, timeout,
+                approval_flags, with_network, extra_env, retry_count, retry_wait,
+            )
+        except asyncio.CancelledError:
+            # Not a failure of the call: waiters retry instead of inheriting the cancellation
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()
+            raise
+        finally:
+            self.cache.in_flight.pop(key, None)
+        if code == 0:
+            self.cache.put(key, out)
+        fut.set_result((code, out))
+        return code, out
+
+    async def _run_with_retries(
+        self,
+        cmd_template: str,
+        model: str,
+        question: str,
+        prompt_path: Path,
+        dry_run: bool,
+        timeout: Optional[float],
+        approval_flags: str,
+        with_network: bool,
+        extra_env: Optional[dict],
+        retry_count: int,
+        retry_wait: float,
+    ) -> Tuple[int, str]:
+        attempts = 0
+        while True:
+            async with self._semaphore:
+                if not dry_run:
+                    await self.rate_limiter.acquire()
+                self.calls += 1
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    code, out = await run_subcall_async(
+                        cmd_template,
+                        model,
+                        question,
+                        prompt_path,
+                        dry_run,
+                        timeout,
+                        approval_flags,
+                        with_network,
+                        extra_env,
+                    )
+                finally:
+                    self.in_flight -= 1
+            if code == 0 or attempts >= retry_count:
+                return code, out
+            attempts += 1
+            if retry_wait:
+                await asyncio.sleep(retry_wait)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"calls": self.calls, "peak_in_flight": self.peak_in_flight}
+        if self.cache is not None:
+            stats.update({"cache_hits": self.cache.hits, "cache_misses": self.cache.misses})
+        return stats
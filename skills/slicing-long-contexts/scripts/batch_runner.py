@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+"""
+Batch slice runner: run many (prompt, question, overrides) jobs in one process.
+
+The .env file is parsed once, provider defaults/codex dirs are resolved once per
+provider, and every job shares one SubcallExecutor (concurrency, rate limiter,
+sub-call cache) and one AsyncWriter, so slices from all corpora are scheduled
+together instead of corpus by corpus.
+
+Accepts every slice_runner.py flag as the batch-wide default (--prompt/--question
+come from the job file). Job file: a JSON list (or {"jobs": [...]}) of
+  {"id": "team-a", "prompt": "corpora/a.md", "question": "...", "overrides": {"chunk_size": 40000}}
+Override keys are slice_runner option names (dashes or underscores). Per-job
+outputs go to <out-dir>/<job-id>/ unless a job overrides out_dir; a per-job
+summary is written to <out-dir>/batch_results.json.
+
+Usage:
+  python skills/slicing-long-contexts/scripts/batch_runner.py --jobs jobs.json --provider openai --max-concurrency 16 --out-dir rlm_outputs/batch-001
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from async_core import AsyncWriter, SubcallExecutor
+from slice_runner import EarlyExit, apply_provider_defaults, build_executor, build_parser, load_env_file, prepare_provider_env, read_prompt, run
+
+# Shared across the batch; a per-job override would be silently ignored.
+SHARED_KEYS = {"max_concurrency", "rate_limit", "cache_dir", "env_file", "run_id"}
+# Batch-level paths that must not leak into every job.
+PER_JOB_PATH_KEYS = ("out_dir", "final_path", "summary_out", "doc_index")
+
+
+def load_jobs(jobs_path: Path) -> List[Dict[str, Any]]:
+    data = json.loads(jobs_path.read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("jobs", [])
+    if not isinstance(data, list):
+        raise ValueError(f"Job file must contain a list of jobs: {jobs_path}")
+    for index, job in enumerate(data):
+        if not isinstance(job, dict):
+            raise ValueError(f"Job {index} must be an object, got {type(job).__name__}: {jobs_path}")
+    return data
+
+
+def build_job_args(base: argparse.Namespace, job: Dict[str, Any], job_id: str, batch_dir: Path) -> argparse.Namespace:
+    """Copy batch defaults and apply one job's prompt/question/overrides; raises ValueError."""
+    args = argparse.Namespace(**vars(base))
+    for key in PER_JOB_PATH_KEYS:
+        setattr(args, key, None)
+    args.prompt = job.get("prompt")
+    args.question = job.get("question")
+    for raw_key, value in (job.get("overrides") or {}).items():
+        key = raw_key.lstrip("-").replace("-", "_")
+        if not hasattr(base, key) or key in ("prompt", "question"):
+            raise ValueError(f"unknown override '{raw_key}'")
+        if key in SHARED_KEYS:
+            print(f"[WARN] job {job_id}: override '{raw_key}' is batch-wide; ignoring.", file=sys.stderr)
+            continue
+        setattr(args, key, value)
+    if not args.prompt or not Path(args.prompt).is_file():
+        raise ValueError(f"prompt file not found: {args.prompt}")
+    if not args.question or not str(args.question).strip():
+        raise ValueError("question is required and cannot be empty")
+    if args.out_dir is None:
+        args.out_dir = str(batch_dir / job_id)
+    apply_provider_defaults(args)
+    return args
+
+
+async def run_job(
+    args: argparse.Namespace,
+    job_id: str,
+    batch_id: str,
+    provider_env: Dict[str, Dict[str, str]],
+    executor: SubcallExecutor,
+    writer: AsyncWriter,
+) -> Dict[str, Any]:
+    out_dir = Path(args.out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    final_path = Path(args.final_path) if args.final_path else out_dir / "rlm_final.txt"
+    result: Dict[str, Any] = {"id": job_id, "prompt": str(args.prompt), "out_dir": str(out_dir), "final_path": str(final_path)}
+    if args.summary_cmd_template and not args.dry_run:
+        result["summary_path"] = str(args.summary_out or out_dir / "rlm_summary.txt")
+    run_meta = {"id": f"{batch_id}/{job_id}", "batch": batch_id, "job": job_id}
+    try:
+        prompt = read_prompt(Path(args.prompt), exact=bool(args.doc_index))
+        await run(args, prompt, out_dir, final_path, provider_env[args.provider], run_meta, executor, writer)
+    except EarlyExit as e:
+        # Some slices never ran: the final answer on disk is incomplete
+        result.update({"status": "partial", "error": str(e)})
+        return result
+    except Exception as e:
+        result.update({"status": "error", "error": str(e)})
+        return result
+    result["status"] = "ok"
+    return result
+
+
+async def run_batch(
+    base: argparse.Namespace,
+    jobs: List[Dict[str, Any]],
+    batch_id: str,
+    batch_dir: Path,
+    base_env: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    # Corpora often share slices: cache and coalesce sub-calls across the batch even without --cache-dir
+    executor = build_executor(base, in_memory_cache=True)
+    provider_env: Dict[str, Dict[str, str]] = {}
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    async with AsyncWriter() as writer:
+
+        async def one(index: int, job: Dict[str, Any]) -> None:
+            job_id = str(job.get("id") or f"job{index}")
+            try:
+                args = build_job_args(base, job, job_id, batch_dir)
+                if args.provider not in provider_env:
+                    provider_env[args.provider] = prepare_provider_env(args.provider, base_env, batch_dir)
+            except ValueError as e:
+                print(f"[ERROR] job {job_id}: {e}", file=sys.stderr)
+                results[index] = {"id": job_id, "status": "error", "error": str(e)}
+                return
+            results[index] = await run_job(args, job_id, batch_id, provider_env, executor, writer)
+            print(f"Job {job_id}: {results[index]['status']}")
+
+        async with asyncio.TaskGroup() as tg:
+            for index, job in enumerate(jobs):
+                tg.create_task(one(index, job))
+
+        writer.append_log(
+            Path(base.results_json),
+            {"id": batch_id, "step": "batch", "jobs": len(jobs), "ok": sum(1 for r in results if r and r["status"] == "ok"), **executor.stats()},
+        )
+    return [r for r in results if r is not None]
+
+
+def main() -> None:
+    parser = build_parser(require_inputs=False)
+    parser.description = "Batch slice runner: run many corpora through one shared executor."
+    parser.add_argument("--jobs", required=True, help="JSON job file: list of {id, prompt, question, overrides}.")
+    base = parser.parse_args()
+
+    jobs_path = Path(base.jobs)
+    if not jobs_path.is_file():
+        parser.error(f"Job file not found: {jobs_path}")
+    try:
+        jobs = load_jobs(jobs_path)
+    except (ValueError, json.JSONDecodeError) as e:
+        parser.error(str(e))
+    ids = [str(job.get("id") or f"job{i}") for i, job in enumerate(jobs)]
+    if len(set(ids)) != len(ids):
+        parser.error("Job ids must be unique.")
+
+    batch_id = base.run_id or time.strftime("rlm-batch-%Y%m%d-%H%M%S")
+    batch_dir = Path(base.out_dir or f"rlm_outputs/{batch_id}").resolve()
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    env_path = Path(base.env_file).expanduser()
+    if not env_path.is_file():
+        parser.error(f"Env file not found: {env_path}")
+    base_env = load_env_file(env_path)
+
+    results = asyncio.run(run_batch(base, jobs, batch_id, batch_dir, base_env))
+    results_path = batch_dir / "batch_results.json"
+    results_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    failed = [r["id"] for r in results if r["status"] != "ok"]
+    print(f"Wrote {len(results)} job results to {results_path}" + (f" ({len(failed)} failed: {', '.join(failed)})" if failed else ""))
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
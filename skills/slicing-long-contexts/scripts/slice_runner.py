@@ -3,20 +3,26 @@
 Slice runner (formerly rlm_cli_runner): implements the REPL-style pattern from the RLM paper.
 Loads a long prompt from disk, slices it, issues bounded sub-LM calls via a shell
 command template, aggregates responses, and writes a final answer file.
+Sub-calls run concurrently on an asyncio core (see async_core.py), bounded by
+--max-concurrency; results are still aggregated in slice order.
 Run from a repo root (not the skill dir). Logs append-only lines to
 progress.log/results.json by default.
 """
 
 import argparse
+import asyncio
+import json
+import re
+import sys
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 from aggregator import aggregate
-from log_utils import append_log
-from slice_utils import Slice, slice_prompt, write_manifest, write_slices
-from subcall_runner import run_subcall
+from async_core import AsyncWriter, RateLimiter, SubcallCache, SubcallExecutor
+from slice_utils import Slice, doc_boundaries, load_doc_index, slice_prompt, write_manifest, write_slices
 from token_utils import estimate_tokens
+from verify_slice import DEFAULT_VERIFY_PREFIX, build_verify_prompt
 
 ALLOWED_ENV_KEYS = {
     "OPENAI_API_KEY",
@@ -32,12 +38,52 @@ ALLOWED_ENV_KEYS = {
 
 DEFAULT_CMD_TEMPLATE = 'codex {approval_flags} exec --model {model} "$(cat {prompt_path})"'
 GEMINI_CMD_NO_MODEL = 'gemini --approval-mode auto_edit "$(cat {prompt_path})"'
+DEFAULT_UNCERTAINTY_PATTERN = (
+    r"low confidence|not confident|uncertain|unclear|not sure|cannot determine|can't determine"
+    r"|insufficient (?:info|information|evidence)|information is missing|unable to verify"
+)
 
+PROVIDER_DEFAULTS = {
+    "openai": {
+        "model": "openai/gpt-4o",
+        "cmd": DEFAULT_CMD_TEMPLATE,
+        "approval": "--sandbox workspace-write --ask-for-approval untrusted",
+    },
+    "codex": {
+        "model": "openai/gpt-4o",
+        "cmd": DEFAULT_CMD_TEMPLATE,
+        "approval": "--sandbox workspace-write --ask-for-approval untrusted",
+    },
+    "gemini": {
+        "model": "",  # cli bug: omit model flag
+        "cmd": GEMINI_CMD_NO_MODEL,
+        "approval": "",
+    },
+    "google": {
+        "model": "",  # cli bug: omit model flag
+        "cmd": GEMINI_CMD_NO_MODEL,
+        "approval": "",
+    },
+    "vertex": {
+        "model": "",  # cli bug: omit model flag
+        "cmd": GEMINI_CMD_NO_MODEL,
+        "approval": "",
+    },
+}
 
-def main() -> None:
+
+class EarlyExit(Exception):
+    """
+    Raised by a slice task to cancel the remaining slices (failure without
+    --skip-on-failure); run() re-raises it after writing the partial answer.
+    """
+
+
+def build_parser(require_inputs: bool = True) -> argparse.ArgumentParser:
+    """Runner options; batch_runner reuses them with --prompt/--question optional."""
     parser = argparse.ArgumentParser(description="Slice runner (REPL-style slicing + sub-calls).")
-    parser.add_argument("--prompt", required=True, help="Path to the long prompt file.")
-    parser.add_argument("--question", required=True, help="Task/question to answer.")
+    parser.add_argument("--prompt", required=require_inputs, help="Path to the long prompt file.")
+    parser.add_argument("--question", required=require_inputs, help="Task/question to answer.")
     parser.add_argument("--provider", choices=["openai", "codex", "gemini", "google", "vertex"], default="openai", help="LLM provider to auto-pick defaults.")
     parser.add_argument("--model", default=None, help="Model identifier for the CLI tool.")
     parser.add_argument("--cmd-template", default=None, help="Shell command template. Vars: {model}, {slice_path}, {prompt_path} (optional {question}).")
@@ -46,11 +92,15 @@ def main() -> None:
     parser.add_argument("--marker-start", help="Regex for slice start (optional).")
     parser.add_argument("--marker-end", help="Regex for slice end (optional).")
     parser.add_argument("--max-slices", type=int, default=6, help="Max slices/sub-calls to issue.")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Max sub-calls in flight at once (1 = sequential).")
+    parser.add_argument("--rate-limit", type=float, default=0, help="Max sub-call starts per minute across the run (0 = unlimited).")
+    parser.add_argument("--cache-dir", default=None, help="Optional dir for cached successful sub-call outputs (keyed by template/model/question/prompt text); reruns reuse them.")
     parser.add_argument("--prefer-headings", action="store_true", default=True, help="Prefer Markdown heading-based slices (fallback to markers/chunks).")
+    parser.add_argument("--doc-index", default=None, help="JSON document-offset index for the prompt (byte start/end per document, e.g. situation_corpus.index.json); slices break only at document boundaries. Overrides headings/markers.")
     parser.add_argument("--out-dir", default=None, help="Directory for slice/subresp/prompt/final files (default: ./rlm_outputs/<run-id>).")
     parser.add_argument("--output-dir", dest="out_dir", help="Alias for --out-dir.")
     parser.add_argument("--run-id", help="Optional run identifier; included in progress/results logs (default: rlm-YYYYMMDD-HHMMSS).")
-    parser.add_argument("--max-subcall-seconds", type=int, default=None, help="Optional timeout per sub-call (seconds); added as a shell timeout prefix.")
+    parser.add_argument("--max-subcall-seconds", type=int, default=None, help="Optional timeout per sub-call (seconds); the child process is killed and rc=124 is recorded.")
     parser.add_argument("--approval-flags", default=None, help="Flags to control CLI approvals/sandbox for sub-calls (e.g., '--sandbox workspace-write --ask-for-approval untrusted' for codex, '--approval-mode auto_edit' for gemini).")
     parser.add_argument("--with-user-codex-access", action="store_true", help="Convenience: append '--add-dir ~/.codex --add-dir ~/.codex/skills' to approval-flags (Codex session dir access).")
     parser.add_argument("--env-file", default=".env", help="Path to .env file (KEY=VALUE) to load and pass to sub-calls (whitelisted keys only).")
@@ -71,8 +121,11 @@ def main() -> None:
     parser.add_argument("--code-mode", action="store_true", help="If set, append code-task guidance (validate via scripts/tests, summarize changes, files touched, git state, and reproduction steps).")
     parser.add_argument("--retry-count", type=int, default=0, help="Number of retries per slice on nonzero return code.")
     parser.add_argument("--retry-wait", type=float, default=0, help="Seconds to wait between retries (per slice).")
-    parser.add_argument("--skip-on-failure", action="store_true", help="If set, skip failed slices after retries and continue aggregating.")
+    parser.add_argument("--skip-on-failure", action="store_true", help="If set, skip failed slices after retries and continue aggregating. Otherwise the first failure cancels in-flight slices.")
     parser.add_argument("--verify-slices", help="Comma-separated slice tags to re-run for verification after a successful subcall.")
+    parser.add_argument("--verify-on-uncertainty", action="store_true", help="Also verify any slice whose response matches --uncertainty-pattern.")
+    parser.add_argument("--uncertainty-pattern", default=DEFAULT_UNCERTAINTY_PATTERN, help="Case-insensitive regex of low-confidence markers that trigger verification.")
+    parser.add_argument("--verify-prefix", default=DEFAULT_VERIFY_PREFIX, help="Preamble prepended to the slice prompt for verification passes.")
     parser.add_argument("--dry-run", action="store_true", help="Plan and slice only; skip sub-call execution.")
     parser.add_argument("--greedy-first", action="store_true", help="If set and prompt size <= greedy-max-chars, run a single summarizing call instead of slicing.")
     parser.add_argument("--greedy-max-chars", type=int, default=180_000, help="Max chars allowed for greedy-first path.")
@@ -81,36 +134,11 @@ def main() -> None:
     parser.add_argument("--summary-system-prompt", default="You are a reducer model. Concisely summarize and reconcile the following sub-responses in order. Preserve key details; avoid duplication; surface contradictions.", help="System preamble for summarizer.")
     parser.add_argument("--summary-out", default=None, help="Output path for summarizer result (defaults to <out-dir>/rlm_summary.txt).")
     parser.add_argument("--warn-tokens", type=int, default=64_000, help="Warn if estimated tokens exceed this value (heuristic).")
-    args = parser.parse_args()
+    return parser
+
 
-    provider_defaults = {
-        "openai": {
-            "model": "openai/gpt-4o",
-            "cmd": DEFAULT_CMD_TEMPLATE,
-            "approval": "--sandbox workspace-write --ask-for-approval untrusted",
-        },
-        "codex": {
-            "model": "openai/gpt-4o",
-            "cmd": DEFAULT_CMD_TEMPLATE,
-            "approval": "--sandbox workspace-write --ask-for-approval untrusted",
-        },
-        "gemini": {
-            "model": "",  # cli bug: omit model flag
-            "cmd": GEMINI_CMD_NO_MODEL,
-            "approval": "",
-        },
-        "google": {
-            "model": "",  # cli bug: omit model flag
-            "cmd": GEMINI_CMD_NO_MODEL,
-            "approval": "",
-        },
-        "vertex": {
-            "model": "",  # cli bug: omit model flag
-            "cmd": GEMINI_CMD_NO_MODEL,
-            "approval": "",
-        },
-    }
-    defaults = provider_defaults.get(args.provider, provider_defaults["openai"])
+def apply_provider_defaults(args: argparse.Namespace) -> None:
+    defaults = PROVIDER_DEFAULTS.get(args.provider, PROVIDER_DEFAULTS["openai"])
     if args.provider in ("openai", "codex") and not args.with_user_codex_access:
         args.with_user_codex_access = True
     if args.model is None:
@@ -119,25 +147,11 @@ def main() -> None:
         args.cmd_template = defaults["cmd"]
     if args.approval_flags is None:
         args.approval_flags = defaults["approval"]
-    run_id = args.run_id or time.strftime("rlm-%Y%m%d-%H%M%S")
 
-    if not args.question or not args.question.strip():
-        parser.error("Question is required and cannot be empty.")
-    prompt_path = Path(args.prompt)
-    if not prompt_path.is_file():
-        parser.error(f"Prompt file not found: {prompt_path}")
-    prompt = prompt_path.read_text(encoding="utf-8")
-    est_tokens = estimate_tokens(prompt, model=args.model)
-    progress_log = Path(args.progress_log)
-    results_log = Path(args.results_json)
-    out_dir = Path(args.out_dir or f"rlm_outputs/{run_id}").resolve()
-    out_dir.mkdir(parents=True, exist_ok=True)
-    final_path = Path(args.final_path) if args.final_path else out_dir / "rlm_final.txt"
 
-    extra_env = {}
-    env_path = Path(args.env_file).expanduser()
-    if not env_path.is_file():
-        parser.error(f"Env file not found: {env_path}")
+def load_env_file(env_path: Path) -> Dict[str, str]:
+    """Read whitelisted KEY=VALUE pairs from a .env file."""
+    extra_env: Dict[str, str] = {}
     for line in env_path.read_text(encoding="utf-8").splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
@@ -151,27 +165,200 @@ def main() -> None:
             extra_env[key] = val
     if "OPENAI_BASE_URL" in extra_env:
         extra_env.setdefault("CODEX_BASE_URL", extra_env["OPENAI_BASE_URL"])
-    if args.provider in ("openai", "codex"):
+    return extra_env
+
+
+def prepare_provider_env(provider: str, extra_env: Dict[str, str], out_dir: Path) -> Dict[str, str]:
+    """Validate provider keys and set up codex dirs; raises ValueError on missing keys."""
+    extra_env = dict(extra_env)
+    if provider in ("openai", "codex"):
         if not extra_env.get("OPENAI_API_KEY"):
-            parser.error("Missing OPENAI_API_KEY in env for provider openai/codex.")
+            raise ValueError("Missing OPENAI_API_KEY in env for provider openai/codex.")
         if not extra_env.get("CODEX_API_KEY"):
             extra_env["CODEX_API_KEY"] = extra_env["OPENAI_API_KEY"]
         codex_home = Path(extra_env.setdefault("CODEX_HOME", str(out_dir / "codex_home")))
         codex_session_dir = Path(extra_env.setdefault("CODEX_SESSION_DIR", str(out_dir / "codex_sessions")))
         codex_home.mkdir(parents=True, exist_ok=True)
         codex_session_dir.mkdir(parents=True, exist_ok=True)
-    if args.provider in ("gemini", "google", "vertex"):
+    if provider in ("gemini", "google", "vertex"):
         if not (extra_env.get("GEMINI_API_KEY") and extra_env.get("GOOGLE_GEMINI_BASE_URL")):
-            parser.error("Missing GEMINI_API_KEY and GOOGLE_GEMINI_BASE_URL in env for provider gemini/google/vertex.")
+            raise ValueError("Missing GEMINI_API_KEY and GOOGLE_GEMINI_BASE_URL in env for provider gemini/google/vertex.")
+    return extra_env
 
-    run_meta = {"id": run_id}
 
-    append_log(progress_log, {**run_meta, "step": "init", "prompt_path": str(prompt_path), "chars": len(prompt), "chunk_size": args.chunk_size})
-    append_log(progress_log, {**run_meta, "step": "token_estimate", "est_tokens": est_tokens, "warn_tokens": args.warn_tokens})
-    if est_tokens >= args.warn_tokens:
-        print(f"Warning: estimated tokens ~{est_tokens} (>= {args.warn_tokens}). This doc is likely long enough to consider using the 'calling-llms-recursively' RLM runner to divide and conquer.")
+def build_approval_flags(args: argparse.Namespace) -> str:
+    approval_flags = args.approval_flags
+    if args.with_user_codex_access:
+        codex_dir = Path("~/.codex").expanduser().resolve()
+        codex_skills = codex_dir / "skills"
+        codex_sessions = codex_dir / "sessions"
+        codex_log = codex_dir / "log"
+        approval_flags = (
+            f"{approval_flags} --add-dir {codex_dir} --add-dir {codex_skills} "
+            f"--add-dir {codex_sessions} --add-dir {codex_log}"
+        ).strip()
+    return approval_flags
+
+
+def build_slice_prompt(args: argparse.Namespace, sl: Slice) -> str:
+    code_footer = ""
+    if args.code_mode:
+        code_footer = (
+            "\n\nFor code tasks: run available scripts/tests to validate; "
+            "return a concise summary, files touched, git branch/commit/worktree info, "
+            "and how you validated or why you stopped early; include reproduction steps for validation."
+        )
+    return (
+        f"{args.sub_system_prompt}\n\n"
+        f"Slice info: tag={sl.tag}, span={sl.start}:{sl.end}, chars={len(sl.text)}\n"
+        f"Root question: {args.question}{code_footer}\n\n"
+        f"Slice:\n---\n{sl.text}"
+    )
+
+
+async def run_slices(
+    args: argparse.Namespace,
+    slices: List[Slice],
+    out_dir: Path,
+    approval_flags: str,
+    extra_env: Dict[str, str],
+    executor: SubcallExecutor,
+    writer: AsyncWriter,
+    run_meta: Dict[str, str],
+) -> Tuple[List[Tuple[Slice, str]], Optional[str]]:
+    """
+    Run every slice concurrently; return (slice, response) pairs in slice order,
+    plus the early-exit reason if a failure stopped the run (None otherwise).
+
+    Verification passes (requested via --verify-slices or triggered by uncertainty
+    markers) are scheduled as separate tasks the moment their primary finishes,
+    so they overlap the remaining primaries; results go to verification.json.
+    """
+    progress_log = Path(args.progress_log)
+    with_network = True
+    verify_set = set()
+    if args.verify_slices:
+        verify_set = {s.strip() for s in args.verify_slices.split(",") if s.strip()}
+    uncertainty_re = re.compile(args.uncertainty_pattern, re.IGNORECASE) if args.verify_on_uncertainty else None
+    done: Dict[str, List[Tuple[Slice, str]]] = {}
+    verified: Dict[str, Tuple[Slice, str]] = {}
+    verification: List[Dict[str, object]] = []
+    early_exit: Optional[str] = None
+
+    async def run_one(sl: Slice) -> None:
+        prompt_path = out_dir / f"rlm_prompt_{sl.tag}.txt"
+        await writer.write_text(prompt_path, build_slice_prompt(args, sl))
+        code, out = await executor.run(
+            args.cmd_template,
+            args.model,
+            args.question,
+            prompt_path,
+            args.dry_run,
+            args.max_subcall_seconds,
+            approval_flags,
+            with_network,
+            extra_env,
+            retry_count=args.retry_count,
+            retry_wait=args.retry_wait,
+        )
+        writer.append_log(
+            progress_log,
+            {**run_meta, "step": "subcall", "tag": sl.tag, "slice_path": str(sl.path), "prompt_path": str(prompt_path), "rc": code},
+        )
+        writer.write_text(out_dir / f"rlm_subresp_{sl.tag}.txt", out or "")
+        if code != 0 and not args.dry_run:
+            if args.skip_on_failure:
+                done[sl.tag] = [(sl, f"[error rc={code}] {out.strip()}")]
+                return
+            raise EarlyExit(f"slice {sl.tag} failed rc={code}")
+        done[sl.tag] = [(sl, out)]
+        if code == 0 and not args.dry_run:
+            trigger = verification_trigger(sl.tag, out, verify_set, uncertainty_re)
+            if trigger:
+                tg.create_task(verify_one(sl, prompt_path, *trigger))
+
+    async def verify_one(sl: Slice, prompt_path: Path, trigger: str, marker: str) -> None:
+        """Separate stage: scheduled as soon as its primary finishes, alongside remaining primaries."""
+        verify_prompt_path = out_dir / f"rlm_prompt_{sl.tag}_verify.txt"
+        await writer.write_text(verify_prompt_path, build_verify_prompt(prompt_path.read_text(encoding="utf-8"), args.verify_prefix))
+        v_code, v_out = await executor.run(
+            args.cmd_template,
+            args.model,
+            f"Verify slice {sl.tag}: {args.question}",
+            verify_prompt_path,
+            args.dry_run,
+            args.max_subcall_seconds,
+            approval_flags,
+            with_network,
+            extra_env,
+        )
+        verify_out_path = out_dir / f"rlm_subresp_{sl.tag}_verify.txt"
+        writer.append_log(
+            progress_log,
+            {**run_meta, "step": "verify", "tag": sl.tag, "trigger": trigger, "rc": v_code},
+        )
+        writer.write_text(verify_out_path, v_out or "")
+        verified[sl.tag] = (sl, f"[verify rc={v_code}] {v_out.strip()}")
+        verification.append(
+            {"tag": sl.tag, "trigger": trigger, "marker": marker, "rc": v_code, "prompt_path": str(verify_prompt_path), "subresp_path": str(verify_out_path)}
+        )
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for sl in slices:
+                tg.create_task(run_one(sl))
+    except* EarlyExit as eg:
+        early_exit = "; ".join(str(e) for e in eg.exceptions)
+        writer.append_log(progress_log, {**run_meta, "step": "early_exit", "reason": early_exit, "completed": sorted(done)})
+        print(f"[WARN] Stopping early: {early_exit}")
+
+    if verification:
+        order = {sl.tag: idx for idx, sl in enumerate(slices)}
+        verification.sort(key=lambda v: order[v["tag"]])
+        writer.write_text(out_dir / "verification.json", json.dumps(verification, indent=2))
+
+    sub_resps: List[Tuple[Slice, str]] = []
+    for sl in slices:
+        sub_resps.extend(done.get(sl.tag, []))
+        if sl.tag in verified and sl.tag in done:
+            sub_resps.append(verified[sl.tag])
+    return sub_resps, early_exit
+
+
+def verification_trigger(tag: str, out: str, verify_set: Set[str], uncertainty_re: Optional[Pattern[str]]) -> Optional[Tuple[str, str]]:
+    """Return (trigger, marker) if a finished slice should get a verification pass."""
+    if tag in verify_set:
+        return "requested", ""
+    if uncertainty_re and out:
+        match = uncertainty_re.search(out)
+        if match:
+            return "uncertainty", match.group(0)
+    return None
 
+
+async def run(
+    args: argparse.Namespace,
+    prompt: str,
+    out_dir: Path,
+    final_path: Path,
+    extra_env: Dict[str, str],
+    run_meta: Dict[str, str],
+    executor: SubcallExecutor,
+    writer: AsyncWriter,
+) -> str:
+    """
+    Run one corpus end to end; executor and writer may be shared with other runs.
+    Raises EarlyExit once the partial answer is written if a slice failure stopped the run.
+    """
+    progress_log = Path(args.progress_log)
+    results_log = Path(args.results_json)
     with_network = True
+    est_tokens = estimate_tokens(prompt, model=args.model)
+
+    writer.append_log(progress_log, {**run_meta, "step": "init", "prompt_path": str(args.prompt), "chars": len(prompt), "chunk_size": args.chunk_size})
+    writer.append_log(progress_log, {**run_meta, "step": "token_estimate", "est_tokens": est_tokens, "warn_tokens": args.warn_tokens})
+    if est_tokens >= args.warn_tokens:
+        print(f"Warning: estimated tokens ~{est_tokens} (>= {args.warn_tokens}). This doc is likely long enough to consider using the 'calling-llms-recursively' RLM runner to divide and conquer.")
 
     if args.greedy_first and len(prompt) <= args.greedy_max_chars and args.summary_cmd_template and not args.dry_run:
         greedy_prompt_path = out_dir / "rlm_prompt_greedy.txt"
@@ -180,8 +367,8 @@ def main() -> None:
             f"Root question: {args.question}\n\n"
             f"Full document:\n---\n{prompt}"
         )
-        greedy_prompt_path.write_text(greedy_body, encoding="utf-8")
-        rc_greedy, out_greedy = run_subcall(
+        await writer.write_text(greedy_prompt_path, greedy_body)
+        rc_greedy, out_greedy = await executor.run(
             args.summary_cmd_template,
             args.summary_model or args.model,
             "",
@@ -192,11 +379,18 @@ def main() -> None:
             with_network,
             extra_env,
         )
-        final_path.write_text(out_greedy or "", encoding="utf-8")
-        append_log(results_log, {**run_meta, "step": "greedy", "rc": rc_greedy, "final_path": str(final_path), "chars": len(prompt)})
-        print(out_greedy)
-        return
+        writer.write_text(final_path, out_greedy or "")
+        writer.append_log(results_log, {**run_meta, "step": "greedy", "rc": rc_greedy, "final_path": str(final_path), "chars": len(prompt)})
+        return out_greedy
 
+    doc_index = None
+    if args.doc_index:
+        try:
+            doc_index = load_doc_index(Path(args.doc_index), prompt)
+            doc_boundaries(prompt, doc_index)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] Ignoring document index {args.doc_index}: {e}")
+            doc_index = None
     slices = slice_prompt(
         prompt,
         args.chunk_size,
@@ -206,103 +400,18 @@ def main() -> None:
         prefer_headings=args.prefer_headings,
         overlap=args.overlap,
         base_dir=out_dir,
+        doc_index=doc_index,
     )
     write_slices(slices)
     manifest_path = out_dir / "manifest.json"
     write_manifest(slices, manifest_path)
-    append_log(progress_log, {**run_meta, "step": "slices_ready", "count": len(slices), "tags": [s.tag for s in slices], "manifest": str(manifest_path)})
+    writer.append_log(progress_log, {**run_meta, "step": "slices_ready", "count": len(slices), "tags": [s.tag for s in slices], "manifest": str(manifest_path)})
 
-    sub_resps: List[Tuple[Slice, str]] = []
-    approval_flags = args.approval_flags
-    if args.with_user_codex_access:
-        codex_dir = Path("~/.codex").expanduser().resolve()
-        codex_skills = codex_dir / "skills"
-        codex_sessions = codex_dir / "sessions"
-        codex_log = codex_dir / "log"
-        approval_flags = (
-            f"{approval_flags} --add-dir {codex_dir} --add-dir {codex_skills} "
-            f"--add-dir {codex_sessions} --add-dir {codex_log}"
-        ).strip()
-    verify_set = set()
-    if args.verify_slices:
-        verify_set = {s.strip() for s in args.verify_slices.split(",") if s.strip()}
-    for sl in slices:
-        prompt_path = out_dir / f"rlm_prompt_{sl.tag}.txt"
-        code_footer = ""
-        if args.code_mode:
-            code_footer = (
-                "\n\nFor code tasks: run available scripts/tests to validate; "
-                "return a concise summary, files touched, git branch/commit/worktree info, "
-                "and how you validated or why you stopped early; include reproduction steps for validation."
-            )
-        prompt_body = (
-            f"{args.sub_system_prompt}\n\n"
-            f"Slice info: tag={sl.tag}, span={sl.start}:{sl.end}, chars={len(sl.text)}\n"
-            f"Root question: {args.question}{code_footer}\n\n"
-            f"Slice:\n---\n{sl.text}"
-        )
-        prompt_path.write_text(prompt_body, encoding="utf-8")
-        attempts = 0
-        code, out = run_subcall(
-            args.cmd_template,
-            args.model,
-            args.question,
-            prompt_path,
-            args.dry_run,
-            args.max_subcall_seconds,
-            approval_flags,
-            with_network,
-            extra_env,
-        )
-        while code != 0 and attempts < args.retry_count:
-            attempts += 1
-            if args.retry_wait:
-                time.sleep(args.retry_wait)
-            code, out = run_subcall(
-                args.cmd_template,
-                args.model,
-                args.question,
-                prompt_path,
-                args.dry_run,
-                args.max_subcall_seconds,
-                approval_flags,
-                True,
-                extra_env,
-            )
-        append_log(
-            progress_log,
-            {**run_meta, "step": "subcall", "tag": sl.tag, "slice_path": str(sl.path), "prompt_path": str(prompt_path), "rc": code},
-        )
-        (out_dir / f"rlm_subresp_{sl.tag}.txt").write_text(out or "", encoding="utf-8")
-        if code != 0 and not args.dry_run:
-            if args.skip_on_failure:
-                sub_resps.append((sl, f"[error rc={code}] {out.strip()}"))
-                continue
-            break
-        sub_resps.append((sl, out))
-        if code == 0 and sl.tag in verify_set and not args.dry_run:
-            v_code, v_out = run_subcall(
-                args.cmd_template,
-                args.model,
-                f"Verify slice {sl.tag}: {args.question}",
-                prompt_path,
-                args.dry_run,
-                args.max_subcall_seconds,
-                approval_flags,
-                True,
-                extra_env,
-            )
-            append_log(
-                progress_log,
-                {**run_meta, "step": "verify", "tag": sl.tag, "rc": v_code},
-            )
-            (out_dir / f"rlm_subresp_{sl.tag}_verify.txt").write_text(v_out or "", encoding="utf-8")
-            sub_resps.append((sl, f"[verify rc={v_code}] {v_out.strip()}"))
-        if len(sub_resps) >= args.max_slices:
-            break
+    approval_flags = build_approval_flags(args)
+    sub_resps, early_exit = await run_slices(args, slices, out_dir, approval_flags, extra_env, executor, writer, run_meta)
 
     final_answer = aggregate(sub_resps)
-    final_path.write_text(final_answer, encoding="utf-8")
+    writer.write_text(final_path, final_answer)
     summary_path = args.summary_out or out_dir / "rlm_summary.txt"
     if args.summary_cmd_template and not args.dry_run:
         reducer_prompt_parts = [args.summary_system_prompt, "\n\nSub-responses:\n---"]
@@ -310,8 +419,8 @@ def main() -> None:
             reducer_prompt_parts.append(f"[{sl.tag} {sl.start}:{sl.end}]\n{resp.strip()}\n")
         reducer_body = "\n".join(reducer_prompt_parts)
         reducer_prompt_path = out_dir / "rlm_reducer_prompt.txt"
-        reducer_prompt_path.write_text(reducer_body, encoding="utf-8")
-        rc_summary, out_summary = run_subcall(
+        await writer.write_text(reducer_prompt_path, reducer_body)
+        rc_summary, out_summary = await executor.run(
             args.summary_cmd_template,
             args.summary_model or args.model,
             "",
@@ -323,9 +432,77 @@ def main() -> None:
             extra_env,
         )
         summary_path = Path(summary_path)
-        summary_path.write_text(out_summary or "", encoding="utf-8")
-        append_log(results_log, {**run_meta, "step": "summary", "rc": rc_summary, "summary_path": str(summary_path)})
-    append_log(results_log, {**run_meta, "step": "final", "final_path": str(final_path), "slices": len(sub_resps)})
+        writer.write_text(summary_path, out_summary or "")
+        writer.append_log(results_log, {**run_meta, "step": "summary", "rc": rc_summary, "summary_path": str(summary_path)})
+    final_entry = {**run_meta, "step": "final", "final_path": str(final_path), "slices": len(sub_resps), "peak_in_flight": executor.peak_in_flight}
+    if early_exit:
+        final_entry.update({"status": "partial", "early_exit": early_exit})
+    writer.append_log(results_log, final_entry)
+    if early_exit:
+        raise EarlyExit(early_exit)
+    return final_answer
+
+
+async def main_async(
+    args: argparse.Namespace,
+    prompt: str,
+    out_dir: Path,
+    final_path: Path,
+    extra_env: Dict[str, str],
+    run_meta: Dict[str, str],
+) -> str:
+    executor = build_executor(args)
+    async with AsyncWriter() as writer:
+        return await run(args, prompt, out_dir, final_path, extra_env, run_meta, executor, writer)
+
+
+def read_prompt(path: Path, exact: bool = False) -> str:
+    """Read the prompt file; exact=True keeps line endings so byte offsets from a document index still line up."""
+    if exact:
+        with open(path, encoding="utf-8", newline="") as f:
+            return f.read()
+    return path.read_text(encoding="utf-8")
+
+
+def build_executor(args: argparse.Namespace, in_memory_cache: bool = False) -> SubcallExecutor:
+    """Executor for one run. --cache-dir persists the sub-call cache; in_memory_cache keeps one for this process only."""
+    if args.cache_dir:
+        cache = SubcallCache(Path(args.cache_dir))
+    else:
+        cache = SubcallCache(None) if in_memory_cache else None
+    return SubcallExecutor(args.max_concurrency, rate_limiter=RateLimiter(args.rate_limit), cache=cache)
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+    apply_provider_defaults(args)
+    run_id = args.run_id or time.strftime("rlm-%Y%m%d-%H%M%S")
+
+    if not args.question or not args.question.strip():
+        parser.error("Question is required and cannot be empty.")
+    prompt_path = Path(args.prompt)
+    if not prompt_path.is_file():
+        parser.error(f"Prompt file not found: {prompt_path}")
+    prompt = read_prompt(prompt_path, exact=bool(args.doc_index))
+    out_dir = Path(args.out_dir or f"rlm_outputs/{run_id}").resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    final_path = Path(args.final_path) if args.final_path else out_dir / "rlm_final.txt"
+
+    env_path = Path(args.env_file).expanduser()
+    if not env_path.is_file():
+        parser.error(f"Env file not found: {env_path}")
+    try:
+        extra_env = prepare_provider_env(args.provider, load_env_file(env_path), out_dir)
+    except ValueError as e:
+        parser.error(str(e))
+
+    run_meta = {"id": run_id}
+    try:
+        final_answer = asyncio.run(main_async(args, prompt, out_dir, final_path, extra_env, run_meta))
+    except EarlyExit as e:
+        print(f"[ERROR] Run stopped early ({e}); partial answer written to {final_path}", file=sys.stderr)
+        raise SystemExit(1)
     print(final_answer)
 
 
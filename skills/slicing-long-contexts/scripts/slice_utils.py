@@ -20,6 +20,81 @@ class Slice:
     text: str
 
 
+def load_doc_index(index_path: Path, prompt: Optional[str] = None) -> List[dict]:
+    """
+    Reads a document-offset index: {"documents": [{id, start, end, ...}]} or a bare list.
+    With `prompt`, an index that records the corpus size ("bytes") must match it:
+    a stale index for a regenerated corpus raises ValueError instead of slicing
+    at the wrong offsets.
+    """
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+    docs = data.get("documents", []) if isinstance(data, dict) else data
+    if not isinstance(docs, list):
+        raise ValueError(f"Document index must contain a list of documents: {index_path}")
+    if prompt is not None and isinstance(data, dict) and "bytes" in data:
+        size = len(prompt.encode("utf-8"))
+        if int(data["bytes"]) != size:
+            raise ValueError(f"index is for a {data['bytes']}-byte corpus, prompt is {size} bytes")
+    return docs
+
+
+def doc_boundaries(prompt: str, docs: Sequence[dict]) -> List[int]:
+    """
+    Converts the index's byte offsets into sorted character offsets of document
+    starts. Decodes each byte range once (no regex pass); raises ValueError if
+    the index doesn't fit the prompt.
+    """
+    data = prompt.encode("utf-8")
+    starts = sorted({int(d["start"]) for d in docs})
+    if any(int(d["end"]) > len(data) or int(d["start"]) > int(d["end"]) for d in docs) or (starts and starts[0] < 0):
+        raise ValueError("document index offsets do not match the prompt")
+    boundaries: List[int] = []
+    char_pos = 0
+    prev = 0
+    for start in starts:
+        try:
+            char_pos += len(data[prev:start].decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise ValueError(f"document index offset {start} is not on a character boundary") from e
+        boundaries.append(char_pos)
+        prev = start
+    return boundaries
+
+
+def slice_by_doc_index(
+    prompt: str,
+    docs: Sequence[dict],
+    chunk_size: int,
+    max_slices: int,
+    base_dir: Path,
+) -> List[Slice]:
+    """
+    Packs whole documents into slices of about chunk_size chars (raised so that
+    everything fits in max_slices). Slices only break at document starts, so no
+    document is cut; one larger than the target gets a slice to itself. Text
+    before the first document (the corpus header) joins the first slice.
+    """
+    boundaries = doc_boundaries(prompt, docs)
+    if boundaries and boundaries[0] == 0:
+        boundaries = boundaries[1:]
+    target = max(chunk_size, -(-len(prompt) // max(max_slices, 1)))
+    cuts = [0]
+    for i, pos in enumerate(boundaries):
+        if len(cuts) >= max_slices:
+            break
+        next_pos = boundaries[i + 1] if i + 1 < len(boundaries) else len(prompt)
+        # Cut before a document that would overflow the current slice
+        if pos > cuts[-1] and next_pos - cuts[-1] > target:
+            cuts.append(pos)
+    cuts.append(len(prompt))
+    slices: List[Slice] = []
+    for idx in range(len(cuts) - 1):
+        start, end = cuts[idx], cuts[idx + 1]
+        tag = f"d{idx}"
+        slices.append(Slice(tag=tag, path=base_dir / f"rlm_slice_{tag}.txt", start=start, end=end, text=prompt[start:end]))
+    return slices
+
+
 def slice_prompt(
     prompt: str,
     chunk_size: int,
@@ -29,10 +104,14 @@ def slice_prompt(
     prefer_headings: bool = False,
     overlap: int = 0,
     base_dir: Optional[Path] = None,
+    doc_index: Optional[Sequence[dict]] = None,
 ) -> List[Slice]:
     slices: List[Slice] = []
     base_dir = base_dir or Path(".")
     base_dir.mkdir(parents=True, exist_ok=True)
+    if doc_index:
+        # Exact document boundaries take precedence over headings/markers/chunks
+        return slice_by_doc_index(prompt, doc_index, chunk_size, max_slices, base_dir)
     if prefer_headings:
         heading_matches = list(re.finditer(r"(?m)^#{1,6}\s+.+$", prompt))
         boundaries = [0] + [m.start() for m in heading_matches] + [len(prompt)]
@@ -142,6 +221,7 @@ def main() -> None:
     parser.add_argument("--marker-end", help="Regex for slice end (optional).")
     parser.add_argument("--max-slices", type=int, default=5, help="Max slices to emit.")
     parser.add_argument("--prefer-headings", action="store_true", help="Prefer Markdown heading-based slices.")
+    parser.add_argument("--doc-index", help="JSON document-offset index (byte start/end per document); slices break only at document boundaries.")
     parser.add_argument("--out-dir", default=".", help="Output directory for slices/manifest.")
     parser.add_argument("--manifest", default=None, help="Manifest path (defaults to <out-dir>/manifest.json).")
     args = parser.parse_args()
@@ -149,7 +229,17 @@ def main() -> None:
     prompt_path = Path(args.prompt)
     if not prompt_path.is_file():
         raise SystemExit(f"Prompt file not found: {prompt_path}")
-    prompt = prompt_path.read_text(encoding="utf-8")
+    # Keep line endings as written when byte offsets from an index must line up
+    with open(prompt_path, encoding="utf-8", newline="" if args.doc_index else None) as f:
+        prompt = f.read()
+    doc_index = None
+    if args.doc_index:
+        try:
+            doc_index = load_doc_index(Path(args.doc_index), prompt)
+            doc_boundaries(prompt, doc_index)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] Ignoring document index {args.doc_index}: {e}")
+            doc_index = None
     out_dir = Path(args.out_dir).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -162,6 +252,7 @@ def main() -> None:
         prefer_headings=args.prefer_headings,
         overlap=args.overlap,
         base_dir=out_dir,
+        doc_index=doc_index,
     )
     write_slices(slices)
     manifest_path = Path(args.manifest) if args.manifest else out_dir / "manifest.json"
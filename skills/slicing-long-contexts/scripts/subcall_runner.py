@@ -11,17 +11,15 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 
-def run_subcall(
+def build_subcall_cmd(
     cmd_template: str,
     model: str,
     question: str,
     prompt_path: Path,
-    dry_run: bool,
-    timeout: Optional[int],
     approval_flags: str,
     with_network: bool,
-    extra_env: Optional[dict],
-) -> Tuple[int, str]:
+) -> str:
+    """Render a sub-call command template (without any timeout prefix)."""
     cmd = cmd_template.format(
         model=model,
         question=question,
@@ -38,14 +36,33 @@ def run_subcall(
                 "codex -c sandbox_workspace_write.network_access=true ",
                 1,
             )
+    return cmd
+
+
+def build_subcall_env(extra_env: Optional[dict]) -> dict:
+    env = os.environ.copy()
+    if extra_env:
+        env.update(extra_env)
+    return env
+
+
+def run_subcall(
+    cmd_template: str,
+    model: str,
+    question: str,
+    prompt_path: Path,
+    dry_run: bool,
+    timeout: Optional[int],
+    approval_flags: str,
+    with_network: bool,
+    extra_env: Optional[dict],
+) -> Tuple[int, str]:
+    cmd = build_subcall_cmd(cmd_template, model, question, prompt_path, approval_flags, with_network)
     if timeout:
         cmd = f"timeout {timeout}s {cmd}"
     if dry_run:
         return 0, f"[dry-run] {cmd}"
-    env = os.environ.copy()
-    if extra_env:
-        env.update(extra_env)
-    res = subprocess.run(cmd, shell=True, capture_output=True, text=True, env=env)
+    res = subprocess.run(cmd, shell=True, capture_output=True, text=True, env=build_subcall_env(extra_env))
     return res.returncode, res.stdout if res.stdout else res.stderr
 
 
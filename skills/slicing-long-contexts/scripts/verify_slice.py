@@ -12,6 +12,13 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+DEFAULT_VERIFY_PREFIX = "Verification pass: ensure claims are supported and flag uncertainty.\n\n"
+
+
+def build_verify_prompt(text: str, verify_prefix: str = DEFAULT_VERIFY_PREFIX) -> str:
+    """Verification prompt = preamble + the original slice prompt (shared with slice_runner)."""
+    return verify_prefix + text
+
 
 def run_subcall(cmd_template: str, model: str, prompt_path: Path, timeout: int | None, approval_flags: str, with_network: bool) -> tuple[int, str]:
     cmd = cmd_template.format(
@@ -39,7 +46,7 @@ def main() -> None:
     parser.add_argument("--timeout", type=int, default=None, help="Optional timeout seconds for the subcall.")
     parser.add_argument("--approval-flags", default="", help="Flags to control CLI approvals/sandbox.")
     parser.add_argument("--with-network", action="store_true", help="If set, add network access flags when supported.")
-    parser.add_argument("--verify-prefix", default="Verification pass: ensure claims are supported and flag uncertainty.\n\n", help="Preamble added before the original prompt.")
+    parser.add_argument("--verify-prefix", default=DEFAULT_VERIFY_PREFIX, help="Preamble added before the original prompt.")
     parser.add_argument("--output", help="Optional path to write the verification output.")
     args = parser.parse_args()
 
@@ -50,7 +57,7 @@ def main() -> None:
     text = prompt_path.read_text(encoding="utf-8")
     with tempfile.NamedTemporaryFile("w+", delete=False, suffix=prompt_path.suffix) as tmp:
         tmp_path = Path(tmp.name)
-        tmp.write(args.verify_prefix + text)
+        tmp.write(build_verify_prompt(text, args.verify_prefix))
 
     rc, out = run_subcall(args.cmd_template, args.model, tmp_path, args.timeout, args.approval_flags, args.with_network)
     if args.output:
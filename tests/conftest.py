@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
-SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
-if str(SCRIPTS_DIR) not in sys.path:
-    sys.path.insert(0, str(SCRIPTS_DIR))
+SKILLS_DIR = Path(__file__).resolve().parents[1] / "skills"
+for scripts_dir in (SKILLS_DIR / "reporting-situation" / "scripts", SKILLS_DIR / "slicing-long-contexts" / "scripts"):
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+
+from async_core import TIMEOUT_RC, RateLimiter, SubcallCache, SubcallExecutor, run_subcall_async
+
+
+def alive(pid):
+    stat = Path(f"/proc/{pid}/stat")
+    if stat.parent.parent.is_dir():
+        # Reparented children may linger as zombies when nothing reaps them
+        return stat.exists() and stat.read_text().split(")")[-1].split()[0] != "Z"
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def subcall(executor, template, prompt_path):
+    return executor.run(template, "m", "q", prompt_path, False, 10, "", False, None)
+
+
+def test_timeout_kills_the_whole_process_group(tmp_path):
+    prompt = tmp_path / "prompt.txt"
+    prompt.write_text("p")
+    pid_file = tmp_path / "child.pid"
+    template = f"sleep 30 & echo $! > {pid_file}; wait"
+
+    start = time.monotonic()
+    code, out = asyncio.run(run_subcall_async(template, "m", "q", prompt, False, 0.5, "", False, None))
+
+    assert code == TIMEOUT_RC and out.startswith("[timeout after 0.5s]")
+    assert time.monotonic() - start < 5
+    pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 2
+    while alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not alive(pid)
+
+
+def test_identical_subcalls_share_one_run(tmp_path):
+    calls = tmp_path / "calls.log"
+    template = f"echo run >> {calls}; sleep 0.2; cat {{prompt_path}}"
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("same slice")
+    second.write_text("same slice")  # different path, same text: same key
+
+    async def main():
+        executor = SubcallExecutor(4, cache=SubcallCache())
+        results = await asyncio.gather(subcall(executor, template, first), subcall(executor, template, second))
+        results.append(await subcall(executor, template, first))
+        return executor, results
+
+    executor, results = asyncio.run(main())
+    assert results == [(0, "same slice")] * 3
+    assert calls.read_text().splitlines() == ["run"]
+    assert (executor.cache.misses, executor.cache.hits) == (1, 2)
+
+
+def test_waiter_reruns_when_the_owner_is_cancelled(tmp_path):
+    calls = tmp_path / "calls.log"
+    template = f"echo run >> {calls}; sleep 1; cat {{prompt_path}}"
+    prompt = tmp_path / "prompt.txt"
+    prompt.write_text("slice")
+
+    async def main():
+        executor = SubcallExecutor(4, cache=SubcallCache())
+        owner = asyncio.create_task(subcall(executor, template, prompt))
+        await asyncio.sleep(0.2)
+        waiter = asyncio.create_task(subcall(executor, template, prompt))
+        await asyncio.sleep(0.2)
+        owner.cancel()
+        result = await waiter
+        return owner, result, executor
+
+    owner, result, executor = asyncio.run(main())
+    assert owner.cancelled()
+    assert result == (0, "slice")
+    assert calls.read_text().splitlines() == ["run", "run"]
+    assert not executor.cache.in_flight
+
+
+def test_rate_limiter_spaces_starts():
+    async def starts(limiter, count):
+        loop = asyncio.get_running_loop()
+        times = []
+        for _ in range(count):
+            await limiter.acquire()
+            times.append(loop.time())
+        return times
+
+    times = asyncio.run(starts(RateLimiter(per_minute=600), 4))
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+    unlimited = asyncio.run(starts(RateLimiter(0), 4))
+    assert unlimited[-1] - unlimited[0] < 0.05
@@ -0,0 +1,71 @@
+from content_store import ContentStore
+from tracker import Tracker
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = ContentStore(tmp_path / "content")
+    path, changed = store.put("google:a", "same text", "2026-01-01T00:00:00Z")
+    assert changed
+    again, changed = store.put("google:a", "same text", "2026-01-01T00:00:00Z")
+    assert again == path and not changed
+    other, _ = store.put("notion:b", "same text")
+    assert other == path
+    assert len(list((tmp_path / "content" / "objects").glob("*/*.md"))) == 1
+
+    store.put("google:a", "edited text")
+    assert store.current_path("google:a").read_text() == "edited text"
+    assert len(store.refs["google:a"]) == 2
+
+
+def test_compaction_prunes_superseded_versions_and_migrates_week_folders(tmp_path):
+    tracker = Tracker(tmp_path)
+    for uid in ("jira:ML-1", "google:a", "google:b"):
+        tracker.update_item(uid, "doc", uid, "u")
+    # Content written by the old week-bucketed layout
+    for week, text in (("2026-W01", "old"), ("2026-W02", "new")):
+        folder = tmp_path / "content" / week
+        folder.mkdir(parents=True)
+        (folder / "jira_ML-1.md").write_text(text)
+    (tmp_path / "content" / "2026-W02" / "unknown_1.md").write_text("orphan")
+    assert tracker.get_content_path("jira:ML-1").read_text() == "new"
+
+    tracker.save_content("google:a", "v1")
+    tracker.save_content("google:a", "v2")
+    tracker.save_content("google:b", "v1")
+
+    dry = tracker.compact_content(dry_run=True)
+    assert dry["versions_pruned"] == 1 and dry["legacy_migrated"] == 2
+    assert (tmp_path / "content" / "2026-W01" / "jira_ML-1.md").exists()
+
+    stats = tracker.compact_content()
+    assert stats["versions_pruned"] == 2  # google:a v1, jira:ML-1 "old"
+    assert stats["objects_removed"] == 1  # "old"; "v1" is still google:b's
+    assert tracker.get_content_path("jira:ML-1").read_text() == "new"
+    assert tracker.get_content_path("google:a").read_text() == "v2"
+    assert tracker.get_content_path("google:b").read_text() == "v1"
+    assert not (tmp_path / "content" / "2026-W01").exists()
+    assert (tmp_path / "content" / "2026-W02" / "unknown_1.md").exists()
+
+    tracker.close()
+    assert Tracker(tmp_path).get_content_path("google:a").read_text() == "v2"
+
+
+def test_compaction_waits_for_running_sweeps(tmp_path):
+    import pytest
+    from content_store import ContentStoreBusy
+
+    run = ContentStore(tmp_path / "content")
+    run.put("google:a", "v1")
+    run.put("google:a", "v2")  # not flushed yet
+
+    compactor = ContentStore(tmp_path / "content")
+    with pytest.raises(ContentStoreBusy):
+        compactor.compact()
+    assert len(list((tmp_path / "content" / "objects").glob("*/*.md"))) == 2
+
+    run.close()
+    stats = compactor.compact()
+    # The run's refs.json is what gets pruned, not the compactor's stale view
+    assert stats["versions_pruned"] == 1
+    assert compactor.current_path("google:a").read_text() == "v2"
+    compactor.close()
@@ -0,0 +1,35 @@
+import json
+
+from corpus import write_corpus
+
+
+def test_write_corpus_orders_caps_and_indexes(tmp_path):
+    big = tmp_path / "big.md"
+    big.write_text("é" * 100, encoding="utf-8")  # 200 bytes
+    small = tmp_path / "small.md"
+    small.write_text("topic body", encoding="utf-8")
+    entries = [
+        {"id": "google:t", "title": "Topic doc", "tags": {"Topic: ML"}, "modified": "2026-02-03T00:00:00Z",
+         "content_path": small, "discussion": ""},
+        {"id": "jira:p", "title": "Person doc", "tags": {"Person: Ana"}, "modified": "2026-02-01T00:00:00Z",
+         "content_path": big, "discussion": "\n\nDiscussion\n"},
+        {"id": "notion:x", "title": "Empty", "tags": {"Topic: ML"}, "modified": None,
+         "content_path": tmp_path / "missing.md", "discussion": ""},
+    ]
+    out = tmp_path / "corpus.md"
+    index, stats = write_corpus(entries, out, "# Corpus\n", max_tokens=None, max_item_tokens=20)
+
+    data = out.read_bytes()
+    assert [d["id"] for d in index] == ["jira:p", "google:t"]
+    assert stats == {"written": 2, "truncated": 1, "over_budget": 0}
+    person = data[index[0]["start"]:index[0]["end"]].decode("utf-8")
+    assert person.startswith("\n\n--- DOCUMENT: Person doc (jira:p) ---")
+    assert "truncated" in person and person.endswith("Discussion\n")
+    assert data[index[1]["start"]:index[1]["end"]].decode("utf-8").endswith("topic body")
+    sidecar = json.loads((tmp_path / "corpus.index.json").read_text())
+    assert sidecar["documents"] == index and sidecar["bytes"] == len(data)
+
+    # A tight global budget keeps the highest-priority item only
+    index, stats = write_corpus(entries, out, "# Corpus\n", max_tokens=40, max_item_tokens=20)
+    assert [d["id"] for d in index] == ["jira:p"]
+    assert stats["over_budget"] == 1
@@ -0,0 +1,48 @@
+import json
+import sys
+from pathlib import Path
+
+import fake_mcp_server
+import providers.base as base
+from fake_mcp_server import FakeBackend
+from providers.guard import configure_sessions
+from providers.jira import JiraProvider
+from providers.mcp_pool import McpPool
+
+
+def test_synthetic_responses_are_deterministic_and_inject_errors():
+    backend = FakeBackend(results=5, id_space=20, seed=1)
+    def file_ids(b):
+        ok, result = b.call("drive.search", {"query": "ml", "pageSize": 3})
+        return [f["id"] for f in json.loads(result["content"][0]["text"])["files"]]
+
+    first = file_ids(backend)
+    assert len(first) == 3
+    assert file_ids(backend) == first
+    assert file_ids(FakeBackend(results=5, id_space=20, seed=1)) == first
+
+    failing = FakeBackend(error_rate=1.0)
+    ok, result = failing.call("notion-search", {"query": "x"})
+    assert not ok and result["isError"]
+
+
+def test_fixture_overrides_synthetic(tmp_path):
+    (tmp_path / "notion-search.json").write_text(json.dumps({"results": [{"id": "p1", "title": "Recorded"}]}))
+    ok, result = FakeBackend(fixtures=tmp_path).call("notion-search", {"query": "x"})
+    assert ok and json.loads(result["content"][0]["text"])["results"][0]["title"] == "Recorded"
+
+
+def test_providers_page_through_fake_server_via_pool():
+    script = Path(fake_mcp_server.__file__)
+    servers = {"@jira": {"command": sys.executable, "args": [str(script), "serve", "--results", "30"]}}
+    pool = McpPool(servers, sessions_per_server=2, timeout=10)
+    configure_sessions(None)
+    base.set_mcp_pool(pool)
+    try:
+        results = JiraProvider().search_team_activity("FAKE", days=7)
+    finally:
+        base.set_mcp_pool(None)
+        pool.close()
+    # 30 results over pages of 25, all converted to hits
+    assert len(results) == 30
+    assert all(hit.provider == "jira" and hit.url.startswith("https://fake.atlassian.net/browse/") for hit in results)
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+
+from freshness import ChangeDetector, change_since
+from tracker import Tracker
+
+
+class FakeProvider:
+    def __init__(self, name):
+        self.name = name
+
+    def get_modified_time(self, metadata):
+        return (metadata or {}).get("updated")
+
+
+def iso(hours_ago):
+    return (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat()
+
+
+def test_change_detector_skips_unchanged_items(tmp_path):
+    tracker = Tracker(tmp_path)
+    jira, notion = FakeProvider("jira"), FakeProvider("notion")
+    detector = ChangeDetector(tracker, overrides={"notion": {"comment_hours": 1}})
+
+    # New item: always fetched
+    tracker.update_item("jira:1", "jira_issue", "t", "u", {"updated": iso(48)})
+    assert detector.should_fetch_content("jira:1", jira)
+
+    # Fetched after the last remote change, 30h ago: older than the old 24h check, still skipped
+    tracker._set_fields("jira:1", last_content_fetch=iso(30), last_comment_fetch=iso(30))
+    assert not detector.should_fetch_content("jira:1", jira)
+    assert not detector.should_fetch_comments("jira:1", jira)
+
+    # Remote change since the last fetch
+    tracker.update_item("jira:1", "jira_issue", "t", "u", {"updated": iso(1)})
+    assert detector.should_fetch_content("jira:1", jira)
+    assert detector.should_fetch_comments("jira:1", jira)
+
+    # Notion comments don't move last_edited_time: age-based, with the override
+    tracker.update_item("notion:1", "notion_page", "t", "u", {"updated": iso(48)})
+    tracker._set_fields("notion:1", last_comment_fetch=iso(2))
+    assert detector.should_fetch_comments("notion:1", notion)
+
+    assert detector.report() == [
+        "jira: content 1/3 skipped (33%), comments 1/2 skipped (50%)",
+        "notion: content 0/0 skipped (0%), comments 0/1 skipped (0%)",
+    ]
+
+
+def test_change_since_builds_incremental_delta(tmp_path):
+    tracker = Tracker(tmp_path)
+    jira = FakeProvider("jira")
+    last_run = iso(24)
+
+    metadata = {"updated": iso(48)}
+    is_new, item = tracker.update_item("jira:1", "jira_issue", "t", "u", metadata)
+    assert change_since(item, jira, last_run, is_new, metadata) == "new"
+    assert change_since(item, jira, None, metadata=metadata) == "new"
+
+    # Seen before but never fetched
+    assert change_since(item, jira, last_run, metadata=metadata) == "pending"
+
+    tracker.touch_content_fetch("jira:1")
+    assert change_since(tracker.get_summary("jira:1"), jira, last_run, metadata=metadata) is None
+
+    # Fetched early in the previous run, edited before that run ended (before last_run)
+    tracker._set_fields("jira:1", last_content_fetch=iso(30))
+    metadata = {"updated": iso(28)}
+    _, item = tracker.update_item("jira:1", "jira_issue", "t", "u", metadata)
+    assert change_since(item, jira, last_run, metadata=metadata) == "updated"
+
+    metadata = {"updated": iso(1)}
+    _, item = tracker.update_item("jira:1", "jira_issue", "t", "u", metadata)
+    assert change_since(item, jira, last_run, metadata=metadata) == "updated"
+
+
+def test_failed_comment_fetch_is_retried_next_run(tmp_path):
+    import orchestrator
+
+    class CommentProvider(FakeProvider):
+        def __init__(self, comments):
+            super().__init__("notion")
+            self.comments = comments
+
+        def get_content(self, unique_id, metadata=None):
+            return None
+
+        def get_comments(self, unique_id, metadata=None):
+            return self.comments
+
+    tracker = Tracker(tmp_path)
+    tracker.update_item("notion:1", "page", "t", "u", {})
+    detector = ChangeDetector(tracker)
+
+    # None: the call failed, so the check isn't recorded
+    orchestrator.process_item("notion:1", CommentProvider(None), tracker, {}, set(), detector)
+    assert not tracker.get_summary("notion:1").get("last_comment_fetch")
+
+    # []: a real answer with no comments
+    orchestrator.process_item("notion:1", CommentProvider([]), tracker, {}, set(), detector)
+    assert tracker.get_summary("notion:1").get("last_comment_fetch")
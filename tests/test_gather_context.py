@@ -1,6 +1,15 @@
 import json
 
+import pytest
+
 import gather_context
+from tracker import Tracker
+
+
+@pytest.fixture(autouse=True)
+def isolated_tracker(monkeypatch, tmp_path):
+    # main() keeps its identity cache in the tracker; keep it out of the real data dir
+    monkeypatch.setattr(gather_context, "open_tracker", lambda data_dir=None, backend="json": Tracker(tmp_path))
 
 
 def test_gather_context_skips_jira_without_cloud_id(monkeypatch, capsys):
@@ -70,3 +79,43 @@ def test_gather_context_maps_topics_and_teams(monkeypatch, capsys):
         tool == "searchJiraIssuesUsingJql" and args["cloudId"] == "cloud-1"
         for _, tool, args in calls
     )
+
+
+def test_gather_runs_calls_concurrently_and_merges_keywords(monkeypatch):
+    import threading
+    import time
+
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_run_mcpc(session, tool, args):
+        with lock:
+            running.append(tool)
+            peak.append(len(running))
+        try:
+            if args.get("query") == "slow":
+                time.sleep(2)
+            else:
+                time.sleep(0.1)
+            if tool == "notion-search":
+                return {"results": [{"id": "shared"}, {"id": f"page-{args['query']}"}]}
+            return {"tool": tool}
+        finally:
+            with lock:
+                running.remove(tool)
+
+    monkeypatch.setattr(gather_context, "run_mcpc", fake_run_mcpc)
+    config = {
+        "topics": [{"keywords": ["alpha", "beta"]}, {"keywords": ["Alpha", "slow"]}],
+        "jira_projects": ["ABC"],
+        "providers": {"jira": {"cloud_id": "cloud-1"}},
+    }
+    start = time.monotonic()
+    data = gather_context.gather(config, max_workers=8, budget_seconds=0.5)
+
+    assert time.monotonic() - start < 1.5
+    assert max(peak) > 1
+    assert set(data) == {"calendar", "gmail", "notion", "jira"}
+    # "Alpha" duplicates "alpha"; "slow" missed the budget
+    assert [r["id"] for r in data["notion"]["results"]] == ["shared", "page-alpha", "page-beta"]
@@ -0,0 +1,59 @@
+import time
+
+import providers.base as base
+from providers.guard import configure_sessions, get_guard, health_report
+
+
+def test_circuit_opens_after_repeated_failures_and_recovers(monkeypatch):
+    configure_sessions({"@flaky": {"failure_threshold": 2, "reset_seconds": 0.05}})
+    try:
+        outcomes = iter([
+            base.McpCallError("boom"),
+            base.McpCallError("slow", timed_out=True),
+            {"ok": True},
+        ])
+        calls = []
+
+        def fake_subprocess(session, tool, args, timeout=None):
+            calls.append(tool)
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(base, "run_mcpc_subprocess", fake_subprocess)
+        assert base.run_mcpc("@flaky", "a", {}) is None
+        assert base.run_mcpc("@flaky", "b", {}) is None
+        # Open: fails fast without calling the server
+        assert base.run_mcpc("@flaky", "c", {}) is None
+        assert calls == ["a", "b"]
+
+        time.sleep(0.06)
+        # Half-open trial call succeeds and closes the circuit
+        assert base.run_mcpc("@flaky", "d", {}) == {"ok": True}
+        guard = get_guard("@flaky")
+        assert guard.healthy
+        assert guard.counts == {"calls": 3, "failed": 2, "timeouts": 1, "rejected": 1}
+        assert health_report()[0].startswith("@flaky: 3 calls, 2 failed (1 timeouts), 1 rejected")
+    finally:
+        configure_sessions(None)
+
+
+def test_unexpected_errors_return_none_and_settle_half_open_circuit(monkeypatch):
+    def undecodable_output(*args, **kwargs):
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    configure_sessions({"@odd": {"failure_threshold": 1, "reset_seconds": 0.01}})
+    try:
+        monkeypatch.setattr(base.subprocess, "run", undecodable_output)
+        assert base.run_mcpc("@odd", "a", {}) is None
+        guard = get_guard("@odd")
+        assert guard.breaker.state == "open"
+
+        time.sleep(0.02)
+        # The half-open trial fails the same way: the circuit reopens instead of sticking
+        assert base.run_mcpc("@odd", "b", {}) is None
+        assert guard.breaker.state == "open"
+        assert guard.counts["failed"] == 2
+    finally:
+        configure_sessions(None)
@@ -0,0 +1,61 @@
+import providers.base as base
+from providers.identity import IdentityCache
+from providers.jira import JiraProvider
+from tracker import SqliteTracker, Tracker
+
+
+def test_identity_cache_persists_with_ttls(tmp_path):
+    tracker = SqliteTracker(tmp_path)
+    cache = IdentityCache(tracker, ttl_hours=1, negative_ttl_hours=0)
+    cache.set("jira", "user:@ana", "acc-ana")
+    cache.set("jira", "user:@ghost", None)
+    tracker.set_mapping("team", "ML", {"jira_project": "ML"})
+    tracker.close()
+
+    warm = IdentityCache(SqliteTracker(tmp_path))
+    assert set(warm.entries) == {"jira:user:@ana", "jira:user:@ghost"}
+    assert warm.get("jira", "user:@ana") == (True, "acc-ana")
+    # Negative entry was stored with a zero TTL, so it has already expired
+    assert warm.get("jira", "user:@ghost") == (False, None)
+
+
+def test_jira_lookups_are_served_from_the_cache_on_the_next_run(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run_mcpc(session, tool, args):
+        calls.append(tool)
+        if tool == "getAccessibleAtlassianResources":
+            return [{"id": "cloud-1", "url": "https://x.atlassian.net/"}]
+        if tool == "lookupJiraAccountId":
+            return [{"accountId": "acc-ana"}] if args["searchString"] == "ana" else []
+        return None
+
+    monkeypatch.setattr("providers.jira.run_mcpc", fake_run_mcpc)
+    tracker = Tracker(tmp_path)
+    base.set_identity_cache(IdentityCache(tracker))
+    try:
+        first = JiraProvider()
+        assert first._resolve_user("@ana") == "acc-ana"
+        assert first._resolve_user("@ghost") is None
+        assert calls == ["getAccessibleAtlassianResources", "lookupJiraAccountId", "lookupJiraAccountId"]
+        tracker.close()
+
+        calls.clear()
+        base.set_identity_cache(IdentityCache(Tracker(tmp_path)))
+        second = JiraProvider()
+        assert second._resolve_user("@ana") == "acc-ana"
+        assert second._resolve_user("@ghost") is None
+        assert second._ensure_cloud_id() and second.base_url == "https://x.atlassian.net"
+        assert calls == []
+
+        # A different configured site doesn't reuse the first site's ids
+        other = JiraProvider(cloud_id="cloud-2", base_url="https://y.atlassian.net")
+        assert other._resolve_user("@ana") == "acc-ana"
+        assert calls == ["lookupJiraAccountId"]
+    finally:
+        base.set_identity_cache(None)
+
+
+def test_identity_ttls_come_from_settings(tmp_path):
+    cache = IdentityCache.from_settings(Tracker(tmp_path), {"identity_ttl_hours": 2, "identity_negative_ttl_hours": 0.5})
+    assert (cache.ttl_hours, cache.negative_ttl_hours) == (2, 0.5)
@@ -0,0 +1,106 @@
+import sys
+import textwrap
+import threading
+
+import providers.base as base
+from providers.mcp_pool import McpPool
+
+FAKE_SERVER = textwrap.dedent(
+    """
+    import json, sys, threading, time
+
+    lock = threading.Lock()
+
+    def reply(msg):
+        with lock:
+            sys.stdout.write(json.dumps(msg) + "\\n")
+            sys.stdout.flush()
+
+    def handle(req):
+        if req["method"] == "initialize":
+            reply({"jsonrpc": "2.0", "id": req["id"], "result": {"protocolVersion": "2025-06-18", "capabilities": {}}})
+        elif req["method"] == "tools/call":
+            args = req["params"]["arguments"]
+            time.sleep(args.get("delay", 0))
+            text = json.dumps({"echo": args.get("value"), "tool": req["params"]["name"]})
+            reply({"jsonrpc": "2.0", "id": req["id"], "result": {"content": [{"type": "text", "text": text}]}})
+
+    for line in sys.stdin:
+        req = json.loads(line)
+        if "id" in req:
+            threading.Thread(target=handle, args=(req,)).start()
+    """
+)
+
+
+def make_pool(tmp_path, sessions_per_server=1):
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_SERVER)
+    servers = {"@fake": {"command": sys.executable, "args": [str(script)]}}
+    return McpPool(servers, sessions_per_server=sessions_per_server, timeout=10)
+
+
+def test_run_mcpc_uses_pool_and_multiplexes(tmp_path, monkeypatch):
+    pool = make_pool(tmp_path)
+    monkeypatch.setattr(base, "run_mcpc_subprocess", lambda *a: (_ for _ in ()).throw(AssertionError("spawned mcpc")))
+    base.set_mcp_pool(pool)
+    try:
+        results = {}
+
+        def call(i):
+            results[i] = base.run_mcpc("@fake", "echo", {"value": i, "delay": 0.2})
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {i: {"echo": i, "tool": "echo"} for i in range(5)}
+        # All calls shared one long-lived server process
+        assert len(pool._sessions["@fake"]) == 1
+    finally:
+        base.set_mcp_pool(None)
+        pool.close()
+
+
+def test_run_mcpc_falls_back_for_unpooled_sessions(tmp_path, monkeypatch):
+    pool = make_pool(tmp_path)
+    calls = []
+    monkeypatch.setattr(base, "run_mcpc_subprocess", lambda session, tool, args, timeout=None: calls.append(session) or {"ok": True})
+    base.set_mcp_pool(pool)
+    try:
+        assert base.run_mcpc("@jira", "getJiraIssue", {}) == {"ok": True}
+        assert calls == ["@jira"]
+    finally:
+        base.set_mcp_pool(None)
+        pool.close()
+
+
+
+def test_closed_or_exited_sessions_fail_fast(tmp_path):
+    import time
+
+    import pytest
+    from providers.mcp_pool import McpPoolError, StdioMcpSession
+
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_SERVER)
+    session = StdioMcpSession("@fake", sys.executable, [str(script)], timeout=10)
+    session.start()
+
+    # The server exits: once the reader has seen EOF, requests fail at once instead of waiting out the timeout
+    session._proc.stdin.close()
+    session._proc.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while not session._eof and time.monotonic() < deadline:
+        time.sleep(0.01)
+    start = time.monotonic()
+    with pytest.raises(McpPoolError):
+        session.call_tool("echo", {"value": 1})
+    assert time.monotonic() - start < 1
+
+    # A sender that raced close() gets a pool error, not an AttributeError on the cleared process
+    session.close()
+    with pytest.raises(McpPoolError):
+        session._send({"jsonrpc": "2.0", "method": "ping"})
@@ -3,6 +3,8 @@ from datetime import datetime, timezone
 from providers.google import GoogleProvider
 from providers.notion import NotionProvider
 from providers.jira import JiraProvider
+from providers.hit import RawStore, SearchHit
+import providers.base as base
 
 
 def test_google_provider_includes_provider_field(monkeypatch):
@@ -23,9 +25,11 @@ def test_google_provider_includes_provider_field(monkeypatch):
     provider = GoogleProvider()
     results = provider.search_topic_activity("ml", days=1)
 
-    assert results
-    assert results[0]["provider"] == "google"
-    assert results[0]["id"].startswith("google:")
+    assert results == [SearchHit(
+        "google:abc123", "google", "application/vnd.google-apps.document", "Sample Doc",
+        "https://example.com/doc", "2026-02-01T00:00:00Z",
+    )]
+    assert not hasattr(results[0], "__dict__")
 
 
 def test_notion_provider_filters_by_timestamp(monkeypatch):
@@ -49,9 +53,7 @@ def test_notion_provider_filters_by_timestamp(monkeypatch):
     provider = NotionProvider()
     results = provider.search_topic_activity("topic", days=7)
 
-    assert results
-    assert results[0]["provider"] == "notion"
-    assert results[0]["id"].startswith("notion:")
+    assert results == [SearchHit("notion:page123", "notion", "page", "Recent", "https://notion.so/page123", recent)]
 
 
 def test_jira_provider_uses_cloud_id_from_config(monkeypatch):
@@ -71,9 +73,201 @@ def test_jira_provider_uses_cloud_id_from_config(monkeypatch):
         return None
 
     monkeypatch.setattr("providers.jira.run_mcpc", fake_run_mcpc)
-    provider = JiraProvider(cloud_id="cloud-123", base_url="https://example.atlassian.net")
-    results = provider.search_team_activity("ABC", days=3)
+    raw_store = RawStore()
+    base.set_raw_store(raw_store)
+    try:
+        provider = JiraProvider(cloud_id="cloud-123", base_url="https://example.atlassian.net")
+        results = provider.search_team_activity("ABC", days=3)
+    finally:
+        base.set_raw_store(None)
 
-    assert results
-    assert results[0]["provider"] == "jira"
-    assert results[0]["url"].startswith("https://example.atlassian.net/browse/")
+    assert results == [SearchHit(
+        "jira:ABC-1", "jira", "issue", "ABC-1: Test",
+        "https://example.atlassian.net/browse/ABC-1", "2026-02-01T00:00:00Z",
+    )]
+    assert provider.get_modified_time(results[0].metadata()) == "2026-02-01T00:00:00Z"
+    # Raw issues go to the side store only
+    assert raw_store.get("jira:ABC-1")["key"] == "ABC-1"
+
+
+def test_jira_content_and_comments_share_one_issue_fetch(monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+    release = threading.Event()
+
+    def fake_run_mcpc(session, tool, args):
+        calls.append((tool, args.get("issueIdOrKey")))
+        if tool == "getJiraIssue":
+            release.wait(timeout=5)
+            return {
+                "key": args["issueIdOrKey"],
+                "fields": {
+                    "description": "Body",
+                    "comment": {"comments": [{"author": {"displayName": "Ana"}, "body": "hi", "created": "2026-02-01"}]},
+                },
+            }
+        if tool == "searchJiraIssuesUsingJql":
+            return {"issues": [{"key": "ABC-2", "fields": {"summary": "S", "description": "Seeded", "comment": {"comments": []}}}]}
+        return None
+
+    monkeypatch.setattr("providers.jira.run_mcpc", fake_run_mcpc)
+    provider = JiraProvider(cloud_id="cloud-123")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        content = pool.submit(provider.get_content, "jira:ABC-1")
+        comments = pool.submit(provider.get_comments, "jira:ABC-1")
+        release.set()
+        assert content.result() == "Body"
+        assert comments.result()[0]["author"] == "Ana"
+    assert calls.count(("getJiraIssue", "ABC-1")) == 1
+
+    # Search hits that already carry description/comment need no fetch at all
+    provider.search_team_activity("ABC", days=3)
+    assert provider.get_content("jira:ABC-2") == "Seeded"
+    assert provider.get_comments("jira:ABC-2") == []
+    assert provider.issue_fetches == 1
+
+
+def test_google_dispatches_by_mime_type(monkeypatch):
+    calls = []
+
+    def fake_run_mcpc(session, tool, args):
+        calls.append(tool)
+        if tool == "sheets.getText":
+            return "a,b"
+        if tool == "sheets.listComments":
+            return {"comments": [{"author": {"displayName": "Ana"}, "content": "hi"}]}
+        return None
+
+    monkeypatch.setattr("providers.google.run_mcpc", fake_run_mcpc)
+    provider = GoogleProvider()
+    sheet = {"mimeType": "application/vnd.google-apps.spreadsheet"}
+    assert provider.get_content("google:s1", metadata=sheet) == "a,b"
+    assert provider.get_comments("google:s1", metadata=sheet)[0]["author"] == "Ana"
+    assert calls == ["sheets.getText", "sheets.listComments"]
+
+    # PDFs have no text tool: no calls at all
+    calls.clear()
+    pdf = {"mimeType": "application/pdf"}
+    assert provider.get_content("google:p1", metadata=pdf) is None
+    assert provider.get_comments("google:p1", metadata=pdf) == []
+    assert calls == []
+
+    # Unmapped Google types are probed once, then routed to what worked
+    other = {"mimeType": "application/vnd.google-apps.other"}
+    provider.get_content("google:o1", metadata=other)
+    assert calls == ["docs.getText", "slides.getText", "sheets.getText"]
+    calls.clear()
+    provider.get_content("google:o2", metadata=other)
+    assert calls == ["sheets.getText"]
+
+
+def test_google_only_rules_out_types_the_tools_rejected(monkeypatch):
+    calls = []
+    answers = {}
+
+    def fake_run_mcpc(session, tool, args):
+        calls.append(tool)
+        return answers.get(tool)
+
+    monkeypatch.setattr("providers.google.run_mcpc", fake_run_mcpc)
+    provider = GoogleProvider()
+    form = {"mimeType": "application/vnd.google-apps.form"}
+
+    # Every call failed (timeouts, open circuit): nothing learned, probed again next time
+    assert provider.get_content("google:f1", metadata=form) is None
+    assert provider.get_content("google:f2", metadata=form) is None
+    assert len(calls) == 6
+
+    # Every tool answered that it can't read the file: skipped from then on
+    answers.update({tool: {"error": "unsupported file"} for tool in ("docs.getText", "slides.getText", "sheets.getText")})
+    provider.get_content("google:f3", metadata=form)
+    calls.clear()
+    assert provider.get_content("google:f4", metadata=form) is None
+    assert calls == []
+
+
+def test_jira_batches_collaborators_and_pages(monkeypatch):
+    searches = []
+
+    def fake_run_mcpc(session, tool, args):
+        if tool == "lookupJiraAccountId":
+            return [{"accountId": f"acc-{args['searchString']}"}]
+        if tool == "searchJiraIssuesUsingJql":
+            searches.append(args)
+            if args["jql"].startswith("issuekey in"):
+                # Per-person follow-up for hits the fields don't explain
+                return {"issues": [{"key": "ABC-3"}], "isLast": True} if "acc-ana" in args["jql"] else {"issues": [], "isLast": True}
+            if "nextPageToken" not in args:
+                return {
+                    "issues": [{"key": "ABC-1", "fields": {"summary": "A", "assignee": {"accountId": "acc-ana"}}}],
+                    "nextPageToken": "page2",
+                    "isLast": False,
+                }
+            return {
+                "issues": [
+                    {"key": "ABC-2", "fields": {"summary": "Ping @bo about this"}},
+                    {"key": "ABC-3", "fields": {"summary": "Edited, bold also"}},
+                ],
+                "isLast": True,
+            }
+        return None
+
+    monkeypatch.setattr("providers.jira.run_mcpc", fake_run_mcpc)
+    provider = JiraProvider(cloud_id="cloud-123")
+    by_handle = provider.search_collabs_activity(["@ana", "@bo"], days=7)
+
+    # One query for both people, followed across pages, with room for both
+    batched = [s for s in searches if not s["jql"].startswith("issuekey in")]
+    assert {s["jql"] for s in batched} == {batched[0]["jql"]}
+    assert 'assignee in ("acc-ana", "acc-bo")' in batched[0]["jql"]
+    assert batched[1]["nextPageToken"] == "page2"
+    assert batched[0]["maxResults"] == 25
+    # ABC-3 only matched via updatedBy(): resolved per person, not given to everyone
+    follow_ups = [s["jql"] for s in searches if s["jql"].startswith("issuekey in")]
+    assert len(follow_ups) == 2 and all('("ABC-3")' in jql for jql in follow_ups)
+    assert [r.id for r in by_handle["@ana"]] == ["jira:ABC-1", "jira:ABC-3"]
+    assert by_handle["@ana"][0].author_ids == ("acc-ana",)
+    # "bold" doesn't count as a mention of @bo
+    assert [r.id for r in by_handle["@bo"]] == ["jira:ABC-2"]
+
+
+def test_google_merges_topic_keywords(monkeypatch):
+    queries = []
+
+    def fake_run_mcpc(session, tool, args):
+        queries.append(args)
+        return {
+            "files": [
+                {"id": "f1", "name": "Feature Store design", "mimeType": "application/vnd.google-apps.document"},
+                {"id": "f2", "name": "Q3 notes", "mimeType": "application/vnd.google-apps.document"},
+            ]
+        }
+
+    monkeypatch.setattr("providers.google.run_mcpc", fake_run_mcpc)
+    provider = GoogleProvider()
+    by_keyword = provider.search_topics_activity(["feature store", "inference"], days=7)
+
+    assert len(queries) == 1
+    assert "fullText contains 'feature store' or fullText contains 'inference'" in queries[0]["query"]
+    assert queries[0]["pageSize"] == 20
+    # Title match attributes f1 to one keyword; f2 matched on body text, so it stays with both
+    assert [r.id for r in by_keyword["feature store"]] == ["google:f1", "google:f2"]
+    assert [r.id for r in by_keyword["inference"]] == ["google:f2"]
+
+
+def test_google_caps_keywords_per_merged_query(monkeypatch):
+    queries = []
+
+    def fake_run_mcpc(session, tool, args):
+        queries.append(args)
+        return {"files": []}
+
+    monkeypatch.setattr("providers.google.run_mcpc", fake_run_mcpc)
+    keywords = [f"kw{i}" for i in range(25)]
+    by_keyword = GoogleProvider().search_topics_activity(keywords, days=7)
+
+    assert [q["pageSize"] for q in queries] == [100, 100, 50]
+    assert "fullText contains 'kw9'" in queries[0]["query"] and "'kw10'" not in queries[0]["query"]
+    assert set(by_keyword) == set(keywords)
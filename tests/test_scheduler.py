@@ -0,0 +1,50 @@
+import threading
+import time
+
+from scheduler import PipelineScheduler
+
+
+def test_scheduler_priorities_limits_and_streaming():
+    order = []
+    lock = threading.Lock()
+    running = {"jira": 0, "peak": 0}
+
+    def job(name, provider=None):
+        with lock:
+            order.append(name)
+            if provider == "jira":
+                running["jira"] += 1
+                running["peak"] = max(running["peak"], running["jira"])
+        time.sleep(0.01)
+        if provider == "jira":
+            with lock:
+                running["jira"] -= 1
+
+    scheduler = PipelineScheduler(max_workers=1, provider_limits={"jira": 1})
+
+    def search():
+        job("search")
+        # Jobs can stream follow-up work into the same pool
+        scheduler.submit(0, 1, "google", "process", job, "process")
+
+    scheduler.submit(2, 0, "google", "search", job, "topic")
+    scheduler.submit(0, 0, "google", "search", search)
+    assert scheduler.run()
+    # Collaborator search and its processing run before the topic search
+    assert order == ["search", "process", "topic"]
+
+    scheduler = PipelineScheduler(max_workers=4, provider_limits={"jira": 1})
+    for i in range(6):
+        scheduler.submit(0, 0, "jira", "search", job, f"j{i}", "jira")
+    assert scheduler.run()
+    assert running["peak"] == 1
+
+
+def test_scheduler_deadline_drops_queued_jobs():
+    scheduler = PipelineScheduler(max_workers=1, deadline_seconds=0.05, grace_seconds=1)
+    for _ in range(5):
+        scheduler.submit(0, 0, "google", "search", time.sleep, 0.04)
+    assert scheduler.run()
+    stats = scheduler.stats["search"]
+    assert stats["done"] >= 1 and stats["dropped"] >= 1
+    assert stats["done"] + stats["dropped"] == 5
@@ -0,0 +1,92 @@
+from providers.hit import SearchHit
+from search_cache import SearchCache
+
+
+class FakeProvider:
+    name = "google"
+
+    def __init__(self):
+        self.calls = 0
+
+    def search_topic_activity(self, keyword, days=7):
+        self.calls += 1
+        return [SearchHit(f"google:{keyword}", "google", "doc", keyword, modified_time="2026-02-01T00:00:00Z")]
+
+
+def test_search_cache_reuses_results_across_runs(tmp_path):
+    provider = FakeProvider()
+    cache = SearchCache(tmp_path, max_age_hours=1)
+    first = cache.call(provider.search_topic_activity, ("ML Platform", 7))
+    # Normalized args hit the same entry
+    second = cache.call(provider.search_topic_activity, ("ml  platform", 7))
+    cache.save()
+
+    assert first == second
+    assert first[0].modified_time == "2026-02-01T00:00:00Z"
+    assert provider.calls == 1
+    assert cache.report() == ["google: 1/2 cached (50%)"]
+
+    reloaded = SearchCache(tmp_path, max_age_hours=1)
+    assert reloaded.call(provider.search_topic_activity, ("ML Platform", 7)) == first
+    assert provider.calls == 1
+
+
+def test_search_cache_disabled_with_zero_age(tmp_path):
+    provider = FakeProvider()
+    cache = SearchCache(tmp_path, max_age_hours=0)
+    cache.call(provider.search_topic_activity, ("ml", 7))
+    cache.call(provider.search_topic_activity, ("ml", 7))
+    cache.save()
+
+    assert provider.calls == 2
+    assert not (tmp_path / "search_cache.json").exists()
+
+
+def test_batched_results_skip_all_empty_and_match_keys_case_insensitively(tmp_path):
+    import threading
+
+    import orchestrator
+
+    class BatchProvider:
+        name = "google"
+
+        def __init__(self, results):
+            self.results = results
+            self.calls = 0
+
+        def search_topics_activity(self, keywords, days=7):
+            self.calls += 1
+            return self.results
+
+    cache = SearchCache(tmp_path, max_age_hours=1)
+    failing = BatchProvider({"ML": [], "Infra": []})
+    cache.call(failing.search_topics_activity, (["ML", "Infra"], 7))
+    cache.call(failing.search_topics_activity, (["ML", "Infra"], 7))
+    assert failing.calls == 2  # every list empty: not cached
+
+    hit = SearchHit("google:1", "google", "doc", "ML notes")
+    cache.call(BatchProvider({"ML": [hit], "Infra": []}).search_topics_activity, (["ML", "Infra"], 7))
+    # Config now spells the keyword differently: the cached "ML" key must still map to its tag
+    recorded = []
+    orchestrator.run_search_task(
+        BatchProvider({}).search_topics_activity, (["ml", "infra"], 7), {"ml": "Topic: ML", "infra": "Topic: ML"},
+        threading.Lock(), lambda results, tag: recorded.append((tag, [r.id for r in results])), cache,
+    )
+    assert recorded == [("Topic: ML", ["google:1"])]
+
+
+def test_entries_from_older_cache_formats_are_misses(tmp_path):
+    import json
+    from datetime import datetime, timezone
+
+    provider = FakeProvider()
+    cache = SearchCache(tmp_path, max_age_hours=1)
+    key = cache.make_key("google", "search_topic_activity", ("ml", 7))
+    # Written before results were SearchHits: no modified_time, no format version
+    legacy = {"stored_at": datetime.now(timezone.utc).isoformat(), "results": [{"id": "google:ml", "title": "ml"}]}
+    (tmp_path / "search_cache.json").write_text(json.dumps({key: legacy}))
+
+    cache = SearchCache(tmp_path, max_age_hours=1)
+    results = cache.call(provider.search_topic_activity, ("ml", 7))
+    assert provider.calls == 1
+    assert results[0].modified_time == "2026-02-01T00:00:00Z"
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import fake_mcp_server
+import orchestrator
+from providers.mcp_pool import McpPool
+
+
+def test_sessions_are_probed_concurrently_and_only_unhealthy_ones_restarted(monkeypatch):
+    commands = []
+    restarted = set()
+
+    def fake_run(cmd, capture_output, text, timeout):
+        _, session, command = cmd
+        commands.append((session, command))
+        time.sleep(0.2)
+        if command == "restart":
+            restarted.add(session)
+            return subprocess.CompletedProcess(cmd, 0 if session != "@jira" else 1, "", "auth expired")
+        healthy = session == "@google" or (session == "@notion" and session in restarted)
+        return subprocess.CompletedProcess(cmd, 0 if healthy else 1, "", "not connected")
+
+    monkeypatch.setattr(orchestrator.subprocess, "run", fake_run)
+    start = time.monotonic()
+    status = orchestrator.check_sessions(["@google", "@jira", "@notion"], timeout=5)
+
+    # Three sessions, at most probe + restart + probe each, in parallel
+    assert time.monotonic() - start < 1.0
+    assert status["@google"] == ("ok", "")
+    assert status["@notion"] == ("restarted", "")
+    assert status["@jira"][0] == "degraded" and "auth expired" in status["@jira"][1]
+    assert ("@google", "restart") not in commands
+
+
+def test_pooled_sessions_are_warmed_up_by_the_probe():
+    script = Path(fake_mcp_server.__file__)
+    pool = McpPool({
+        "@google": {"command": sys.executable, "args": [str(script), "serve"]},
+        "@broken": {"command": "/nonexistent/mcp-server"},
+    }, timeout=10)
+    try:
+        status = orchestrator.check_sessions(["@google", "@broken"], pool, timeout=5)
+        assert status["@google"] == ("ok", "")
+        assert status["@broken"][0] == "degraded"
+        assert pool._sessions["@google"] and pool._sessions["@google"][0].alive
+    finally:
+        pool.close()
@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import pytest
+
+from async_core import AsyncWriter
+from slice_runner import apply_provider_defaults, build_executor, build_parser, run
+from slice_utils import doc_boundaries, load_doc_index, slice_by_doc_index
+
+
+def build_corpus(bodies, header="# Corpus\n"):
+    """Corpus text plus a byte-offset index, laid out like corpus.write_corpus does."""
+    text, docs = header, []
+    for i, body in enumerate(bodies):
+        start = len(text.encode("utf-8"))
+        text += f"\n--- DOCUMENT {i} ---\n{body}"
+        docs.append({"id": f"doc{i}", "start": start, "end": len(text.encode("utf-8"))})
+    return text, {"documents": docs, "bytes": len(text.encode("utf-8"))}
+
+
+def write_index(tmp_path, index):
+    path = tmp_path / "corpus.index.json"
+    path.write_text(json.dumps(index), encoding="utf-8")
+    return path
+
+
+def test_non_ascii_corpus_slices_on_document_starts(tmp_path):
+    bodies = ["café " * 20, "日本語のテキスト" * 10, "emoji 🚀 " * 15, "plain"]
+    prompt, index = build_corpus(bodies)
+    docs = load_doc_index(write_index(tmp_path, index), prompt)
+
+    boundaries = doc_boundaries(prompt, docs)
+    assert [prompt[pos:].startswith(f"\n--- DOCUMENT {i} ---") for i, pos in enumerate(boundaries)] == [True] * 4
+
+    slices = slice_by_doc_index(prompt, docs, chunk_size=120, max_slices=10, base_dir=tmp_path)
+    assert "".join(s.text for s in slices) == prompt
+    assert slices[0].text.startswith("# Corpus\n")
+    for i, body in enumerate(bodies):
+        assert sum(body in s.text for s in slices) == 1, f"document {i} was cut"
+
+
+def test_oversized_document_gets_a_slice_of_its_own(tmp_path):
+    prompt, index = build_corpus(["small one", "x" * 500, "small two"])
+    slices = slice_by_doc_index(prompt, index["documents"], chunk_size=100, max_slices=10, base_dir=tmp_path)
+
+    assert [s.tag for s in slices] == ["d0", "d1", "d2"]
+    assert slices[1].text == "\n--- DOCUMENT 1 ---\n" + "x" * 500
+    assert "".join(s.text for s in slices) == prompt
+
+
+def test_stale_index_is_rejected(tmp_path):
+    prompt, index = build_corpus(["é" * 10, "second"])
+    path = write_index(tmp_path, {**index, "bytes": index["bytes"] + 1})
+
+    with pytest.raises(ValueError, match="byte corpus"):
+        load_doc_index(path, prompt)
+    # Without the prompt (or a recorded size) there is nothing to compare
+    assert load_doc_index(path) == index["documents"]
+
+    # Offsets from a different corpus that land inside a character are refused too
+    first, second = index["documents"]
+    inside_e = first["start"] + len("\n--- DOCUMENT 0 ---\n".encode("utf-8")) + 1
+    with pytest.raises(ValueError, match="character boundary"):
+        doc_boundaries(prompt, [first, {**second, "start": inside_e}])
+
+
+def test_runner_ignores_an_index_for_another_corpus(tmp_path, capsys):
+    prompt, index = build_corpus(["é" * 10, "second"])
+    path = write_index(tmp_path, {**index, "bytes": index["bytes"] + 1})
+    prompt_path = tmp_path / "corpus.md"
+    prompt_path.write_text(prompt, encoding="utf-8")
+    args = build_parser().parse_args([
+        "--prompt", str(prompt_path), "--question", "q", "--doc-index", str(path), "--dry-run",
+        "--progress-log", str(tmp_path / "progress.log"), "--results-json", str(tmp_path / "results.json"),
+    ])
+    apply_provider_defaults(args)
+
+    async def main():
+        async with AsyncWriter() as writer:
+            await run(args, prompt, tmp_path, tmp_path / "final.txt", {}, {"id": "t"}, build_executor(args), writer)
+
+    asyncio.run(main())
+    assert "Ignoring document index" in capsys.readouterr().out
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest and not any(entry["tag"].startswith("d") for entry in manifest)
@@ -0,0 +1,18 @@
+from sweep import SweepResults
+
+
+def test_sweep_dedupes_items_and_indexes_tags():
+    sweep = SweepResults()
+    google, notion = object(), object()
+
+    assert sweep.add("google:1", google, "Topic: ML") is True
+    assert sweep.add("notion:2", notion, "Topic: ML") is True
+    assert sweep.add("google:1", google, "Person: Ada") is False
+    assert sweep.add("google:1", google, "Topic: ML") is False
+
+    assert len(sweep) == 2
+    assert list(sweep) == [("google:1", google), ("notion:2", notion)]
+    assert sweep.item_tags["google:1"] == {"Topic: ML", "Person: Ada"}
+    assert sweep.ids_for_tag("Topic: ML") == ["google:1", "notion:2"]
+    assert sweep.ids_for_tag("Person: Ada") == ["google:1"]
+    assert sweep.ids_for_tag("Team: Missing") == []
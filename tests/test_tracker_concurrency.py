@@ -0,0 +1,34 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tracker import open_tracker
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_tracker_concurrent_updates_are_not_lost(tmp_path, backend):
+    tracker = open_tracker(tmp_path, backend=backend)
+    tracker.start_background_writer(interval=0.01)
+    ids = [f"google:{i}" for i in range(50)]
+
+    def work(uid):
+        for _ in range(20):
+            tracker.update_item(uid, "google_doc", uid, "u")
+            tracker.update_summary(uid, f"summary {uid}")
+            tracker.touch_content_fetch(uid)
+            tracker.tag_item(uid, "Topic: ML")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(work, ids * 2))
+    tracker.save()
+    tracker.close()
+
+    reopened = open_tracker(tmp_path, backend=backend)
+    for uid in ids:
+        item = reopened.get_item(uid)
+        assert item["discovery_count"] == 40
+        assert item["summary"] == f"summary {uid}"
+        assert item["tags"] == ["Topic: ML"]
+    if backend == "json":
+        assert len(json.loads((tmp_path / "tracker.json").read_text())["items"]) == 50
@@ -0,0 +1,95 @@
+import json
+
+from tracker import SqliteTracker, Tracker, open_tracker
+
+
+def test_sqlite_tracker_matches_json_api(tmp_path):
+    tracker = open_tracker(tmp_path, backend="sqlite")
+    is_new, item = tracker.update_item("jira:ML-1", "jira_issue", "First", "https://x/ML-1", {"key": "ML-1"})
+    assert is_new and item["discovery_count"] == 1
+    is_new, item = tracker.update_item("jira:ML-1", "jira_issue", "Renamed", "https://x/ML-1")
+    assert not is_new
+    assert item["title"] == "Renamed"
+    assert item["discovery_count"] == 2
+    assert not hasattr(item, "raw_metadata")
+    assert tracker.get_metadata("jira:ML-1") == {"key": "ML-1"}
+
+    tracker.tag_item("jira:ML-1", "Topic: ML")
+    tracker.tag_item("jira:ML-1", "Topic: ML")
+    tracker.update_summary("jira:ML-1", "summary")
+    tracker.touch_content_fetch("jira:ML-1")
+    tracker.set_mapping("team", "ML Platform", {"jira_project": "MLPLAT"})
+    assert tracker.items_by_tag("Topic: ML") == ["jira:ML-1"]
+    assert tracker.items_seen_since(item["first_seen"]) == ["jira:ML-1"]
+    assert not tracker.should_refresh_content("jira:ML-1")
+    tracker.save()
+    tracker.close()
+
+    reopened = SqliteTracker(tmp_path)
+    item = reopened.get_item("jira:ML-1")
+    assert item["summary"] == "summary"
+    assert item["tags"] == ["Topic: ML"]
+    assert reopened.get_mapping("team", "ML Platform") == {"jira_project": "MLPLAT"}
+    assert reopened.data["last_run"] is not None
+
+
+def test_sqlite_tracker_imports_existing_json(tmp_path):
+    (tmp_path / "tracker.json").write_text(json.dumps({
+        "items": {"google:1": {"type": "google_doc", "title": "Doc", "url": "u", "discovery_count": 3,
+                               "last_seen": "2026-01-01T00:00:00+00:00", "raw_metadata": {"id": "1"}}},
+        "mappings": {"cloud:jira": {"id": "abc"}},
+        "last_run": "2026-01-02T00:00:00+00:00",
+    }))
+    tracker = SqliteTracker(tmp_path)
+    assert tracker.get_item("google:1")["discovery_count"] == 3
+    assert tracker.get_mapping("cloud", "jira") == {"id": "abc"}
+    assert tracker.data["last_run"] == "2026-01-02T00:00:00+00:00"
+    tracker.update_item("google:1", "google_doc", "Doc", "u")
+    tracker.close()
+    # Import runs once; later opens keep the database state
+    assert SqliteTracker(tmp_path).get_item("google:1")["discovery_count"] == 4
+
+
+def test_metadata_is_kept_out_of_the_hot_projection(tmp_path):
+    legacy = {"items": {"google:1": {"type": "google_doc", "title": "Doc", "url": "u", "discovery_count": 1,
+                                     "last_seen": "2026-01-01T00:00:00+00:00", "raw_metadata": {"id": "1"}}},
+              "mappings": {}, "last_run": None}
+    (tmp_path / "tracker.json").write_text(json.dumps(legacy))
+
+    tracker = Tracker(tmp_path)
+    tracker.save()
+    assert "raw_metadata" not in json.loads((tmp_path / "tracker.json").read_text())["items"]["google:1"]
+
+    reopened = Tracker(tmp_path)
+    summary = reopened.get_summary("google:1")
+    assert summary["title"] == "Doc" and summary.get("summary", "") == ""
+    assert not hasattr(summary, "raw_metadata")
+    assert reopened._metadata is None  # not loaded yet
+    assert reopened.get_metadata("google:1") == {"id": "1"}
+    assert reopened.get_item("google:1")["raw_metadata"] == {"id": "1"}
+
+    sqlite = SqliteTracker(tmp_path / "db")
+    sqlite.update_item("jira:1", "jira_issue", "Issue", "u", {"key": "ML-1"})
+    sqlite.tag_item("jira:1", "Team: ML")
+    summary = sqlite.get_summary("jira:1")
+    assert summary.title == "Issue" and summary.tags == ["Team: ML"]
+    assert sqlite.get_metadata("jira:1") == {"key": "ML-1"}
+    sqlite.close()
+
+
+def test_sweep_updates_dont_load_metadata_store(tmp_path):
+    tracker = Tracker(tmp_path)
+    tracker.update_item("google:old", "google_doc", "Old", "u", {"id": "old"})
+    tracker.save()
+
+    tracker = Tracker(tmp_path)
+    for i in range(50):
+        is_new, item = tracker.update_item(f"google:{i}", "google_doc", f"Doc {i}", "u", {"id": str(i)})
+        tracker.tag_item(f"google:{i}", "Topic: ML")
+        assert is_new and item["title"] == f"Doc {i}"
+    assert tracker.get_metadata("google:7") == {"id": "7"}
+    assert tracker._metadata is None
+
+    tracker.save()
+    stored = json.loads((tmp_path / "tracker_metadata.json").read_text())
+    assert stored["google:old"] == {"id": "old"} and stored["google:49"] == {"id": "49"}